@@ -0,0 +1,76 @@
+"""Compare sequential, threaded and multi-process signing of limit-order batches.
+
+Usage::
+
+    python benchmarks/batch_signing.py [--workers 4] [--repeat 5]
+"""
+
+import argparse
+import os
+import timeit
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from tplus.model.asset_identifier import AssetIdentifier
+from tplus.utils.limit_order import create_limit_order_batch_payload
+from tplus.utils.user import User
+
+BATCH_SIZES = (10, 100, 1_000)
+
+
+def _orders(count: int) -> list[dict]:
+    asset = AssetIdentifier("200")
+    return [
+        {
+            "quantity": 1_000 + idx,
+            "price": 101_250 + idx,
+            "side": "Buy" if idx % 2 else "Sell",
+            "book_quantity_decimals": 3,
+            "book_price_decimals": 3,
+            "asset_identifier": asset,
+            "order_id": f"order-{idx}",
+        }
+        for idx in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--repeat", type=int, default=5, help="Best-of runs per measurement.")
+    args = parser.parse_args()
+
+    signer = User()
+    threads = ThreadPoolExecutor(args.workers)
+    processes = ProcessPoolExecutor(args.workers)
+    # Warm the workers (imports and key cache) before timing.
+    create_limit_order_batch_payload(
+        _orders(args.workers), signer, executor=processes, chunk_size=1
+    )
+
+    print(f"Batch build + sign time in ms (best of {args.repeat}, {args.workers} workers)")
+    print(f"{'orders':>6} {'sequential':>11} {'threads':>9} {'processes':>10}")
+    for size in BATCH_SIZES:
+        orders = _orders(size)
+        chunk_size = max(1, size // args.workers)
+        timings = []
+        for executor in (None, threads, processes):
+            timer = timeit.Timer(
+                partial(
+                    create_limit_order_batch_payload,
+                    orders,
+                    signer,
+                    executor=executor,
+                    chunk_size=chunk_size,
+                )
+            )
+            timings.append(min(timer.repeat(repeat=args.repeat, number=1)) * 1e3)
+
+        print(f"{size:>6} {timings[0]:>11.2f} {timings[1]:>9.2f} {timings[2]:>10.2f}")
+
+    threads.shutdown()
+    processes.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Compare the validating stream parsers against the trusted ``construct_*`` fast path.
+
+Usage::
+
+    python benchmarks/stream_parsers.py [--number 20000]
+"""
+
+import argparse
+import json
+import timeit
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from tplus.model.klines import construct_kline_update, parse_kline_update
+from tplus.model.order import construct_order_event, parse_order_event
+from tplus.model.orderbook import OrderBookDiff, construct_orderbook_diff
+from tplus.model.trades import construct_trade_event, parse_trade_event
+
+ASSET = "0000000000000000000000000000000000000000000000000000000000000001@000000000000000001"
+
+FRAMES = {
+    "OrderEvent": json.dumps(
+        {
+            "Replaced": {
+                "order_id": "5hQ2u6vRQ1e8w0d9X3b7Zw==",
+                "asset_id": ASSET,
+                "user_id": "ab" * 32,
+                "new_quantity": 1_000,
+                "new_price": 101_250,
+            }
+        }
+    ),
+    "TradeEvent": json.dumps(
+        {
+            "Confirmed": {
+                "asset_id": ASSET,
+                "trade_id": 42,
+                "order_id": "5hQ2u6vRQ1e8w0d9X3b7Zw==",
+                "price": "101.25",
+                "quantity": "0.5",
+                "timestamp_ns": 1_700_000_000_000_000_000,
+                "buyer_is_maker": False,
+                "status": "Confirmed",
+            }
+        }
+    ),
+    "KlineUpdate": json.dumps(
+        [
+            {
+                "open": "100.5",
+                "high": "101.25",
+                "low": "99.75",
+                "close": "101",
+                "volume": "1234.5",
+                "open_timestamp_ns": 1_700_000_000_000_000_000,
+                "close_timestamp_ns": 1_700_000_060_000_000_000,
+            }
+        ]
+    ),
+    "OrderBookDiff": json.dumps(
+        {
+            "bids": [[100.0 - i * 0.25, 1.0 + i] for i in range(20)],
+            "asks": [[100.25 + i * 0.25, 1.0 + i] for i in range(20)],
+            "sequence_number": 1_000,
+        }
+    ),
+}
+
+Parser = Callable[[Any], Any]
+
+PARSERS: dict[str, tuple[Parser, Parser]] = {
+    "OrderEvent": (parse_order_event, construct_order_event),
+    "TradeEvent": (parse_trade_event, construct_trade_event),
+    "KlineUpdate": (parse_kline_update, construct_kline_update),
+    "OrderBookDiff": (lambda d: OrderBookDiff(**d), construct_orderbook_diff),
+}
+
+
+def _per_frame_us(fn, number: int) -> float:
+    return timeit.timeit(fn, number=number) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20_000, help="Frames per measurement.")
+    args = parser.parse_args()
+
+    print("Per-frame cost in µs (parse only | json.loads + parse)")
+    print(f"{'message':<14} {'validated':>19} {'trusted':>19} {'speedup':>8}")
+    for name, raw in FRAMES.items():
+        validated, trusted = PARSERS[name]
+        data = json.loads(raw)
+        parse_slow = _per_frame_us(partial(validated, data), args.number)
+        parse_fast = _per_frame_us(partial(trusted, data), args.number)
+        full_slow = _per_frame_us(lambda p=validated, r=raw: p(json.loads(r)), args.number)
+        full_fast = _per_frame_us(lambda p=trusted, r=raw: p(json.loads(r)), args.number)
+        print(
+            f"{name:<14} {parse_slow:>8.2f} | {full_slow:>8.2f} {parse_fast:>8.2f} | "
+            f"{full_fast:>8.2f} {parse_slow / parse_fast:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
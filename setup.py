@@ -41,6 +41,19 @@ setup(
             "anyio>=4",
             "pytest-anyio>=0.0.0",
             "trio>=0.24",
+            "numpy>=1.24",
+            "pandas>=2",
+        ],
+        "numpy": [
+            "numpy>=1.24",
+        ],
+        "history": [
+            "numpy>=1.24",
+            "pandas>=2",
+        ],
+        "fast": [
+            "orjson>=3.9",
+            "h2>=4",
         ],
         "lint": [
             "ruff>=0.11.7",
@@ -29,12 +29,15 @@ BOOTSTRAP_SCRIPT = Path(__file__).resolve().parents[3] / "scripts" / "dev-bootst
 def user_dir(tmp_path, monkeypatch):
     data = tmp_path / "users"
 
-    def _init(self):
+    def _init(self, *, use_agent=False):
         self._data_folder = data
         self._default_user = None
+        # Never talk to a session agent the developer may have running.
+        self._use_agent = False
 
     monkeypatch.setattr(UserManager, "__init__", _init)
     monkeypatch.setenv("TPLUS_PASSWORD", PASSWORD)
+    monkeypatch.setenv("TPLUS_AGENT_SOCK", str(tmp_path / "no-agent.sock"))
     return data
 
 
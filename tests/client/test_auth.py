@@ -10,7 +10,8 @@ from tplus.client.auth import Auth, AuthenticatedClient
 from tplus.client.base import BaseClient, ClientSettings
 from tplus.exceptions import MissingClientUserError
 from tplus.model.types import UserPublicKey
-from tplus.utils.user import User
+from tplus.utils.user import User, token_cache
+from tplus.utils.user.manager import PASSWORD_ENV_VAR
 
 
 class FakeAuthBackend:
@@ -84,6 +85,7 @@ def mock_client(
     on_request: Callable[[httpx.Request], httpx.Response] | None = None,
     *,
     default_user: User | None = None,
+    auth: Auth | None = None,
 ) -> AuthenticatedClient:
     transport = httpx.MockTransport(make_handler(backend, on_request))
     httpx_client = httpx.AsyncClient(base_url="http://test", transport=transport)
@@ -91,6 +93,7 @@ def mock_client(
         base_url="http://test",
         default_user=default_user,
         client=httpx_client,
+        auth=auth,
     )
 
 
@@ -150,6 +153,18 @@ class TestBaseClient:
         child = BaseClient.from_client(parent)
         assert child._client is parent._client
 
+    @pytest.mark.anyio
+    async def test_shared_transport_outlives_clients(self):
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+        first = self._make_client(base_url="http://oms", transport=transport)
+        second = self._make_client(base_url="http://mds", transport=transport)
+        assert first._client._transport is second._client._transport is transport
+
+        await first.close()
+        assert await second._get("/ping", requires_auth=False) == {}
+        await second.close()
+        assert not first._client.is_closed
+
     def test_validate_user_with_no_default_raises(self):
         client = self._make_client()
         with pytest.raises(MissingClientUserError):
@@ -648,6 +663,67 @@ class TestAuthenticatedClient:
         await client.close()
 
 
+class TestTokenRefresh:
+    @pytest.fixture
+    def cache_password(self, monkeypatch):
+        monkeypatch.setenv(PASSWORD_ENV_VAR, "cache-password")
+
+    @pytest.mark.anyio
+    async def test_renews_after_fraction_of_lifetime(self):
+        backend = FakeAuthBackend(token=lambda i: f"tok-{i}")
+        client = mock_client(backend, default_user=User())
+        await client._ensure_auth()
+
+        await client._renew_auth(fraction=0.8)
+        assert backend.auth_calls == 1
+
+        # Pretend 90% of the token's lifetime has passed. The rest still exceeds
+        # the safety margin, so only the fraction can trigger the renewal.
+        lifetime = client._auth.expiry_ns - client._auth.issued_ns
+        now = time.time_ns()
+        client._auth.issued_ns = now - int(0.9 * lifetime)
+        client._auth.expiry_ns = now + int(0.1 * lifetime)
+        assert not client._auth.is_expired()
+        await client._renew_auth(fraction=0.8)
+        assert backend.auth_calls == 2
+        assert client._auth.token == "tok-2"
+
+        await client.close()
+
+    @pytest.mark.anyio
+    async def test_processes_share_cached_token(self, tmp_path, cache_password):
+        backend = FakeAuthBackend(token=lambda i: f"tok-{i}")
+        user = User()
+        # Separate clients with separate Auth objects stand in for separate processes.
+        first = mock_client(backend, default_user=user, auth=Auth(cache_dir=tmp_path))
+        second = mock_client(backend, default_user=user, auth=Auth(cache_dir=tmp_path))
+
+        await first._ensure_auth()
+        await second._ensure_auth()
+        assert backend.auth_calls == 1
+        assert second._auth.token == "tok-1"
+
+        # One process refreshes; the other adopts the new token instead of a handshake.
+        await first._renew_auth(stale_token="tok-1")
+        await second._renew_auth(stale_token="tok-1")
+        assert backend.auth_calls == 2
+        assert second._auth.token == "tok-2"
+
+        await first.close()
+        await second.close()
+
+    def test_file_lock_is_exclusive(self, tmp_path):
+        path = token_cache.lock_path(tmp_path / "token.json")
+        holder = token_cache.FileLock(path)
+        other = token_cache.FileLock(path)
+
+        assert holder.try_acquire()
+        assert not other.try_acquire()
+        holder.release()
+        assert other.try_acquire()
+        other.release()
+
+
 class TestClientSettings:
     def test_defaults(self):
         settings = ClientSettings()
@@ -675,3 +751,12 @@ class TestClientSettings:
         settings = ClientSettings.from_url("http://example.com", insecure_ssl=True)
         assert settings.base_url == "http://example.com"
         assert settings.insecure_ssl is True
+
+    def test_pool_limits(self):
+        settings = ClientSettings(max_connections=500, keepalive_expiry=30.0)
+        assert settings.limits == httpx.Limits(
+            max_connections=500, max_keepalive_connections=20, keepalive_expiry=30.0
+        )
+
+        client = BaseClient.from_settings(settings)
+        assert client._settings.limits == settings.limits
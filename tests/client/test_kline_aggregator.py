@@ -0,0 +1,87 @@
+from decimal import Decimal
+
+import pytest
+
+from tplus.client.kline_aggregator import Bar, BarSeries, KlineAggregator, parse_timeframe
+from tplus.model.asset_identifier import AssetIdentifier
+from tplus.model.klines import KlineUpdate
+from tplus.model.trades import Trade
+
+SECOND = 1_000_000_000
+MINUTE = 60 * SECOND
+ASSET = AssetIdentifier("200")
+
+
+def _trade(seconds: float, price: int, quantity: int = 1) -> Trade:
+    return Trade(
+        asset_id=ASSET,
+        trade_id=0,
+        price=Decimal(price),
+        quantity=Decimal(quantity),
+        timestamp_ns=int(seconds * SECOND),
+        buyer_is_maker=False,
+    )
+
+
+def _kline(minute: int, close: int, volume: int) -> KlineUpdate:
+    return KlineUpdate(
+        open=Decimal(10),
+        high=Decimal(max(10, close)),
+        low=Decimal(min(10, close)),
+        close=Decimal(close),
+        volume=Decimal(volume),
+        open_timestamp_ns=minute * MINUTE,
+        close_timestamp_ns=(minute + 1) * MINUTE,
+    )
+
+
+def test_parse_timeframe():
+    assert parse_timeframe("5m") == 5 * MINUTE
+    with pytest.raises(ValueError):
+        parse_timeframe("5x")
+
+
+def test_bar_series_ring_buffer():
+    series = BarSeries(MINUTE, capacity=2)
+    for minute, price in enumerate((10, 11, 12)):
+        series.update(minute * MINUTE, price, price, price, price, 1)
+
+    assert [bar.open for bar in series] == [11, 12]
+    assert series[-1] == Bar(2 * MINUTE, 12, 12, 12, 12, 1)
+
+    series.update(0, 9, 9, 9, 9, 1)
+    assert series.late == 1
+    assert series.column("close") == [11, 12]
+
+
+def test_aggregate_trades():
+    bars = KlineAggregator(["1m", "5m"])
+    for seconds, price in ((1, 10), (30, 14), (59, 12), (61, 8), (301, 9)):
+        bars.add_trade(_trade(seconds, price))
+
+    assert list(bars.series(ASSET, "1m")) == [
+        Bar(0, 10, 14, 10, 12, 3),
+        Bar(MINUTE, 8, 8, 8, 8, 1),
+        Bar(5 * MINUTE, 9, 9, 9, 9, 1),
+    ]
+    assert bars.series(ASSET, "5m")[0] == Bar(0, 10, 14, 8, 8, 4)
+
+
+def test_aggregate_klines_replaces_repeated_updates():
+    bars = KlineAggregator(["1s", "5m"])
+    bars.add_kline(ASSET, [_kline(0, 11, 2), _kline(0, 12, 5)])
+    bars.add_kline(ASSET, _kline(1, 9, 3))
+
+    assert list(bars.series(ASSET, "5m")) == [Bar(0, 10, 12, 9, 9, 8)]
+    # Server bars cannot build timeframes finer than themselves.
+    assert len(bars.series(ASSET, "1s")) == 0
+
+
+def test_aggregate_klines_replaces_late_updates_of_recent_bars():
+    bars = KlineAggregator(["5m"])
+    bars.add_kline(ASSET, _kline(0, 11, 2))
+    bars.add_kline(ASSET, _kline(1, 9, 3))
+    # The first bar is corrected after the second one opened.
+    bars.add_kline(ASSET, _kline(0, 12, 5))
+
+    assert bars.series(ASSET, "5m")[0].volume == 8
@@ -0,0 +1,76 @@
+from decimal import Decimal
+
+import pytest
+
+from tplus.client.kline_history import KlineHistory
+from tplus.client.market_data import MarketDataClient
+from tplus.model.klines import KlinesPage, KlineUpdate
+
+np = pytest.importorskip("numpy")
+
+MINUTE = 60_000_000_000
+
+
+def _kline(idx: int) -> KlineUpdate:
+    price = Decimal(100 + idx)
+    return KlineUpdate(
+        open=price,
+        high=price,
+        low=price,
+        close=price,
+        volume=Decimal(idx),
+        open_timestamp_ns=idx * MINUTE,
+        close_timestamp_ns=(idx + 1) * MINUTE,
+    )
+
+
+class FakeMarketData(MarketDataClient):
+    def __init__(self, candles: int):
+        super().__init__("http://md.test")
+        self.candles = candles
+        self.requests: list[tuple[int | None, int | None]] = []
+
+    async def get_klines(self, asset_id, page=None, limit=None, end_timestamp_ns=None):
+        self.requests.append((page, end_timestamp_ns))
+        newest = self.candles - 1
+        if end_timestamp_ns:
+            newest = min(newest, end_timestamp_ns // MINUTE)
+        ordered = list(range(newest, -1, -1))
+        chunks = [ordered[i : i + limit] for i in range(0, len(ordered), limit)]
+        page = page or 0
+        items = chunks[page] if page < len(chunks) else []
+        return KlinesPage(
+            items=[_kline(idx) for idx in items],
+            page=page,
+            limit=limit,
+            total_pages=len(chunks),
+            cursor_size=len(items),
+            has_next_page=page + 1 < len(chunks),
+        )
+
+
+@pytest.mark.anyio
+async def test_sync_downloads_only_missing_klines(tmp_path, anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("paginate schedules asyncio tasks")
+
+    client = FakeMarketData(candles=25)
+    history = KlineHistory(client, tmp_path, page_size=10, concurrency=2)
+
+    first = await history.sync("200", start_ns=5 * MINUTE)
+    assert first["open_timestamp_ns"].tolist() == [idx * MINUTE for idx in range(5, 25)]
+
+    client.candles = 30
+    client.requests.clear()
+    second = await history.sync("200")
+
+    assert second["open_timestamp_ns"].tolist() == [idx * MINUTE for idx in range(30)]
+    assert second["close"][-1] == 129.0
+    # One page for the new candles, one for the backfill below the oldest stored.
+    assert client.requests == [(0, None), (0, 5 * MINUTE)]
+    np.testing.assert_array_equal(history.load("200"), second)
+
+    client.requests.clear()
+    recent = await history.sync("200", start_ns=20 * MINUTE)
+    assert recent["open_timestamp_ns"].tolist() == [idx * MINUTE for idx in range(20, 30)]
+    assert len(history.load("200")) == 30
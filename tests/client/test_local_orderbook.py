@@ -0,0 +1,182 @@
+import asyncio
+
+import pytest
+
+from tplus.client import MarketDataClient
+from tplus.client.market_data import LocalOrderBook
+from tplus.model.asset_identifier import AssetIdentifier
+from tplus.model.orderbook import OrderBook, OrderBookDiff, merge_orderbook_diffs
+from tplus.model.stream import StreamResynced
+
+ASSET = AssetIdentifier("200")
+
+
+def _snapshot(seq: int = 10) -> OrderBook:
+    return OrderBook(
+        bids=[[99.0, 1.0], [98.0, 2.0], [97.0, 3.0]],
+        asks=[[101.0, 1.0], [102.0, 2.0]],
+        sequence_number=seq,
+    )
+
+
+def _diff(seq: int, bids=(), asks=()) -> OrderBookDiff:
+    return OrderBookDiff(bids=list(bids), asks=list(asks), sequence_number=seq)
+
+
+def test_snapshot_then_diffs():
+    book = LocalOrderBook(ASSET)
+    book.apply_snapshot(_snapshot())
+    assert book.best_bid == (99.0, 1.0)
+    assert book.best_ask == (101.0, 1.0)
+    assert book.spread == 2.0
+
+    assert book.apply_diff(_diff(11, bids=[[99.5, 4.0], [98.0, 0.0]], asks=[[101.0, 0.0]]))
+    assert book.best_bid == (99.5, 4.0)
+    assert book.best_ask == (102.0, 2.0)
+    assert book.bids() == [[99.5, 4.0], [99.0, 1.0], [97.0, 3.0]]
+    assert book.bids(depth=2) == [[99.5, 4.0], [99.0, 1.0]]
+    assert book.asks(depth=5) == [[102.0, 2.0]]
+    assert book.sequence_number == 11
+
+
+def test_stale_diff_ignored_and_gap_detected():
+    book = LocalOrderBook(ASSET)
+    assert not book.apply_diff(_diff(1))
+
+    book.apply_snapshot(_snapshot(seq=10))
+    assert book.apply_diff(_diff(9, bids=[[50.0, 1.0]]))
+    assert book.best_bid == (99.0, 1.0)
+
+    assert not book.apply_diff(_diff(12, bids=[[100.0, 1.0]]))
+    assert not book.synced
+    assert book.best_bid == (99.0, 1.0)
+
+
+def test_removed_and_readded_levels():
+    book = LocalOrderBook(ASSET)
+    book.apply_snapshot(_snapshot(seq=10))
+    # Remove the best bid, re-add it, then remove the new best ask twice over.
+    assert book.apply_diff(_diff(11, bids=[[99.0, 0.0]], asks=[[101.0, 0.0]]))
+    assert book.best_bid == (98.0, 2.0)
+    assert book.apply_diff(_diff(12, bids=[[99.0, 5.0]], asks=[[102.0, 0.0], [101.0, 3.0]]))
+    assert book.best_bid == (99.0, 5.0)
+    assert book.best_ask == (101.0, 3.0)
+    assert book.bids() == [[99.0, 5.0], [98.0, 2.0], [97.0, 3.0]]
+    assert book.asks() == [[101.0, 3.0]]
+
+
+def test_merged_diffs_apply_without_gap():
+    merged = merge_orderbook_diffs(
+        merge_orderbook_diffs(_diff(11, bids=[[99.5, 1.0]]), _diff(12, bids=[[99.5, 0.0]])),
+        _diff(13, asks=[[100.5, 2.0]]),
+    )
+    assert merged.first_sequence_number == 11
+    assert merged.sequence_number == 13
+
+    book = LocalOrderBook(ASSET)
+    book.apply_snapshot(_snapshot(seq=10))
+    assert book.apply_diff(merged)
+    assert book.best_bid == (99.0, 1.0)
+    assert book.best_ask == (100.5, 2.0)
+
+    book.apply_snapshot(_snapshot(seq=9))
+    assert not book.apply_diff(merged)
+
+
+def test_to_orderbook_round_trip():
+    book = LocalOrderBook(ASSET)
+    book.apply_snapshot(_snapshot())
+    assert book.to_orderbook() == _snapshot()
+
+
+@pytest.mark.anyio
+async def test_stream_orderbook_resyncs_on_gap(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("stream_orderbook fetches snapshots in asyncio tasks")
+
+    diffs = [
+        _diff(11, bids=[[99.5, 1.0]]),
+        _diff(12, asks=[[100.5, 1.0]]),
+        _diff(20, bids=[[99.9, 1.0]]),  # gap -> resync
+        _diff(21, bids=[[99.95, 1.0]]),
+    ]
+    snapshots = [_snapshot(seq=10), _snapshot(seq=20)]
+
+    class DummyClient(MarketDataClient):
+        async def stream_depth(self, asset_id):
+            for diff in diffs:
+                yield diff
+
+        async def get_orderbook_snapshot(self, asset_id):
+            return snapshots.pop(0)
+
+    client = DummyClient()
+    seen = []
+    async for book in client.stream_orderbook(ASSET):
+        seen.append((book.sequence_number, book.best_bid))
+
+    assert seen == [
+        (11, (99.5, 1.0)),
+        (12, (99.5, 1.0)),
+        (20, (99.0, 1.0)),
+        (21, (99.95, 1.0)),
+    ]
+    assert not snapshots
+
+
+@pytest.mark.anyio
+async def test_stream_orderbook_reseeds_after_reconnect(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("stream_orderbook fetches snapshots in asyncio tasks")
+
+    diffs = [
+        _diff(11, bids=[[99.5, 1.0]]),
+        StreamResynced(path="/marketdepth/diff/200", attempts=1),
+        _diff(31, bids=[[99.9, 1.0]]),
+    ]
+    snapshots = [_snapshot(seq=10), _snapshot(seq=30)]
+
+    class DummyClient(MarketDataClient):
+        async def stream_depth(self, asset_id):
+            for diff in diffs:
+                yield diff
+
+        async def get_orderbook_snapshot(self, asset_id):
+            return snapshots.pop(0)
+
+    client = DummyClient()
+    seen = []
+    async for book in client.stream_orderbook(ASSET):
+        seen.append((book.sequence_number, book.best_bid))
+
+    assert seen == [(11, (99.5, 1.0)), (31, (99.9, 1.0))]
+    assert not snapshots
+
+
+@pytest.mark.anyio
+async def test_stream_orderbook_fetches_one_snapshot_per_resync(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("stream_orderbook fetches snapshots in asyncio tasks")
+
+    fetched = asyncio.Event()
+    snapshot_calls = 0
+
+    class DummyClient(MarketDataClient):
+        async def stream_depth(self, asset_id):
+            yield _diff(11, bids=[[99.5, 1.0]])
+            yield _diff(12, asks=[[100.5, 1.0]])
+            yield _diff(13, bids=[[99.6, 1.0]])
+            fetched.set()
+            yield _diff(14, bids=[[99.7, 1.0]])
+
+        async def get_orderbook_snapshot(self, asset_id):
+            nonlocal snapshot_calls
+            snapshot_calls += 1
+            await fetched.wait()
+            return _snapshot(seq=10)
+
+    client = DummyClient()
+    seen = [book.sequence_number async for book in client.stream_orderbook(ASSET)]
+
+    assert snapshot_calls == 1
+    assert seen[-1] == 14
@@ -0,0 +1,85 @@
+from decimal import Decimal
+
+import pytest
+
+from tplus.client.margin_estimator import MarginEstimator
+from tplus.model.asset_identifier import AssetIdentifier
+from tplus.model.user_margin import parse_user_margin_info
+from tplus.model.user_simulated_margin import parse_user_simulated_margin
+
+ASSET = "200"
+# The margin endpoints name assets by variant.
+SERVER_ASSET = f"Index:{ASSET}"
+
+
+@pytest.fixture
+def estimator() -> MarginEstimator:
+    account = {
+        "account_equity": "1000",
+        "available_margin": "980",
+        "utilized_margin": "20",
+        "maintenance_margin_surplus": "990",
+        "account_leverage": "0.2",
+        "is_solvent": True,
+        "is_liquidatable": False,
+        "positions": [
+            {"asset_id": SERVER_ASSET, "side": "Long", "size": "2", "notional_value": "200"},
+        ],
+    }
+    return MarginEstimator(parse_user_margin_info({"accounts": {"1": account}}))
+
+
+def test_estimate_from_account_rates(estimator):
+    estimate = estimator.estimate(1, ASSET, is_buy=True, size=Decimal(3), price=Decimal(100))
+    assert estimate.position_size == 5
+    assert estimate.margin_impact == 30
+    assert estimate.available_margin == 950
+    assert estimate.mm_surplus == 975
+    assert estimate.is_solvent
+    assert not estimate.needs_simulation
+
+    closing = estimator.estimate(1, ASSET, is_buy=False, size=Decimal(2), price=Decimal(100))
+    assert closing.position_size == 0
+    assert closing.available_margin == 1000
+
+
+def test_estimate_near_threshold_needs_simulation(estimator):
+    estimate = estimator.estimate(1, ASSET, is_buy=True, size=Decimal(100), price=Decimal(110))
+    assert estimate.account_equity == 0
+    assert not estimate.is_solvent
+    assert estimate.needs_simulation
+
+    with pytest.raises(KeyError):
+        estimator.estimate(2, ASSET, is_buy=True, size=Decimal(1), price=Decimal(100))
+
+
+def test_observe_simulation_rates(estimator):
+    simulated = parse_user_simulated_margin(
+        {
+            "account_equity": "1000",
+            "available_margin": "950",
+            "mm_surplus": "975",
+            "utilized_margin": "50",
+            "margin_required": "50",
+            "margin_impact": "30",
+            "is_solvent": True,
+            "trade_accepted": True,
+            "positions": [
+                {
+                    "asset_id": SERVER_ASSET,
+                    "side": "Long",
+                    "size": "5",
+                    "notional_value": "250",
+                    "margin": "50",
+                }
+            ],
+        }
+    )
+    estimator.observe(simulated)
+
+    assert estimator.im_rate(ASSET) == Decimal("0.2")
+    assert estimator.im_rate(AssetIdentifier(ASSET)) == Decimal("0.2")
+    estimate = estimator.estimate(
+        1, AssetIdentifier(ASSET), is_buy=True, size=Decimal(1), price=Decimal(100)
+    )
+    assert estimate.margin_impact == 20
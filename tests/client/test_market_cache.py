@@ -0,0 +1,125 @@
+from typing import Any
+
+import pytest
+
+from tplus.client.market_cache import MarketCache
+from tplus.client.orderbook import OrderBookClient
+from tplus.model.asset_identifier import AssetIdentifier
+from tplus.model.market import Market
+
+
+def _market(asset_id: str) -> dict[str, Any]:
+    return {"asset_id": asset_id, "book_price_decimals": 3, "book_quantity_decimals": 4}
+
+
+def _client(cache: MarketCache) -> tuple[OrderBookClient, list[str]]:
+    requested: list[str] = []
+
+    class DummyClient(OrderBookClient):
+        async def _request(self, method, endpoint, json_data=None, params=None, **kwargs):
+            requested.append(endpoint)
+            if endpoint == "/markets":
+                return [_market("1"), _market("2")]
+            return _market(endpoint.rsplit("/", 1)[-1])
+
+    return DummyClient("http://example.com", market_cache=cache), requested
+
+
+def test_market_cache_ttl_and_invalidation():
+    cache = MarketCache(ttl=60)
+    invalidated: list[str | None] = []
+    unregister = cache.on_invalidate(invalidated.append)
+    market = Market(asset_id=AssetIdentifier("1"), book_price_decimals=3, book_quantity_decimals=4)
+
+    cache.set(market, fetched_at=0)
+    assert cache.get("1") is None
+
+    cache.set(market)
+    assert cache.get(AssetIdentifier("1")) == market
+
+    cache.invalidate("1")
+    unregister()
+    cache.invalidate()
+    assert cache.get("1") is None
+    assert invalidated == ["1"]
+
+
+@pytest.mark.anyio
+async def test_get_market_persists_across_clients(tmp_path):
+    client, requested = _client(MarketCache(cache_dir=tmp_path))
+    market = await client.get_market(AssetIdentifier("200"))
+    assert await client.get_market(AssetIdentifier("200")) == market
+    assert requested == ["/market/200"]
+
+    warm, requested = _client(MarketCache(cache_dir=tmp_path))
+    assert await warm.get_market(AssetIdentifier("200")) == market
+    assert requested == []
+
+
+@pytest.mark.anyio
+async def test_prefetch_markets(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("prefetch_markets fetches concurrently with asyncio.gather")
+
+    client, requested = _client(MarketCache())
+    await client.get_market(AssetIdentifier("1"))
+
+    markets = await client.prefetch_markets(["1", "2", "3"])
+    assert list(markets) == ["1", "2", "3"]
+    assert requested == ["/market/1", "/market/2", "/market/3"]
+
+    assert set(await client.prefetch_markets()) == {"1", "2"}
+    assert requested[-1] == "/markets"
+
+
+@pytest.mark.anyio
+async def test_get_market_caches_by_requested_asset():
+    requested: list[str] = []
+
+    class DummyClient(OrderBookClient):
+        async def _request(self, method, endpoint, json_data=None, params=None, **kwargs):
+            requested.append(endpoint)
+            # The server may describe the market with a different asset id form.
+            return _market("7")
+
+    client = DummyClient("http://example.com")
+    await client.get_market(AssetIdentifier("200"))
+    await client.get_market(AssetIdentifier("200"))
+    assert requested == ["/market/200"]
+
+
+@pytest.mark.anyio
+async def test_prefetched_markets_match_any_spelling_of_the_asset():
+    address = "62622e77d1349face943c6e7d5c01c61465fe1dc000000000000000000000000@00000000000000a4b1"
+    requested: list[str] = []
+
+    class DummyClient(OrderBookClient):
+        async def _request(self, method, endpoint, json_data=None, params=None, **kwargs):
+            requested.append(endpoint)
+            return [_market(address)]
+
+    client = DummyClient("http://example.com")
+    await client.prefetch_markets()
+
+    short = "62622E77D1349Face943C6e7D5c01C61465FE1dc@00000000000000a4b1"
+    assert list(await client.prefetch_markets([short])) == [short]
+    assert await client.get_market(AssetIdentifier(short)) is not None
+    assert requested == ["/markets"]
+
+
+def test_market_cache_save_is_debounced(tmp_path):
+    cache = MarketCache(cache_dir=tmp_path, save_interval=60)
+    market = Market(asset_id=AssetIdentifier("1"), book_price_decimals=3, book_quantity_decimals=4)
+    cache.set(market)
+    cache.save("http://example.com")
+    path = next(tmp_path.iterdir())
+    written = path.read_text()
+
+    cache.set(market, asset_id="2")
+    cache.save("http://example.com")
+    assert path.read_text() == written
+
+    cache.save("http://example.com", force=True)
+    warm = MarketCache(cache_dir=tmp_path)
+    warm.load("http://example.com")
+    assert warm.get("2") == market
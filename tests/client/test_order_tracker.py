@@ -0,0 +1,161 @@
+from decimal import Decimal
+
+import pytest
+
+from tplus.client.order_tracker import OrderTracker
+from tplus.client.orderbook import OrderBookClient
+from tplus.model.asset_identifier import AssetIdentifier
+from tplus.model.order import (
+    OrderCancelledEvent,
+    OrderCreatedEvent,
+    OrderReplacedEvent,
+    OrderResponse,
+    OrderUpdatedEvent,
+    Side,
+)
+from tplus.model.stream import StreamResynced
+from tplus.utils.limit_order import create_limit_order_ob_request_payload
+from tplus.utils.user import User
+
+ASSET = AssetIdentifier("200")
+
+
+def _response(order_id: str, side: str, quantity: int, filled: int = 0) -> OrderResponse:
+    zero = Decimal(0)
+    return OrderResponse(
+        order_id=order_id,
+        base_asset=ASSET,
+        side=Side(side),
+        limit_price=Decimal(500),
+        quantity=Decimal(quantity),
+        amount=None,
+        max_sellable_amount=None,
+        max_sellable_quantity=None,
+        confirmed_filled_quantity=Decimal(filled),
+        pending_filled_quantity=zero,
+        confirmed_filled_amount=zero,
+        pending_filled_amount=zero,
+        confirmed_trading_fees_amount=zero,
+        pending_trading_fees_amount=zero,
+        good_until_timestamp_ns=None,
+        timestamp_ns=1,
+        status="Open",
+        trigger_above_price=None,
+        trigger_below_price=None,
+        last_update_timestamp_ns=None,
+    )
+
+
+def _created(user: User, order_id: str, quantity: int) -> OrderCreatedEvent:
+    request = create_limit_order_ob_request_payload(
+        quantity, 510, "Sell", user, 3, 3, ASSET, order_id
+    )
+    return OrderCreatedEvent(
+        event_type="CREATED",
+        user_order=request.order,
+        signature=request.signature,
+        book_timestamp_ns=2,
+    )
+
+
+class FakeOrderBookClient:
+    def __init__(self, snapshots, events):
+        self.snapshots = list(snapshots)
+        self.events = events
+
+    async def get_open_orders_for_book(self, asset_id, *, user=None):
+        return self.snapshots.pop(0)
+
+    async def stream_orders(self, user=None):
+        for event in self.events:
+            yield event
+
+
+def test_apply_events():
+    tracker = OrderTracker(None)  # type: ignore[arg-type]
+    tracker.load([_response("b1", "Buy", 10, filled=4), _response("done", "Buy", 5, filled=5)])
+    assert tracker.remaining_quantity("b1") == 6
+    assert "done" not in tracker
+
+    tracker.apply(_created(User(), "s1", 8))
+    assert [order.order_id for order in tracker.orders(ASSET, "Sell")] == ["s1"]
+
+    tracker.apply(
+        OrderUpdatedEvent(
+            event_type="UPDATED",
+            order_id="s1",
+            status="PartiallyFilled",
+            filled_quantity=3,
+            remaining_quantity=5,
+            update_timestamp_ns=3,
+        )
+    )
+    tracker.apply(
+        OrderReplacedEvent(
+            event_type="REPLACED",
+            order_id="s1",
+            asset_id=ASSET,
+            user_id="u",
+            new_quantity=12,
+            new_price=520,
+        )
+    )
+    assert tracker.remaining_quantity("s1") == 9
+    assert (order := tracker.get("s1")) is not None
+    assert order.limit_price == 520
+
+    tracker.apply(
+        OrderCancelledEvent(
+            event_type="CANCELED", order_id="b1", asset_id=ASSET, user_id="u", timestamp_ns=4
+        )
+    )
+    assert tracker.remaining_quantity("b1") == 0
+    assert [order.order_id for order in tracker.orders()] == ["s1"]
+    assert list(tracker.orders(ASSET, "Buy")) == []
+
+
+@pytest.mark.anyio
+async def test_run_bootstraps_and_resyncs(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("OrderTracker uses asyncio primitives")
+
+    events = [
+        OrderUpdatedEvent(
+            event_type="UPDATED",
+            order_id="b1",
+            status="PartiallyFilled",
+            filled_quantity=7,
+            remaining_quantity=3,
+            update_timestamp_ns=3,
+        ),
+        StreamResynced(path="/orders", attempts=1),
+    ]
+    snapshots = [[_response("b1", "Buy", 10)], [_response("b2", "Buy", 1)]]
+    client = FakeOrderBookClient(snapshots, events)
+    tracker = OrderTracker(client)  # type: ignore[arg-type]
+
+    await tracker.run([ASSET])
+
+    assert tracker.ready.is_set()
+    assert [order.order_id for order in tracker.orders()] == ["b2"]
+
+
+@pytest.mark.anyio
+async def test_bootstrap_loads_the_tracked_users_orders(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("paginate schedules asyncio tasks")
+
+    requested: list[tuple[str, object]] = []
+
+    class DummyClient(OrderBookClient):
+        async def _request(self, method, endpoint, json_data=None, params=None, **kwargs):
+            requested.append((endpoint, kwargs.get("user")))
+            return []
+
+    other = User()
+    client = DummyClient("http://example.com", default_user=User())
+    tracker = OrderTracker(client, user=other)
+
+    await tracker.bootstrap([ASSET])
+
+    assert requested == [(f"/orders/user/{other.public_key}/{ASSET}", other)]
@@ -162,3 +162,123 @@ async def test_batch_create_over_control_ws(monkeypatch, anyio_backend):
     assert by_id["oid2"].reason == "InsufficientInventory"
 
     await client.close()
+
+
+@pytest.mark.anyio
+async def test_pipeline_keeps_window_in_flight(monkeypatch, anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("OrderBookClient control channel uses asyncio internals")
+    from typing import Any, cast
+
+    from tplus.client.orderbook import OrderBookClient
+
+    class DummyClient(OrderBookClient):
+        async def _ensure_control_ws(self) -> None:
+            if not self._control_ws:
+                self._control_ws = cast(Any, DummyWS())
+                self._control_ws_task = asyncio.create_task(self._control_ws_reader())
+
+    client = DummyClient("http://example.com")
+    client._use_ws_control = True
+    await client._ensure_control_ws()
+    ws = client._control_ws
+
+    def cancel(order_id: str) -> dict[str, Any]:
+        return {"CancelOrderRequest": {"cancel": {"order_id": order_id, "asset_id": "200"}}}
+
+    def respond(order_id: str) -> None:
+        ws.feed(  # type: ignore[union-attr]
+            {
+                "CancelOrderResponse": {
+                    "response": {"order_id": order_id, "status": "Received"},
+                    "asset_id": "200",
+                }
+            }
+        )
+
+    pipeline = client.pipeline(window=2, timeout=0.2)
+    first = await pipeline.submit(cancel("o1"), expected_order_id="o1")
+    second = await pipeline.submit(cancel("o2"), expected_order_id="o2")
+    third = asyncio.create_task(pipeline.submit(cancel("o3"), expected_order_id="o3"))
+    await asyncio.sleep(0.01)
+
+    # Window is full: the third request has not been sent yet.
+    assert len(ws.sent) == 2  # type: ignore[union-attr]
+    assert pipeline.in_flight == 2
+
+    respond("o2")
+    result = await second
+    assert result.ok
+    assert result.response is not None
+    assert result.response.order_id == "o2"
+    assert result.latency >= 0
+
+    respond("o1")
+    assert (await first).ok
+
+    # Never answered: resolves with a timeout error instead of raising.
+    third_result = await (await third)
+    assert len(ws.sent) == 3  # type: ignore[union-attr]
+    assert not third_result.ok
+    assert isinstance(third_result.error, TimeoutError)
+    assert pipeline.in_flight == 0
+    assert not client._pending_control
+
+    await client.close()
+
+
+@pytest.mark.anyio
+async def test_pipeline_rejects_duplicate_in_flight_order(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("OrderBookClient control channel uses asyncio internals")
+    from typing import Any, cast
+
+    from tplus.client.orderbook import OrderBookClient
+
+    class DummyClient(OrderBookClient):
+        async def _ensure_control_ws(self) -> None:
+            if not self._control_ws:
+                self._control_ws = cast(Any, DummyWS())
+                self._control_ws_task = asyncio.create_task(self._control_ws_reader())
+
+    client = DummyClient("http://example.com")
+    client._use_ws_control = True
+    await client._ensure_control_ws()
+    ws = cast(DummyWS, client._control_ws)
+    cancel = {"CancelOrderRequest": {"cancel": {"order_id": "o1", "asset_id": "200"}}}
+    answer = {
+        "CancelOrderResponse": {
+            "response": {"order_id": "o1", "status": "Received"},
+            "asset_id": "200",
+        }
+    }
+
+    pipeline = client.pipeline(timeout=1)
+    results = pipeline.results()
+    next_result = asyncio.ensure_future(results.__anext__())
+    first = await pipeline.submit(cancel, expected_order_id="o1")
+    with pytest.raises(RuntimeError, match="already in flight"):
+        await pipeline.submit(cancel, expected_order_id="o1")
+
+    assert pipeline.in_flight == 1
+    ws.feed(answer)
+    assert (await first).ok
+    assert (await next_result).order_id == "o1"
+
+    # Once the consumer stops, completions are no longer queued.
+    await results.aclose()
+    again = await pipeline.submit(cancel, expected_order_id="o1")
+    ws.feed(answer)
+    assert (await again).ok
+    assert pipeline._completed is None
+
+    await client.close()
+
+
+def test_control_timeout_comes_from_settings():
+    from tplus.client.base import ClientSettings
+    from tplus.client.orderbook import OrderBookClient
+
+    client = OrderBookClient.from_settings(ClientSettings(control_timeout=2.5))
+    assert client.pipeline()._timeout == 2.5
+    assert client.pipeline(timeout=1)._timeout == 1
@@ -0,0 +1,85 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+
+from tplus.client.paginate import paginate
+
+
+@dataclass
+class FetchState:
+    in_flight: int = 0
+    peak: int = 0
+    fetched: list[int] = field(default_factory=list)
+
+
+def _fetcher(
+    pages: list[list[int]], with_meta: bool
+) -> tuple[Callable[[int], Awaitable[Any]], FetchState]:
+    state = FetchState()
+
+    async def fetch(page: int) -> Any:
+        state.in_flight += 1
+        state.peak = max(state.peak, state.in_flight)
+        state.fetched.append(page)
+        # Later pages finish first, so results arrive out of order.
+        await asyncio.sleep(0.001 * (len(pages) - page))
+        state.in_flight -= 1
+        items = pages[page] if page < len(pages) else []
+        if not with_meta:
+            return items
+        return {
+            "items": items,
+            "total_pages": len(pages),
+            "has_next_page": page + 1 < len(pages),
+        }
+
+    return fetch, state
+
+
+def _items(page: list[int]) -> list[int]:
+    return page
+
+
+@pytest.mark.anyio
+async def test_paginate_with_page_metadata(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("paginate schedules asyncio tasks")
+
+    pages = [[idx * 10, idx * 10 + 1] for idx in range(7)]
+    fetch, state = _fetcher(pages, with_meta=True)
+
+    items = [item async for item in paginate(fetch, lambda p: p["items"], concurrency=3)]
+
+    assert items == [item for page in pages for item in page]
+    assert sorted(state.fetched) == list(range(7))
+    assert state.peak == 3
+
+
+@pytest.mark.anyio
+async def test_paginate_bare_pages_stop_at_short_page(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("paginate schedules asyncio tasks")
+
+    pages = [[1, 2], [3, 4], [5]]
+    fetch, state = _fetcher(pages, with_meta=False)
+
+    items = [item async for item in paginate(fetch, _items, concurrency=2, page_size=2)]
+
+    assert items == [1, 2, 3, 4, 5]
+    assert state.fetched[0] == 0
+
+
+@pytest.mark.anyio
+async def test_paginate_single_short_page_fetches_once(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("paginate schedules asyncio tasks")
+
+    fetch, state = _fetcher([[1]], with_meta=False)
+
+    items = [item async for item in paginate(fetch, _items, page_size=2, max_pages=50)]
+
+    assert items == [1]
+    assert state.fetched == [0]
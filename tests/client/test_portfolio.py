@@ -0,0 +1,185 @@
+import time
+from decimal import Decimal
+from typing import Literal
+
+import pytest
+
+from tplus.client.portfolio import Drift, Portfolio
+from tplus.model.asset_identifier import AssetIdentifier
+from tplus.model.position import PositionResponse
+from tplus.model.stream import StreamResynced
+from tplus.model.trades import UserTrade
+from tplus.model.user_event import (
+    DepositLanded,
+    PositionCleared,
+    SubAccountAssetTransferred,
+    WithdrawalCompleted,
+)
+
+ASSET = AssetIdentifier("200")
+INVENTORY = {"accounts": {"0": {"spot": {"0": "0x64"}}, "1": {"spot": {}}}, "is_mm": False}
+
+
+def _position(side: Literal["long", "short", "closed"], size: int) -> PositionResponse:
+    zero = Decimal(0)
+    return PositionResponse(
+        asset_id=ASSET,
+        sub_account_index=1,
+        name="ETH",
+        side=side,
+        size=Decimal(size),
+        base_credits=zero,
+        base_liabilities=zero,
+        quote_credits=zero,
+        quote_liabilities=zero,
+    )
+
+
+def _fill(
+    quantity: int,
+    is_buyer: bool,
+    status: Literal["Pending", "Confirmed", "Rollbacked"] = "Confirmed",
+) -> UserTrade:
+    return UserTrade(
+        asset_id=ASSET,
+        trade_id=1,
+        order_id="o",
+        price=Decimal(100),
+        quantity=Decimal(quantity),
+        timestamp_ns=5,
+        is_maker=False,
+        is_buyer=is_buyer,
+        status=status,
+        sub_account=1,
+    )
+
+
+def _deposit(amount: str, timestamp_ns: int, nonce: int = 1) -> DepositLanded:
+    return DepositLanded(
+        user="u",
+        asset="0",
+        amount=amount,
+        chain_id="1",
+        deposit_nonce=nonce,
+        timestamp_ns=timestamp_ns,
+    )
+
+
+class FakeOrderBookClient:
+    def __init__(self, snapshots, events=(), trades=()):
+        self.snapshots = list(snapshots)
+        self.events = events
+        self.trades = trades
+        self.logger = self
+
+    def warning(self, message):
+        pass
+
+    async def get_user_inventory(self, user=None):
+        return INVENTORY
+
+    async def iter_user_positions(self, user=None):
+        for position in self.snapshots.pop(0):
+            yield position
+
+    async def get_user_margin_info(self, user=None):
+        return None
+
+    async def stream_user_events(self, user=None):
+        for event in self.events:
+            yield event
+
+    async def stream_user_finalized_trades(self, user=None):
+        for trade in self.trades:
+            yield trade
+
+
+def test_apply_events():
+    portfolio = Portfolio(None)  # type: ignore[arg-type]
+    portfolio.load(INVENTORY, [_position("short", 3)])
+    assert portfolio.balance("0") == 100
+    assert portfolio.position(ASSET, 1) == -3
+
+    portfolio.apply(_deposit("50", timestamp_ns=5))
+    portfolio.apply(
+        WithdrawalCompleted(
+            user="u", asset="0", amount="30", chain_id="1", withdrawal_nonce=1, timestamp_ns=5
+        )
+    )
+    portfolio.apply(
+        SubAccountAssetTransferred(
+            user="u",
+            source_sub_account_index=0,
+            target_sub_account_index=1,
+            asset="0",
+            amount="0x14",
+            timestamp_ns=5,
+        )
+    )
+    assert portfolio.balances() == {(0, "0"): 100, (1, "0"): 20}
+
+    portfolio.apply(_fill(5, is_buyer=True))
+    portfolio.apply(_fill(9, is_buyer=True, status="Pending"))
+    assert list(portfolio.positions()) == [(1, "200", Decimal(2))]
+
+    portfolio.apply(PositionCleared(user="u", sub_account_index=1, asset="200", timestamp_ns=6))
+    assert portfolio.position(ASSET, 1) == 0
+
+
+@pytest.mark.anyio
+async def test_check_drift(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("Portfolio uses asyncio primitives")
+
+    client = FakeOrderBookClient([[_position("long", 4)]])
+    portfolio = Portfolio(client)  # type: ignore[arg-type]
+    portfolio.load(INVENTORY, [_position("long", 1)])
+
+    assert await portfolio.check_drift() == [Drift("position", 1, "200", Decimal(1), Decimal(4))]
+    assert portfolio.position(ASSET, 1) == 4
+
+
+@pytest.mark.anyio
+async def test_run_bootstraps_and_resyncs(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("Portfolio uses asyncio primitives")
+
+    events = [StreamResynced(path="/account/events/u", attempts=1)]
+    snapshots = [[_position("long", 1)], [_position("long", 7)]]
+    client = FakeOrderBookClient(snapshots, events)
+    portfolio = Portfolio(client, drift_interval=None)  # type: ignore[arg-type]
+
+    await portfolio.run()
+
+    assert portfolio.ready.is_set()
+    assert portfolio.position(ASSET, 1) == 7
+
+
+@pytest.mark.anyio
+async def test_events_received_before_the_snapshot_request_are_skipped(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("Portfolio uses asyncio primitives")
+
+    before = time.monotonic_ns()
+    portfolio = Portfolio(FakeOrderBookClient([[]]))  # type: ignore[arg-type]
+    await portfolio.bootstrap()
+
+    # Received before the snapshot was requested, so already in it.
+    portfolio.apply(_deposit("50", timestamp_ns=1), received_ns=before)
+    assert portfolio.balance("0") == 100
+
+    # Server timestamps play no part: an old-stamped event received later applies.
+    portfolio.apply(_deposit("50", timestamp_ns=1, nonce=2), received_ns=time.monotonic_ns())
+    assert portfolio.balance("0") == 150
+
+
+def test_repeated_events_are_applied_once():
+    portfolio = Portfolio(None)  # type: ignore[arg-type]
+    portfolio.load(INVENTORY, [])
+
+    for _ in range(2):
+        portfolio.apply(_deposit("50", timestamp_ns=5))
+        portfolio.apply(_fill(5, is_buyer=True))
+
+    assert portfolio.balance("0") == 150
+    assert portfolio.position(ASSET, 1) == 5
@@ -0,0 +1,137 @@
+import asyncio
+
+import httpx
+import pytest
+
+from tplus.client.base import BaseClient
+from tplus.client.retry import LatencyWindow, is_retryable_response, route_template
+from tplus.exceptions import ServerError
+
+
+def make_client(responses: list, **kwargs) -> tuple[BaseClient, list[httpx.Request]]:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        response = responses.pop(0)
+        if isinstance(response, type):
+            raise response("timed out", request=request)
+
+        return response
+
+    client = BaseClient(
+        "http://test", transport=httpx.MockTransport(handler), read_retry_backoff=0, **kwargs
+    )
+    return client, requests
+
+
+def error(code: str, status: int = 400, retryable: bool | None = None) -> httpx.Response:
+    body = {"code": code, "message": code.lower(), "retryable": retryable}
+    return httpx.Response(status, json={"error": body})
+
+
+def test_is_retryable_response():
+    assert is_retryable_response(httpx.Response(503))
+    assert is_retryable_response(error("TIMEOUT_UNKNOWN_STATE"))
+    assert is_retryable_response(error("RATE_LIMITED", 429, retryable=True))
+    assert not is_retryable_response(error("INVALID_ORDER"))
+    assert not is_retryable_response(httpx.Response(404, text="missing"))
+    assert not is_retryable_response(httpx.Response(200, json={}))
+
+
+def test_latency_window_quantile():
+    window = LatencyWindow(size=100, min_samples=10)
+    for ms in range(1, 10):
+        window.observe(ms / 1000)
+
+    assert window.quantile(0.95) is None
+
+    for ms in range(10, 201):
+        window.observe(ms / 1000)
+
+    assert len(window) == 100
+    assert window.quantile(0.95) == 0.196
+
+
+@pytest.mark.anyio
+async def test_reads_retry_server_errors_and_timeouts(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("Read retries sleep with asyncio")
+
+    client, requests = make_client(
+        [
+            httpx.Response(503),
+            httpx.ReadTimeout,
+            error("TIMEOUT_UNKNOWN_STATE", 504),
+            httpx.Response(200, json={"ok": True}),
+        ],
+        read_retries=3,
+    )
+    assert await client._get("/market", requires_auth=False) == {"ok": True}
+    assert len(requests) == 4
+
+
+@pytest.mark.anyio
+async def test_reads_give_up_after_read_retries(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("Read retries sleep with asyncio")
+
+    client, requests = make_client(
+        [httpx.Response(503), error("INTERNAL_ERROR", 500)], read_retries=1
+    )
+    with pytest.raises(ServerError):
+        await client._get("/market", requires_auth=False)
+
+    assert len(requests) == 2
+
+
+@pytest.mark.anyio
+async def test_writes_are_never_retried(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("Read retries sleep with asyncio")
+
+    client, requests = make_client(
+        [error("TIMEOUT_UNKNOWN_STATE", 504), httpx.Response(200, json={})], read_retries=3
+    )
+    with pytest.raises(ServerError):
+        await client._post("/orders/create", {"order": 1}, requires_auth=False)
+
+    assert len(requests) == 1
+
+
+@pytest.mark.anyio
+async def test_slow_reads_are_hedged(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("Hedging uses asyncio tasks")
+
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(10)
+
+        return httpx.Response(200, json={"call": calls})
+
+    client = BaseClient(
+        "http://test", transport=httpx.MockTransport(handler), hedge_reads=True, hedge_min_delay=0
+    )
+    window = client._read_latencies["/ticker"] = LatencyWindow(min_samples=1)
+    window.observe(0.01)
+
+    assert await asyncio.wait_for(client._get("/ticker", requires_auth=False), 1) == {"call": 2}
+    assert calls == 2
+
+    # Only the slow first attempt is observed, once it is cancelled.
+    await asyncio.sleep(0)
+    assert len(window) == 2
+    slowest = window.quantile(1.0)
+    assert slowest is not None
+    assert slowest >= 0.01
+
+
+def test_route_template_groups_reads_by_route():
+    assert route_template("/ticker/200") == "/ticker/{}"
+    assert route_template("/market/0xabc@000000000000000001?x=1") == "/market/{}"
+    assert route_template("/markets") == "/markets"
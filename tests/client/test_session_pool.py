@@ -0,0 +1,72 @@
+import json
+import time
+
+import httpx
+import pytest
+
+from tplus.client.session_pool import SessionPool
+from tplus.utils.user import User
+
+HOUR_NS = 3600 * 1_000_000_000
+
+
+@pytest.fixture
+def nonce_users() -> list[str]:
+    return []
+
+
+@pytest.fixture
+def pool(nonce_users):
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.startswith("/nonce/"):
+            nonce_users.append(path.split("/nonce/", 1)[1])
+            return httpx.Response(200, json={"value": "n"})
+
+        if path == "/auth":
+            token = f"tok-{json.loads(request.content)['user_id']}"
+            return httpx.Response(200, json={"token": token, "expiry_ns": time.time_ns() + HOUR_NS})
+
+        return httpx.Response(404)
+
+    pool = SessionPool("http://test", [User(), User(), User()], http2=False)
+    # Every session must go through the one shared connection pool.
+    pool._http._transport = httpx.MockTransport(handler)
+    return pool
+
+
+@pytest.mark.anyio
+async def test_authenticate_signs_in_every_user(anyio_backend, pool, nonce_users):
+    if anyio_backend != "asyncio":
+        pytest.skip("SessionPool uses asyncio primitives")
+
+    async with pool:
+        assert await pool.authenticate() == {}
+
+        clients = list(pool)
+        assert {client._client for client in clients} == {pool._http}
+        assert sorted(nonce_users) == sorted(client._default_user.public_key for client in clients)
+        assert len({client._auth.token for client in clients}) == 3
+
+        # Valid tokens are not fetched again.
+        await pool.authenticate()
+        assert len(nonce_users) == 3
+
+
+@pytest.mark.anyio
+async def test_refresh_only_renews_expiring_tokens(anyio_backend, pool, nonce_users):
+    if anyio_backend != "asyncio":
+        pytest.skip("SessionPool uses asyncio primitives")
+
+    async with pool:
+        await pool.authenticate()
+        expiring = next(iter(pool))
+        expiring._auth.expiry_ns = time.time_ns() + pool.refresh_ahead_ns * 3 // 4
+        assert not expiring._auth.is_expired()
+
+        assert await pool.refresh() == {}
+        assert nonce_users[3:] == [expiring._default_user.public_key]
+        assert expiring._auth.expiry_ns > time.time_ns() + pool.refresh_ahead_ns
+
+        await pool.refresh(force=True)
+        assert len(nonce_users) == 7
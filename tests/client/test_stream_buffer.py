@@ -0,0 +1,146 @@
+import asyncio
+import json
+
+import pytest
+
+from tplus.client.buffer import StreamBuffer
+from tplus.client.market_data import MarketDataClient
+from tplus.model.asset_identifier import AssetIdentifier
+
+
+async def _source(items):
+    for item in items:
+        yield item
+
+
+async def _drain(buffer: StreamBuffer) -> list:
+    items = []
+    while len(buffer):
+        items.append(await buffer.get())
+    return items
+
+
+@pytest.mark.anyio
+async def test_drop_oldest(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("StreamBuffer waits with asyncio events and tasks")
+
+    buffer = StreamBuffer(2, "drop_oldest")
+    for item in range(5):
+        await buffer.put(item)
+
+    assert await _drain(buffer) == [3, 4]
+    assert buffer.dropped == 3
+
+
+@pytest.mark.anyio
+async def test_block_waits_for_consumer(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("StreamBuffer waits with asyncio events and tasks")
+
+    buffer = StreamBuffer(1, "block")
+    await buffer.put(1)
+    put = asyncio.ensure_future(buffer.put(2))
+    await asyncio.sleep(0.01)
+    assert not put.done()
+
+    assert await buffer.get() == 1
+    await asyncio.wait_for(put, timeout=1)
+    assert await buffer.get() == 2
+    assert buffer.dropped == 0
+
+
+@pytest.mark.anyio
+async def test_conflate_by_key(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("StreamBuffer waits with asyncio events and tasks")
+
+    buffer = StreamBuffer(
+        10,
+        "conflate",
+        key=lambda item: item[0] if item[0] != "marker" else None,
+        merge=lambda old, new: (old[0], old[1] + new[1]),
+    )
+    for item in [("a", 1), ("b", 1), ("a", 2), ("marker", 0), ("a", 4), ("a", 8)]:
+        await buffer.put(item)
+
+    assert await _drain(buffer) == [("a", 3), ("b", 1), ("marker", 0), ("a", 12)]
+    assert buffer.conflated == 2
+
+
+@pytest.mark.anyio
+async def test_consume_yields_items_then_raises_source_error(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("StreamBuffer waits with asyncio events and tasks")
+
+    async def failing():
+        yield 1
+        yield 2
+        raise ValueError("boom")
+
+    buffer = StreamBuffer(10)
+    seen = []
+    with pytest.raises(ValueError):
+        async for item in buffer.consume(failing()):
+            seen.append(item)
+
+    assert seen == [1, 2]
+    assert [item async for item in StreamBuffer(10).consume(_source([1, 2, 3]))] == [1, 2, 3]
+
+
+def _kline_message(open_ns: int, close: int) -> str:
+    kline = {
+        "open": "10",
+        "high": str(max(10, close)),
+        "low": str(min(10, close)),
+        "close": str(close),
+        "volume": "1",
+        "open_timestamp_ns": open_ns,
+        "close_timestamp_ns": open_ns + 60,
+    }
+    return json.dumps([kline])
+
+
+class _FakeSocket:
+    def __init__(self, messages):
+        self.messages = list(messages)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.messages:
+            return self.messages.pop(0)
+        raise StopAsyncIteration
+
+
+@pytest.mark.anyio
+async def test_stream_klines_conflates_updates_of_one_candle(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("StreamBuffer waits with asyncio events and tasks")
+
+    client = MarketDataClient("http://test", stream_buffer_size=10, stream_overflow="conflate")
+    socket = _FakeSocket([_kline_message(0, 11), _kline_message(0, 12), _kline_message(60, 13)])
+
+    async def open_ws(path, **_):
+        return socket
+
+    client._open_ws = open_ws  # type: ignore[method-assign,assignment]
+
+    updates = [
+        update
+        async for update in client.stream_klines(AssetIdentifier("200"))
+        if isinstance(update, list)
+    ]
+
+    assert [[(k.open_timestamp_ns, k.close) for k in update] for update in updates] == [
+        [(0, 12)],
+        [(60, 13)],
+    ]
+    assert client.stream_buffers["/klines/diff/200"].conflated == 1
@@ -0,0 +1,95 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from tplus.client.multiplex import StreamMultiplexer
+from tplus.model.asset_identifier import AssetIdentifier
+from tplus.model.stream import StreamLagged
+
+
+class FakeStreams:
+    def __init__(self) -> None:
+        self.opened: list[str] = []
+        self.queues: dict[str, asyncio.Queue[Any]] = {}
+
+    async def stream_depth(self, asset_id: Any) -> AsyncIterator[Any]:
+        self.opened.append(f"{asset_id}")
+        queue = self.queues.setdefault(f"{asset_id}", asyncio.Queue())
+        while (item := await queue.get()) is not None:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+
+async def _next(stream: AsyncIterator[Any]) -> Any:
+    return await asyncio.wait_for(stream.__anext__(), timeout=1)
+
+
+@pytest.mark.anyio
+async def test_subscribers_share_one_stream(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("StreamMultiplexer fans out with asyncio queues and tasks")
+
+    fake = FakeStreams()
+    mux = StreamMultiplexer()
+    first = mux.subscribe(fake.stream_depth, AssetIdentifier("200"))
+    second = mux.subscribe(fake.stream_depth, "200")
+    other = mux.subscribe(fake.stream_depth, "201")
+
+    pending = [asyncio.ensure_future(_next(s)) for s in (first, second, other)]
+    await asyncio.sleep(0.01)
+    assert sorted(fake.opened) == ["200", "201"]
+    assert mux.active_streams == 2
+
+    fake.queues["200"].put_nowait("a")
+    fake.queues["201"].put_nowait("b")
+    assert await asyncio.gather(*pending) == ["a", "a", "b"]
+
+    await first.aclose()
+    assert mux.active_streams == 2
+    await second.aclose()
+    await other.aclose()
+    assert mux.active_streams == 0
+
+
+@pytest.mark.anyio
+async def test_slow_subscriber_drops_oldest(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("StreamMultiplexer fans out with asyncio queues and tasks")
+
+    fake = FakeStreams()
+    mux = StreamMultiplexer(max_queue_size=2)
+    stream = mux.subscribe(fake.stream_depth, "200")
+    pending = asyncio.ensure_future(_next(stream))
+    await asyncio.sleep(0.01)
+
+    fake.queues["200"].put_nowait(0)
+    assert await pending == 0
+
+    for item in range(1, 5):
+        fake.queues["200"].put_nowait(item)
+
+    await asyncio.sleep(0.01)
+    assert await _next(stream) == StreamLagged(dropped=2)
+    assert await _next(stream) == 3
+    assert await _next(stream) == 4
+    await stream.aclose()
+
+
+@pytest.mark.anyio
+async def test_stream_errors_reach_every_subscriber(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("StreamMultiplexer fans out with asyncio queues and tasks")
+
+    fake = FakeStreams()
+    mux = StreamMultiplexer()
+    streams = [mux.subscribe(fake.stream_depth, "200") for _ in range(2)]
+    pending = [asyncio.ensure_future(_next(s)) for s in streams]
+    await asyncio.sleep(0.01)
+
+    fake.queues["200"].put_nowait(ValueError("boom"))
+    results = await asyncio.gather(*pending, return_exceptions=True)
+    assert all(isinstance(r, ValueError) for r in results)
+    assert mux.active_streams == 0
@@ -0,0 +1,146 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from tplus.client.base import BaseClient, _backoff_delay
+from tplus.model.stream import StreamResynced
+
+
+class FakeSocket:
+    def __init__(self, messages, error: Exception | None = None):
+        self.messages = list(messages)
+        self.error = error
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.recv()
+
+    async def recv(self):
+        if self.messages:
+            return self.messages.pop(0)
+        if self.error is not None:
+            raise self.error
+        raise StopAsyncIteration
+
+
+def _client(sockets, **kwargs) -> tuple[BaseClient, list[str]]:
+    client = BaseClient("http://test", reconnect_backoff=0.0, **kwargs)
+    opened: list[str] = []
+
+    async def open_ws(path, **_):
+        opened.append(path)
+        item = sockets.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    client._open_ws = open_ws  # type: ignore[method-assign,assignment]
+    return client, opened
+
+
+async def _take(stream, count: int) -> list:
+    items = []
+    async for item in stream:
+        items.append(item)
+        if len(items) == count:
+            break
+    return items
+
+
+def test_backoff_delay_is_bounded():
+    for attempt in range(1, 20):
+        delay = _backoff_delay(attempt, 0.5, 4.0)
+        assert 0 <= delay <= min(4.0, 0.5 * 2 ** (attempt - 1))
+
+
+@pytest.mark.anyio
+async def test_unmanaged_stream_ends_with_socket(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("WebSocket streams time out and back off with asyncio")
+
+    client, _ = _client([FakeSocket([json.dumps({"n": 1})])])
+    items = [item async for item in client._stream_ws("/s", lambda d: d["n"])]
+    assert items == [1]
+
+
+@pytest.mark.anyio
+async def test_unmanaged_stream_raises_on_error(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("WebSocket streams time out and back off with asyncio")
+
+    client, _ = _client([FakeSocket([], error=ConnectionResetError("boom"))])
+    with pytest.raises(ConnectionResetError):
+        _ = [item async for item in client._stream_ws("/s", lambda d: d)]
+
+
+@pytest.mark.anyio
+async def test_managed_stream_reconnects_and_marks_gap(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("WebSocket streams time out and back off with asyncio")
+
+    sockets = [
+        FakeSocket([json.dumps({"n": 1})], error=ConnectionResetError("boom")),
+        ConnectionRefusedError("down"),
+        FakeSocket([json.dumps({"type": "ping"}), json.dumps({"n": 2})]),
+    ]
+    client, opened = _client(sockets, reconnect_streams=True)
+
+    items = await _take(client._stream_ws("/s", lambda d: d["n"]), 3)
+
+    assert items == [1, StreamResynced(path="/s", attempts=2), 2]
+    assert opened == ["/s", "/s", "/s"]
+
+
+@pytest.mark.anyio
+async def test_managed_stream_reconnects_when_idle(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("WebSocket streams time out and back off with asyncio")
+
+    class IdleSocket(FakeSocket):
+        async def recv(self):
+            if self.messages:
+                return self.messages.pop(0)
+            await asyncio.sleep(10)
+
+    sockets = [IdleSocket([json.dumps({"n": 1})]), FakeSocket([json.dumps({"n": 2})])]
+    client, _ = _client(sockets, reconnect_streams=True, stream_idle_timeout=0.01)
+
+    items = await _take(client._stream_ws("/s", lambda d: d["n"]), 3)
+
+    assert items == [1, StreamResynced(path="/s", attempts=1), 2]
+
+
+@pytest.mark.anyio
+async def test_backoff_grows_until_a_connection_delivers(anyio_backend):
+    if anyio_backend != "asyncio":
+        pytest.skip("WebSocket streams time out and back off with asyncio")
+
+    sockets = [
+        FakeSocket([json.dumps({"n": 1})]),
+        FakeSocket([]),
+        httpx.ConnectError("auth unavailable"),
+        FakeSocket([json.dumps({"n": 2})]),
+        FakeSocket([json.dumps({"n": 3})]),
+    ]
+    client, _ = _client(sockets, reconnect_streams=True)
+
+    items = await _take(client._stream_ws("/s", lambda d: d["n"]), 6)
+
+    assert items == [
+        1,
+        StreamResynced(path="/s", attempts=1),
+        StreamResynced(path="/s", attempts=3),
+        2,
+        StreamResynced(path="/s", attempts=1),
+        3,
+    ]
@@ -0,0 +1,58 @@
+import json
+
+from tplus.client.base import BaseClient
+from tplus.client.tape import TradeTape
+from tplus.model.trades import TradeConfirmedEvent, TradePendingEvent, parse_trade_event
+
+
+def _trade_frame(event: str, trade_id: int) -> str:
+    trade = {
+        "asset_id": "200",
+        "trade_id": trade_id,
+        "price": "100",
+        "quantity": "2",
+        "timestamp_ns": 1_000 + trade_id,
+        "buyer_is_maker": True,
+    }
+    return json.dumps({event: trade}, indent=1)
+
+
+def test_tape_records_and_replays(tmp_path):
+    with TradeTape(tmp_path, segment_size=300) as tape:
+        for received_ns, (event, trade_id) in enumerate(
+            [("Pending", 1), ("Pending", 2), ("Confirmed", 1), ("Rollbacked", 2)]
+        ):
+            tape.append("/trades/events", _trade_frame(event, trade_id), received_ns=received_ns)
+
+        tape.append("/klines/diff/200", '[{"open": "1"}]', received_ns=4)
+
+        assert len(tape.segments()) > 1
+        events = list(tape.replay(parse_trade_event, paths=["/trades/events"]))
+        assert [(e.event_type, e.trade.trade_id) for e in events] == [
+            ("Pending", 1),
+            ("Pending", 2),
+            ("Confirmed", 1),
+            ("Rollbacked", 2),
+        ]
+
+        history = [parse_trade_event(frame.data) for frame in tape.find(1)]
+        assert [type(event) for event in history] == [TradePendingEvent, TradeConfirmedEvent]
+
+        window = tape.frames(start_ns=2, end_ns=4)
+        assert [frame.path for frame in window] == ["/trades/events"] * 2 + ["/klines/diff/200"]
+
+
+def test_tape_attaches_to_client_streams(tmp_path):
+    client = BaseClient("http://test")
+    tape = TradeTape(tmp_path)
+    detach = tape.attach(client)
+
+    frame = _trade_frame("Confirmed", 7)
+    client._run_frame_taps("/trades/events", frame, json.loads(frame))
+    client._run_frame_taps("/marketdepth/diff/200", "{}", {})
+    detach()
+    client._run_frame_taps("/trades/events", frame, json.loads(frame))
+
+    assert [frame.path for frame in tape.frames()] == ["/trades/events"]
+    assert tape.find(7)[0].data == json.loads(frame)
+    tape.close()
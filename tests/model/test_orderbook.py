@@ -0,0 +1,75 @@
+import json
+from decimal import Decimal
+
+import pytest
+
+from tplus.model.orderbook import CompactDepth
+
+SNAPSHOT = {
+    "bids": [[99.5, 1.25], [99.0, 2.0], [98.25, 4.0]],
+    "asks": [[100.5, 1.0], [101.0, 3.0]],
+    "sequence_number": 7,
+}
+
+
+def test_compact_depth_scales_to_integers():
+    depth = CompactDepth.from_payload(SNAPSHOT, price_decimals=2, quantity_decimals=3)
+    assert depth.sequence_number == 7
+    assert depth.level_count("bids") == 3
+    assert depth.top("bids", 2) == [(9950, 1250), (9900, 2000)]
+    assert depth.top("asks", 10) == [(10050, 1000), (10100, 3000)]
+
+
+def test_compact_depth_exact_from_decimal_json():
+    raw = '{"bids": [[0.1000000000000000055, 1]], "asks": [], "sequence_number": 1}'
+    data = json.loads(raw, parse_float=Decimal)
+    depth = CompactDepth.from_payload(data, price_decimals=19, quantity_decimals=0)
+    assert depth.top("bids", 1) == [(1000000000000000055, 1)]
+
+
+def test_compact_depth_scales_floats_exactly():
+    data = {"bids": [[1.1, 0.07]], "asks": [], "sequence_number": 1}
+    depth = CompactDepth.from_payload(data, price_decimals=18, quantity_decimals=17)
+    assert depth.top("bids", 1) == [(1_100_000_000_000_000_000, 7_000_000_000_000_000)]
+
+    with pytest.raises(ValueError, match="int64"):
+        CompactDepth.from_payload(data, price_decimals=19, quantity_decimals=0)
+
+
+def test_compact_depth_fill_reuses_and_grows_buffers():
+    depth = CompactDepth(price_decimals=1, quantity_decimals=0, capacity=1)
+    depth.fill(SNAPSHOT)
+    assert depth.level_count("bids") == 3
+
+    depth.fill({"bids": [[1.5, 2]], "asks": [], "sequence_number": 8})
+    assert depth.level_count("bids") == 1
+    assert depth.level_count("asks") == 0
+    assert depth.top("bids", 5) == [(15, 2)]
+    assert depth.sequence_number == 8
+
+
+def test_compact_depth_vwap():
+    depth = CompactDepth.from_payload(SNAPSHOT, price_decimals=2, quantity_decimals=0)
+    # Whole side: (100.5 * 1 + 101 * 3) / 4
+    assert depth.vwap("asks") == Decimal("100.875")
+    # Partial fill of the second level: (100.5 * 1 + 101 * 1) / 2
+    assert depth.vwap("asks", quantity=2) == Decimal("100.75")
+    assert depth.vwap("asks", quantity=1) == Decimal("100.5")
+
+    empty = CompactDepth(price_decimals=2, quantity_decimals=0)
+    assert empty.vwap("bids") is None
+
+    with pytest.raises(ValueError):
+        depth.top("middle", 1)  # type: ignore[arg-type]
+
+
+def test_compact_depth_as_numpy_survives_growth():
+    np = pytest.importorskip("numpy")
+    depth = CompactDepth(price_decimals=2, quantity_decimals=0, capacity=1)
+    depth.fill({"bids": [[1.5, 2]], "asks": [], "sequence_number": 1})
+    prices, quantities = depth.as_numpy("bids")
+
+    depth.fill(SNAPSHOT)
+    assert prices.tolist() == [150]
+    assert quantities.dtype == np.int64
+    assert depth.as_numpy("bids")[0].tolist() == [9950, 9900, 9825]
@@ -64,6 +64,9 @@ class TestTxSettlementRequest:
         actual = settlement.inner.signing_payload()
         assert actual == expected
 
+        # And the canonical bytes are what ``User.sign`` would have signed.
+        assert settlement.inner.signing_bytes() == expected.encode()
+
     def test_create_signed(self, settlement, user):
         signed = TxSettlementRequest.create_signed(settlement, user)
         assert signed.signature  # truthiness
@@ -260,6 +263,7 @@ class TestBundleSettlementRequest:
             "chain_id": CHAIN_ID,
         }
         settlement = BatchSettlementRequest.model_validate({"inner": inner})
+        assert settlement.inner.signing_bytes() == settlement.signing_payload().encode()
         actual = settlement.signing_payload()
         expected = f'{{"tplus_user":"{user.public_key}","sub_account_index":0,"settler":"{user.public_key}","orders":[{{"mode":"margin","asset_in":"62622e77d1349face943c6e7d5c01c61465fe1dc000000000000000000000000","amount_in":"9f4cfc56cd29b000","asset_out":"58372ab62269a52fa636ad7f200d93999595dcaf000000000000000000000000","amount_out":"8e1bc9bf04000"}}],"transactions":[],"chain_id":"000000000000aa36a7"}}'
         assert actual == expected
@@ -0,0 +1,101 @@
+"""The trusted ``construct_*`` parsers must agree with the validating parsers."""
+
+from typing import Any
+
+import pytest
+
+from tplus.model.asset_identifier import AssetIdentifier, cached_asset_identifier
+from tplus.model.klines import construct_kline_update, parse_kline_update
+from tplus.model.order import construct_order_event, parse_order_event
+from tplus.model.orderbook import OrderBookDiff, construct_orderbook_diff
+from tplus.model.trades import construct_trade_event, parse_trade_event
+from tplus.utils.limit_order import create_limit_order_ob_request_payload
+
+TRADE = {
+    "asset_id": "200",
+    "trade_id": 7,
+    "order_id": "oid",
+    "price": "101.5",
+    "quantity": "2",
+    "timestamp_ns": 123,
+    "buyer_is_maker": True,
+    "status": "Pending",
+}
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {
+            "Updated": {
+                "order_id": "o1",
+                "status": "Open",
+                "filled_quantity": 1,
+                "remaining_quantity": 2,
+                "update_timestamp_ns": 5,
+            }
+        },
+        {"Canceled": {"order_id": "o1", "asset_id": "200", "user_id": "u", "timestamp_ns": 5}},
+        {
+            "Replaced": {
+                "order_id": "o1",
+                "asset_id": "200",
+                "user_id": "u",
+                "new_quantity": 3,
+                "new_price": 4,
+            }
+        },
+        {"CreateFailed": {"order_id": "o1", "user_id": "u", "reason": "nope"}},
+    ],
+)
+def test_construct_order_event_matches_parse(data):
+    assert construct_order_event(data) == parse_order_event(data)
+
+
+def test_construct_order_event_created(user):
+    request = create_limit_order_ob_request_payload(
+        10, 500, "Buy", user, 3, 3, AssetIdentifier("200"), "oid"
+    )
+    data = {
+        "Created": {
+            "user_order": request.order.model_dump(),
+            "signature": request.signature,
+            "book_timestamp_ns": 9,
+        }
+    }
+    assert construct_order_event(data) == parse_order_event(data)
+
+
+def test_construct_order_event_unknown_type():
+    with pytest.raises(ValueError):
+        construct_order_event({"Exploded": {}})
+
+
+def test_construct_trade_event_matches_parse():
+    data = {"Pending": TRADE}
+    assert construct_trade_event(data) == parse_trade_event(data)
+
+
+def test_construct_kline_update_matches_parse():
+    data = [
+        {
+            "open": "1.5",
+            "high": 2,
+            "low": "1",
+            "close": "1.75",
+            "volume": "10",
+            "open_timestamp_ns": 1,
+            "close_timestamp_ns": 2,
+        }
+    ]
+    assert construct_kline_update(data) == parse_kline_update(data)
+
+
+def test_construct_orderbook_diff_matches_parse():
+    data: dict[str, Any] = {"bids": [[1.5, 2.0]], "asks": [[2.5, 1.0]], "sequence_number": 3}
+    assert construct_orderbook_diff(data) == OrderBookDiff(**data)
+
+
+def test_cached_asset_identifier_reuses_instance():
+    assert cached_asset_identifier("200") is cached_asset_identifier("200")
+    assert cached_asset_identifier({"Index": 200}) == AssetIdentifier("200")
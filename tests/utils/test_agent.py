@@ -0,0 +1,97 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+    PublicFormat,
+)
+
+import tplus.utils.user.manager as manager_mod
+from tplus.utils.user import AgentUser, agent
+from tplus.utils.user.agent import SessionAgent
+from tplus.utils.user.manager import UserManager
+
+
+def test_handle_keys_and_tokens(tmp_path):
+    key = Ed25519PrivateKey.generate()
+    public_key = key.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw).hex()
+    seed = key.private_bytes(Encoding.Raw, PrivateFormat.Raw, NoEncryption()).hex()
+    sign = {"op": "sign", "public_key": public_key, "payload": b"hello".hex()}
+
+    session_agent = SessionAgent(tmp_path / "agent.sock")
+    assert session_agent.handle(sign) == {}
+
+    mismatched = {"op": "add_key", "public_key": "00" * 32, "key": seed}
+    assert "error" in session_agent.handle(mismatched)
+
+    session_agent.handle({"op": "add_key", "public_key": public_key, "key": seed})
+    signature = bytes.fromhex(session_agent.handle(sign)["signature"])
+    key.public_key().verify(signature, b"hello")
+
+    expired = {"token": "t", "expiry_ns": time.time_ns() - 1, "issued_ns": 0}
+    session_agent.handle({"op": "put_token", "id": "u@x", **expired})
+    assert session_agent.handle({"op": "get_token", "id": "u@x"}) == {}
+
+    forgetful = SessionAgent(tmp_path / "agent.sock", key_ttl=0)
+    forgetful.handle({"op": "add_key", "public_key": public_key, "key": seed})
+    assert forgetful.handle(sign) == {}
+
+
+def test_client_without_agent(tmp_path):
+    path = tmp_path / "missing.sock"
+    assert agent.request({"op": "ping"}, path) is None
+    assert agent.sign("00" * 32, b"hello", path) is None
+    assert agent.get_token("u", "http://x", path) is None
+
+
+@pytest.mark.anyio
+async def test_agent_signs_for_user_manager(
+    anyio_backend, tmp_path, monkeypatch, private_key_hex, password
+):
+    if anyio_backend != "asyncio":
+        pytest.skip("The agent runs on asyncio")
+
+    path = tmp_path / "agent.sock"
+    monkeypatch.setenv(agent.AGENT_SOCKET_ENV_VAR, str(path))
+    server = asyncio.create_task(SessionAgent().serve())
+    while not path.exists():
+        await asyncio.sleep(0.01)
+
+    manager = UserManager(use_agent=True)
+    manager._data_folder = tmp_path / "users"
+    await asyncio.to_thread(manager.add, "alice", private_key_hex, password)
+
+    # The first unlock decrypts the keyfile and hands the key to the agent...
+    first = await asyncio.to_thread(manager.load, "alice", password)
+    assert isinstance(first, AgentUser)
+    expected = await asyncio.to_thread(first.sign, "hello")
+    assert first._sk is not None
+
+    # ...so a later "process" signs through it without a password.
+    def no_password(prompt=""):
+        raise AssertionError("prompted for a password")
+
+    with patch.object(manager_mod, "getpass", no_password):
+        monkeypatch.delenv(manager_mod.PASSWORD_ENV_VAR, raising=False)
+        second = await asyncio.to_thread(manager.load, "alice")
+        signature = await asyncio.to_thread(second.sign, "hello")
+        # The async path runs the agent round trip off the event loop.
+        assert await second.asign("hello") == signature
+
+    assert signature == expected
+    assert isinstance(second, AgentUser)
+    assert second._sk is None
+
+    await asyncio.to_thread(agent.put_token, "u", "http://x", "tok", time.time_ns() + 10**12, 1)
+    cached = await asyncio.to_thread(agent.get_token, "u", "http://x")
+    assert cached is not None
+    assert cached[0] == "tok"
+
+    await asyncio.to_thread(agent.request, {"op": "stop"})
+    await server
+    assert not path.exists()
@@ -0,0 +1,29 @@
+from tplus.model.asset_identifier import AssetIdentifier
+from tplus.utils.limit_order import create_limit_order_ob_request_payload
+from tplus.utils.replace_order import create_replace_order_ob_request_payload
+from tplus.utils.signing import create_cancel_order_ob_request_payload
+from tplus.utils.user import User
+
+ASSET = AssetIdentifier("200")
+
+
+def _legacy(payload: str) -> bytes:
+    return payload.replace(" ", "").replace("\r", "").replace("\n", "").encode()
+
+
+def test_signable_bytes_match_legacy_payloads(private_key_hex):
+    user = User(private_key_hex)
+    # A space in a string field is stripped by both paths.
+    order = create_limit_order_ob_request_payload(10, 500, "Buy", user, 3, 3, ASSET, "o id").order
+    cancel = create_cancel_order_ob_request_payload(user, ASSET, "oid").cancel
+    replace = create_replace_order_ob_request_payload("oid", ASSET, user, new_price=7).request
+
+    assert order.signable_bytes() == _legacy(order.signable_part())
+    assert cancel.signable_bytes() == _legacy(cancel.model_dump_json())
+    assert replace.signable_bytes() == _legacy(replace.model_dump_json())
+
+
+def test_signatures_verify_over_signable_bytes(private_key_hex):
+    user = User(private_key_hex)
+    request = create_cancel_order_ob_request_payload(user, ASSET, "oid")
+    user.vk.verify(bytes(request.signature), request.cancel.signable_bytes())
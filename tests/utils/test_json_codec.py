@@ -0,0 +1,68 @@
+import importlib.util
+import json
+
+import httpx
+import pytest
+
+from tplus.client.base import BaseClient
+from tplus.utils.json_codec import JsonCodec, get_json_codec
+
+AVAILABLE = ["json"] + [
+    name for name in ("orjson", "msgspec") if importlib.util.find_spec(name) is not None
+]
+U128_MAX = 2**128 - 1
+
+
+@pytest.fixture(params=AVAILABLE)
+def codec(request) -> JsonCodec:
+    return get_json_codec(request.param)
+
+
+def test_round_trip(codec):
+    obj = {"a": [1, 2.5, "x", None, True], "b": {"c": "é"}}
+    assert codec.loads(codec.encode(obj)) == obj
+    assert codec.loads(codec.dumps(obj)) == obj
+    assert " " not in codec.dumps(obj)
+
+
+def test_wide_integers_stay_exact(codec):
+    obj = {"amount": U128_MAX}
+    assert codec.loads(codec.encode(obj)) == obj
+    assert codec.loads(json.dumps(obj)) == obj
+    assert codec.loads(json.dumps(obj).encode()) == obj
+
+
+def test_decode_error_is_json_decode_error(codec):
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b"{not json")
+
+
+def test_get_json_codec():
+    assert get_json_codec("json").name == "json"
+    assert get_json_codec("auto").name in AVAILABLE
+    with pytest.raises(ValueError):
+        get_json_codec("yaml")  # type: ignore[arg-type]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("name", AVAILABLE)
+async def test_client_round_trips_through_codec(name):
+    seen: dict[str, bytes | str] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["body"] = request.content
+        seen["content_type"] = request.headers["content-type"]
+        return httpx.Response(200, content=b'{"echo": 340282366920938463463374607431768211455}')
+
+    transport = httpx.MockTransport(handler)
+    client = BaseClient(
+        "http://test",
+        client=httpx.AsyncClient(base_url="http://test", transport=transport),
+        headers={},
+        json_codec=name,
+    )
+    result = await client._post("/echo", json_data={"amount": U128_MAX})
+
+    assert json.loads(seen["body"]) == {"amount": U128_MAX}
+    assert seen["content_type"] == "application/json"
+    assert result == {"echo": U128_MAX}
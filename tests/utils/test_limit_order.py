@@ -0,0 +1,59 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from tplus.model.asset_identifier import AssetIdentifier
+from tplus.utils.limit_order import create_limit_order_batch_payload
+from tplus.utils.user import LocalUser, User
+
+
+def _orders(count: int) -> list[dict]:
+    return [
+        {
+            "quantity": 10 + idx,
+            "price": 500 + idx,
+            "side": "Buy" if idx % 2 else "Sell",
+            "book_quantity_decimals": 3,
+            "book_price_decimals": 3,
+            "asset_identifier": AssetIdentifier("200"),
+            "order_id": f"oid-{idx}",
+        }
+        for idx in range(count)
+    ]
+
+
+@pytest.mark.parametrize("executor_cls", [None, ThreadPoolExecutor, ProcessPoolExecutor])
+def test_create_limit_order_batch_payload(private_key_hex, executor_cls):
+    signer = User(private_key_hex)
+    orders = _orders(7)
+    if executor_cls is None:
+        batch = create_limit_order_batch_payload(orders, signer)
+    else:
+        with executor_cls(max_workers=2) as executor:
+            batch = create_limit_order_batch_payload(
+                orders, signer, executor=executor, chunk_size=3
+            )
+
+    assert [request.order.order_id for request in batch.orders] == [o["order_id"] for o in orders]
+    for request in batch.orders:
+        signature = bytes(request.signature)
+        signer.vk.verify(signature, request.order.signable_part().encode())
+
+
+def test_locked_signer_signs_sequentially(private_key_hex):
+    key = User(private_key_hex)
+
+    class AgentBackedUser(LocalUser):
+        def sign_bytes(self, payload: bytes) -> bytes:
+            return key.sign_bytes(payload)
+
+    def unlock() -> bytes:
+        raise AssertionError("unlocked the keyfile")
+
+    signer = AgentBackedUser(public_key=key.public_key, unlock=unlock)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        batch = create_limit_order_batch_payload(_orders(3), signer, executor=executor)
+
+    assert not signer.is_unlocked
+    for request in batch.orders:
+        key.vk.verify(bytes(request.signature), request.order.signable_part().encode())
@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from tplus.model.asset_identifier import AssetIdentifier
+from tplus.utils.limit_order import create_limit_order_ob_request_payload
+from tplus.utils.quote_template import OrderIdPool, QuoteTemplate
+from tplus.utils.user import User
+
+ASSET = AssetIdentifier("200")
+
+
+def test_quote_matches_limit_order_payload(private_key_hex):
+    user = User(private_key_hex)
+    template = QuoteTemplate(user, ASSET, "Sell", 3, 4)
+
+    quote = template.build(500, 10, order_id="oid")
+    request = quote.to_request()
+    expected = create_limit_order_ob_request_payload(10, 500, "Sell", user, 4, 3, ASSET, "oid")
+
+    assert request.order.signable_bytes() == quote.order_json
+    assert request.order.model_dump(exclude={"creation_timestamp_ns"}) == (
+        expected.order.model_dump(exclude={"creation_timestamp_ns"})
+    )
+    user.vk.verify(bytes(request.signature), quote.order_json)
+    assert json.loads(quote.control_frame()) == {
+        "CreateOrderRequest": json.loads(quote.request_json())
+    }
+
+
+def test_quote_draws_order_ids_from_pool(private_key_hex):
+    pool = OrderIdPool(size=2)
+    template = QuoteTemplate(User(private_key_hex), ASSET, "Buy", 3, 3, order_ids=pool)
+
+    order_ids = {template.build(500, idx + 1).order_id for idx in range(3)}
+
+    assert len(order_ids) == 3
+    assert len(pool) == 1
+
+
+def test_quote_rejects_order_id_with_whitespace(private_key_hex):
+    template = QuoteTemplate(User(private_key_hex), ASSET, "Buy", 3, 3)
+    with pytest.raises(ValueError):
+        template.build(500, 10, order_id="o id")
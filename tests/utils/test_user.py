@@ -27,6 +27,8 @@ class TestUser:
         user = User(private_key=private_key_hex)
         assert user.public_key == public_key_hex
         assert user.sign("testmessage").hex() == expected_sig_hex
+        assert user.sign_bytes(b"testmessage").hex() == expected_sig_hex
+        assert user.sign("test message\r\n").hex() == expected_sig_hex
 
     def test_local_user_pubkey_does_not_invoke_unlock(self, private_key_hex, public_key_hex):
         unlocked = []
@@ -14,6 +14,7 @@ LOG_BACKUP_COUNT = 3
 
 _CORE_COMMANDS = {
     "accounts": "tplus._cli.accounts:accounts",
+    "agent": "tplus._cli.agent:agent",
     "assets": "tplus._cli.assets:assets",
     "balance": "tplus._cli.balance:balance",
     "debug": "tplus._cli.debug:debug",
@@ -18,6 +18,7 @@ if TYPE_CHECKING:
 
 
 _AUTH_CACHE_DIR = Path.home() / ".tplus" / "auth"
+_MARKET_CACHE_DIR = Path.home() / ".tplus" / "markets"
 
 
 def _derive_market_data_base_url(oms_base_url: str) -> str:
@@ -63,7 +64,7 @@ class CLIContext(dict):
     def user_manager(self) -> "UserManager":
         from tplus.utils.user.manager import UserManager
 
-        return UserManager()
+        return UserManager(use_agent=True)
 
     def load_user(self, alias: str | None = None) -> "User":
         name = alias or self.account or self._resolve_default_account()
@@ -111,6 +112,7 @@ class CLIContext(dict):
         self, alias: str | None = None, *, anonymous: bool = False
     ) -> "OrderBookClient":
         from tplus.client.auth import Auth
+        from tplus.client.market_cache import MarketCache
         from tplus.client.orderbook import OrderBookClient
         from tplus.utils.user.model import User
 
@@ -118,7 +120,8 @@ class CLIContext(dict):
         return OrderBookClient(
             base_url=self._resolved_orderbook_url(),
             default_user=user,
-            auth=Auth(cache_dir=_AUTH_CACHE_DIR),
+            auth=Auth(cache_dir=_AUTH_CACHE_DIR, use_agent=True),
+            market_cache=MarketCache(cache_dir=_MARKET_CACHE_DIR),
             insecure_ssl=self.ignore_ssl,
         )
 
@@ -0,0 +1,55 @@
+import asyncio
+
+import click
+
+
+@click.group()
+def agent():
+    """Run the local session agent that signs for unlocked keys and caches tokens."""
+
+
+@agent.command("start")
+@click.option(
+    "--key-ttl",
+    type=float,
+    default=None,
+    help="Seconds to keep unlocked keys (default: 8 hours).",
+)
+def _start(key_ttl: float | None):
+    """Run the agent in the foreground until `tplus agent stop`."""
+    from tplus.utils.user.agent import DEFAULT_KEY_TTL, SessionAgent, request
+
+    if request({"op": "ping"}) is not None:
+        raise click.ClickException("An agent is already running.")
+
+    session_agent = SessionAgent(key_ttl=DEFAULT_KEY_TTL if key_ttl is None else key_ttl)
+    click.echo(f"Agent listening on {session_agent.path}.")
+    asyncio.run(session_agent.serve())
+
+
+@agent.command("stop")
+def _stop():
+    """Stop the running agent, forgetting every key and token it holds."""
+    from tplus.utils.user.agent import request
+
+    if request({"op": "stop"}) is None:
+        click.echo("No agent running.")
+        return
+
+    click.echo("Agent stopped.")
+
+
+@agent.command("status")
+def _status():
+    """Show whether an agent is running and what it holds."""
+    from tplus.utils.user.agent import request, socket_path
+
+    response = request({"op": "ping"})
+    if response is None:
+        click.echo("No agent running.")
+        return
+
+    click.echo(
+        f"Agent running on {socket_path()}: "
+        f"{response['keys']} key(s), {response['tokens']} token(s)."
+    )
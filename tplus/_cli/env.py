@@ -34,6 +34,7 @@ def env(output_format: str):
         ("TPLUS_CLEARING_BASE_URL", "", "Clearing engine base URL."),
         ("TPLUS_IGNORE_SSL", "false", "Skip TLS certificate verification."),
         ("TPLUS_OUTPUT_FORMAT", "table", "Default output format (table | json)."),
+        ("TPLUS_AGENT_SOCK", "~/.tplus/agent.sock", "Socket of the `tplus agent` session agent."),
         (
             "TPLUS_DEFAULT_BLOCKCHAIN_NETWORK",
             TPLUS_DEFAULT_BLOCKCHAIN_NETWORK,
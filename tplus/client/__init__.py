@@ -1,15 +1,21 @@
 from .blockchain import BlockchainClient
 from .clearingengine import ClearingEngineClient
+from .market_cache import MarketCache
 from .market_data import MarketDataClient
+from .multiplex import StreamMultiplexer
 from .oms import AssetRegistryClient
 from .orderbook import OrderBookClient
+from .session_pool import SessionPool
 from .withdrawal import WithdrawalClient
 
 __all__ = (
     "BlockchainClient",
     "ClearingEngineClient",
+    "MarketCache",
     "MarketDataClient",
     "OrderBookClient",
+    "SessionPool",
     "WithdrawalClient",
     "AssetRegistryClient",
+    "StreamMultiplexer",
 )
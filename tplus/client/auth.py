@@ -1,26 +1,39 @@
 import asyncio
 import json
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from typing_extensions import Self
 
 from tplus.client.base import BaseClient
-from tplus.utils.user import User, token_cache
+from tplus.utils.user import User, agent, token_cache
 
 if TYPE_CHECKING:
     from tplus.types import UserType
 
+# Renew tokens in the background once this fraction of their lifetime has passed.
+DEFAULT_REFRESH_FRACTION = 0.8
+AUTH_RETRY_DELAY = 5.0
+MIN_AUTH_REFRESH_DELAY = 1.0
+CACHE_LOCK_POLL_INTERVAL = 0.05
+CACHE_LOCK_TIMEOUT = 30.0
+
 
 class Auth:
     SAFETY_MARGIN_NS = 60 * 1_000_000_000
 
-    def __init__(self, token: str | None = None, *, cache_dir: Path | None = None) -> None:
+    def __init__(
+        self, token: str | None = None, *, cache_dir: Path | None = None, use_agent: bool = False
+    ) -> None:
         self.lock = asyncio.Lock()
         self.token = token
         self.expiry_ns = 0
+        self.issued_ns = 0
         self._cache_dir = cache_dir
+        self._use_agent = use_agent
 
     def is_expired(self) -> bool:
         if self.token and (time.time_ns() + self.SAFETY_MARGIN_NS) < self.expiry_ns:
@@ -28,12 +41,22 @@ class Auth:
 
         return True
 
-    def load_cached(self, pubkey: str, base_url: str, password: str) -> bool:
+    def refresh_at_ns(self, fraction: float) -> int:
+        """When the token is ``fraction`` of the way through its lifetime."""
+        return self.issued_ns + int((self.expiry_ns - self.issued_ns) * fraction)
+
+    def cache_file(self, pubkey: str, base_url: str) -> Path | None:
         if self._cache_dir is None:
-            return False
+            return None
+
+        return token_cache.cache_path(self._cache_dir, pubkey, base_url)
 
-        path = token_cache.cache_path(self._cache_dir, pubkey, base_url)
-        if not path.is_file():
+    def load_cached(self, pubkey: str, base_url: str, password: str) -> bool:
+        """
+        Adopt the cached token if it is valid and newer than the current one,
+        e.g. because another process refreshed it.
+        """
+        if (path := self.cache_file(pubkey, base_url)) is None or not path.is_file():
             return False
 
         try:
@@ -41,26 +64,46 @@ class Auth:
             if blob.get("base_url") != base_url:
                 return False
 
-            self.token = token_cache.decrypt(blob, password)
-            self.expiry_ns = int(blob["expiry_ns"])
+            token = token_cache.decrypt(blob, password)
+            expiry_ns = int(blob["expiry_ns"])
+            # Older caches have no issue time; treat them as fresh.
+            issued_ns = int(blob.get("issued_ns", time.time_ns()))
         except (OSError, ValueError, KeyError, TypeError, json.JSONDecodeError):
-            self.token = None
-            self.expiry_ns = 0
             return False
 
-        return not self.is_expired()
+        return self._adopt(token, expiry_ns, issued_ns)
+
+    def load_agent(self, pubkey: str, base_url: str) -> bool:
+        """Adopt the session agent's token if it is valid and newer than the current one."""
+        if not self._use_agent or (held := agent.get_token(pubkey, base_url)) is None:
+            return False
+
+        return self._adopt(*held)
+
+    def save_agent(self, pubkey: str, base_url: str) -> None:
+        if self._use_agent and self.token:
+            agent.put_token(pubkey, base_url, self.token, self.expiry_ns, self.issued_ns)
 
     def save_cached(self, pubkey: str, base_url: str, password: str) -> None:
-        if self._cache_dir is None or not self.token:
+        if (path := self.cache_file(pubkey, base_url)) is None or not self.token:
             return
 
         try:
-            blob = token_cache.encrypt(self.token, self.expiry_ns, base_url, password)
-            path = token_cache.cache_path(self._cache_dir, pubkey, base_url)
+            blob = token_cache.encrypt(
+                self.token, self.expiry_ns, base_url, password, issued_ns=self.issued_ns
+            )
             token_cache.write_atomic(path, blob)
         except OSError:
             pass
 
+    def _adopt(self, token: str, expiry_ns: int, issued_ns: int) -> bool:
+        expired = time.time_ns() + self.SAFETY_MARGIN_NS >= expiry_ns
+        if expired or (self.token and expiry_ns <= self.expiry_ns):
+            return False
+
+        self.token, self.expiry_ns, self.issued_ns = token, expiry_ns, issued_ns
+        return True
+
 
 class AuthenticatedClient(BaseClient):
     """
@@ -76,6 +119,7 @@ class AuthenticatedClient(BaseClient):
     ):
         super().__init__(base_url, **kwargs)
         self._auth = auth or Auth()
+        self._auth_refresher: asyncio.Task | None = None
 
     @classmethod
     def from_client(cls, client: "BaseClient") -> Self:
@@ -121,6 +165,7 @@ class AuthenticatedClient(BaseClient):
                 use_auth = False
 
         headers = self._build_headers(with_auth=use_auth, user=auth_user)
+        sent_token = self._auth.token
         response = await self._send(
             method,
             relative_url,
@@ -137,7 +182,8 @@ class AuthenticatedClient(BaseClient):
                 relative_url,
             )
             try:
-                await self._authenticate(user=auth_user)
+                async with self._auth.lock:
+                    await self._renew_auth(user=auth_user, stale_token=sent_token)
             except Exception as err:
                 if requires_auth:
                     raise
@@ -190,36 +236,142 @@ class AuthenticatedClient(BaseClient):
             "User-Id": self._validate_user_public_key(user=user),
         }
 
+    @property
+    def auth_expiry_ns(self) -> int:
+        """When the current token expires (epoch ns); ``0`` when there is none."""
+        return self._auth.expiry_ns
+
+    async def renew_auth(
+        self, *, ahead_ns: int = 0, force: bool = False, user: "User | None" = None
+    ) -> None:
+        """
+        Get a fresh token if the current one expires within ``ahead_ns`` (or
+        regardless, with ``force``). Like requests do, a newer token held by the
+        auth agent or the shared token cache is adopted instead of authenticating.
+
+        Args:
+            ahead_ns: Renew tokens expiring within this many nanoseconds.
+            force: Replace the current token even if it is still good.
+            user: The user to authenticate. Defaults to the client's default user.
+        """
+        async with self._auth.lock:
+            await self._renew_auth(
+                user=user,
+                ahead_ns=ahead_ns,
+                stale_token=self._auth.token if force else None,
+            )
+
+    def start_auth_refresh(
+        self, *, fraction: float = DEFAULT_REFRESH_FRACTION, user: "User | None" = None
+    ) -> asyncio.Task:
+        """
+        Renew the token in the background once ``fraction`` of its lifetime has
+        passed, so requests never wait on the ``nonce -> sign -> /auth`` handshake.
+
+        With a token cache (an ``Auth`` ``cache_dir`` and the cache password set),
+        processes sharing the cache take turns: the first one due refreshes and
+        the others adopt its token from disk. The task stops on :meth:`close`.
+
+        Args:
+            fraction: Fraction of the token's lifetime after which it is renewed.
+            user: The user to authenticate. Defaults to the client's default user.
+
+        Returns:
+            The refresher task.
+        """
+        if self._auth_refresher is None or self._auth_refresher.done():
+            self._auth_refresher = asyncio.create_task(self._refresh_auth_forever(fraction, user))
+
+        return self._auth_refresher
+
+    async def close(self) -> None:
+        if self._auth_refresher is not None:
+            self._auth_refresher.cancel()
+            self._auth_refresher = None
+
+        await super().close()
+
+    async def _refresh_auth_forever(self, fraction: float, user: "User | None") -> None:
+        while True:
+            try:
+                async with self._auth.lock:
+                    await self._renew_auth(user=user, fraction=fraction)
+            except Exception as err:
+                self.logger.error(f"Background auth refresh failed: {err}")
+                await asyncio.sleep(AUTH_RETRY_DELAY)
+                continue
+
+            delay_ns = self._auth.refresh_at_ns(fraction) - time.time_ns()
+            await asyncio.sleep(max(delay_ns / 1_000_000_000, MIN_AUTH_REFRESH_DELAY))
+
     async def _ensure_auth(self, user: "User | None" = None) -> None:
         if not self._auth.is_expired():
             return
 
         async with self._auth.lock:
-            if not self._auth.is_expired():
-                return
+            await self._renew_auth(user=user)
 
-            if password := token_cache.resolve_cache_password():
-                pubkey = self._resolve_user(user=user).public_key
-                if self._auth.load_cached(pubkey, self._settings.base_url, password):
-                    return
+    async def _renew_auth(
+        self,
+        user: "User | None" = None,
+        *,
+        fraction: float | None = None,
+        ahead_ns: int | None = None,
+        stale_token: str | None = None,
+    ) -> None:
+        """
+        Get a fresh token unless the current one is still good: not expired,
+        not past ``fraction`` of its lifetime, not expiring within ``ahead_ns``
+        and not ``stale_token`` (rejected by the server). A newer token in the shared cache is adopted instead of
+        authenticating. The caller must hold ``self._auth.lock``.
+        """
+
+        def needs_renewal() -> bool:
+            if self._auth.is_expired() or (stale_token and self._auth.token == stale_token):
+                return True
+
+            now_ns = time.time_ns()
+            if ahead_ns is not None and now_ns + ahead_ns >= self._auth.expiry_ns:
+                return True
+
+            return fraction is not None and now_ns >= self._auth.refresh_at_ns(fraction)
+
+        if not needs_renewal():
+            return
+
+        pubkey = self._resolve_user(user=user).public_key
+        base_url = self._settings.base_url
+        if self._auth.load_agent(pubkey, base_url) and not needs_renewal():
+            return
 
+        password = token_cache.resolve_cache_password()
+        path = self._auth.cache_file(pubkey, base_url)
+        if not password or path is None:
             await self._authenticate(user=user)
+            return
+
+        # Serialize with other processes, so only one of them authenticates.
+        async with _cache_lock(path):
+            self._auth.load_cached(pubkey, base_url, password)
+            if needs_renewal():
+                await self._authenticate(user=user)
 
     async def _authenticate(self, user: "User | None" = None) -> None:
         # Clear up-front so a failed handshake leaves a clean "no token" state.
         self._auth.token = None
         self._auth.expiry_ns = 0
+        self._auth.issued_ns = time.time_ns()
 
         user = self._resolve_user(user=user)
         nonce_endpoint = f"/nonce/{user.public_key}"
         nonce_resp = await self._client.get(nonce_endpoint)
         nonce_resp.raise_for_status()
-        nonce_data = nonce_resp.json() if hasattr(nonce_resp, "json") else nonce_resp
+        nonce_data = self._codec.loads(nonce_resp.content)
 
         # NOTE: nonce_value **must** be a `str` here.
         nonce_value = f"{nonce_data['value']}" if isinstance(nonce_data, dict) else f"{nonce_data}"
 
-        signature_bytes = user.sign(nonce_value)
+        signature_bytes = await user.asign(nonce_value)
         signature_array = list(signature_bytes)
         nonce_value_len = len(nonce_value)
 
@@ -234,9 +386,13 @@ class AuthenticatedClient(BaseClient):
             "signature": signature_array,
         }
 
-        token_resp = await self._client.post("/auth", json=auth_payload)
+        token_resp = await self._client.post(
+            "/auth",
+            content=self._codec.encode(auth_payload),
+            headers={"Content-Type": "application/json"},
+        )
         token_resp.raise_for_status()
-        token_json = token_resp.json() if hasattr(token_resp, "json") else token_resp
+        token_json = self._codec.loads(token_resp.content)
 
         token = token_json.get("token")  # type: ignore
         expiry_ns = int(token_json["expiry_ns"])  # type: ignore
@@ -255,6 +411,8 @@ class AuthenticatedClient(BaseClient):
         if password := token_cache.resolve_cache_password():
             self._auth.save_cached(user.public_key, self._settings.base_url, password)
 
+        self._auth.save_agent(user.public_key, self._settings.base_url)
+
     async def _ws_auth_headers(self, user: "User | None" = None) -> dict[str, str]:
         await self._ensure_auth(user=user)
         return self._get_auth_headers(user=user)
@@ -289,3 +447,18 @@ class AuthenticatedClient(BaseClient):
             requires_auth=requires_auth,
             user=user,
         )
+
+
+@asynccontextmanager
+async def _cache_lock(path: Path) -> AsyncIterator[None]:
+    lock = token_cache.FileLock(token_cache.lock_path(path))
+    deadline = time.monotonic() + CACHE_LOCK_TIMEOUT
+    # Poll instead of blocking the event loop. If the holder hangs, go ahead
+    # unlocked; the worst case is a redundant handshake.
+    while not lock.try_acquire() and time.monotonic() < deadline:
+        await asyncio.sleep(CACHE_LOCK_POLL_INTERVAL)
+
+    try:
+        yield
+    finally:
+        lock.release()
@@ -1,6 +1,9 @@
+import asyncio
 import json
 import logging
+import random
 import ssl
+import time
 from collections.abc import AsyncIterator, Callable
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
@@ -10,8 +13,19 @@ import websockets
 from pydantic import BaseModel, Field
 from typing_extensions import Self
 
+from tplus.client.buffer import OverflowPolicy, StreamBuffer
+from tplus.client.retry import (
+    IDEMPOTENT_METHODS,
+    MAX_LATENCY_WINDOWS,
+    LatencyWindow,
+    hedge,
+    is_retryable_response,
+    route_template,
+)
 from tplus.exceptions import MissingClientUserError, from_error_body
 from tplus.logger import get_logger
+from tplus.model.stream import StreamResynced
+from tplus.utils.json_codec import JsonCodec, JsonCodecName, get_json_codec
 from tplus.utils.user import User
 
 if TYPE_CHECKING:
@@ -19,8 +33,15 @@ if TYPE_CHECKING:
     from tplus.types import UserType
 
 DEFAULT_TIMEOUT = 10.0
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+DEFAULT_CONTROL_TIMEOUT = 15.0
 DEFAULT_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
 
+# Receives ``(path, raw_message, decoded_data)`` for each stream frame.
+FrameTap = Callable[[str, Any, Any], None]
+
 
 class ClientSettings(BaseModel):
     """
@@ -52,6 +73,116 @@ class ClientSettings(BaseModel):
     HTTP headers.
     """
 
+    trusted_streams: bool = False
+    """
+    Set to parse WebSocket stream messages with the fast-path ``construct_*``
+    parsers, skipping full pydantic validation. Only use against trusted servers.
+    """
+
+    json_codec: JsonCodecName = "auto"
+    """
+    JSON backend for request bodies, responses and WebSocket frames:
+    ``"orjson"``, ``"msgspec"``, ``"json"``, or ``"auto"`` for the fastest installed.
+    """
+
+    reconnect_streams: bool = False
+    """
+    Set to make WebSocket streams reconnect with jittered exponential backoff
+    instead of ending when the socket drops. A :class:`StreamResynced` marker is
+    yielded after every reconnect.
+    """
+
+    reconnect_backoff: float = 0.5
+    """
+    Initial reconnect delay in seconds; doubled on each failed attempt.
+    """
+
+    reconnect_backoff_max: float = 30.0
+    """
+    Upper bound for the reconnect delay in seconds.
+    """
+
+    stream_idle_timeout: float | None = None
+    """
+    Reconnect a managed stream when no message arrives for this many seconds.
+    Keepalive pings are handled by ``websockets`` (see ``ping_interval`` and
+    ``ping_timeout`` in ``websocket_kwargs``).
+    """
+
+    stream_buffer_size: int | None = None
+    """
+    Set to read WebSocket streams in a background task into a buffer of this
+    many messages, so a slow consumer does not stall the socket.
+    """
+
+    stream_overflow: OverflowPolicy = "block"
+    """
+    What a full stream buffer does with new messages: ``"block"``,
+    ``"drop_oldest"`` or ``"conflate"`` (merge depth diffs / klines by key).
+    """
+
+    http2: bool = False
+    """
+    Set to speak HTTP/2 (requires ``h2``, see the ``fast`` extra), multiplexing
+    concurrent requests over a few connections.
+    """
+
+    max_connections: int | None = DEFAULT_MAX_CONNECTIONS
+    """
+    Maximum concurrent connections of the HTTP pool; further requests wait for
+    a free connection. ``None`` for no limit.
+    """
+
+    max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    """
+    Maximum idle connections kept open for reuse. ``None`` for no limit.
+    """
+
+    keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY
+    """
+    Seconds an idle connection is kept open. ``None`` to keep it indefinitely.
+    """
+
+    read_retries: int = 0
+    """
+    How many times an idempotent (``GET``) request is retried after a transport
+    error (e.g. a timeout), a 5xx, or a retryable OMS error such as
+    ``TIMEOUT_UNKNOWN_STATE``. Order writes are never retried.
+    """
+
+    read_retry_backoff: float = 0.1
+    """
+    Initial read retry delay in seconds; doubled on each attempt (with jitter).
+    """
+
+    read_retry_backoff_max: float = 2.0
+    """
+    Upper bound for the read retry delay in seconds.
+    """
+
+    hedge_reads: bool = False
+    """
+    Set to send a second, identical ``GET`` when the first one is slower than
+    the ``hedge_quantile`` of that endpoint's recent latencies, and use
+    whichever answers first. Trades a few extra reads for a tighter tail.
+    """
+
+    hedge_quantile: float = 0.95
+    """
+    Latency quantile after which a read is hedged.
+    """
+
+    hedge_min_delay: float = 0.05
+    """
+    Never hedge a read sooner than this many seconds.
+    """
+
+    control_timeout: float = DEFAULT_CONTROL_TIMEOUT
+    """
+    Seconds to wait for the ``/control`` WebSocket to answer a quote sent with
+    ``send_quote`` or a pipelined order.
+    """
+
     @classmethod
     def from_url(cls, url: str, **kwargs) -> "ClientSettings":
         return cls(base_url=url, **kwargs)
@@ -64,13 +195,42 @@ class ClientSettings(BaseModel):
     def verify_requests(self) -> bool:
         return not self.insecure_ssl
 
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+def create_httpx_transport(settings: ClientSettings) -> httpx.AsyncHTTPTransport:
+    """
+    Create a connection pool configured by ``settings``. Pass it as
+    ``transport`` to several clients (e.g. an :class:`OrderBookClient`, a
+    :class:`MarketDataClient` and a :class:`ClearingEngineClient`) to have them
+    share it; the caller then closes it with ``aclose()``.
+    """
+    return httpx.AsyncHTTPTransport(
+        verify=settings.verify_requests,
+        http2=settings.http2,
+        limits=settings.limits,
+    )
+
 
-def create_httpx_client(settings: ClientSettings) -> httpx.AsyncClient:
+def create_httpx_client(
+    settings: ClientSettings,
+    *,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
     return httpx.AsyncClient(
         base_url=settings.base_url,
         timeout=settings.timeout,
         headers=settings.headers,
         verify=settings.verify_requests,
+        http2=settings.http2,
+        limits=settings.limits,
+        transport=transport,
     )
 
 
@@ -90,6 +250,26 @@ class BaseClient:
         insecure_ssl: bool = False,
         headers: dict[str, Any] | None = None,
         websocket_kwargs: dict[str, Any] | None = None,
+        trusted_streams: bool = False,
+        json_codec: JsonCodecName = "auto",
+        reconnect_streams: bool = False,
+        reconnect_backoff: float = 0.5,
+        reconnect_backoff_max: float = 30.0,
+        stream_idle_timeout: float | None = None,
+        stream_buffer_size: int | None = None,
+        stream_overflow: OverflowPolicy = "block",
+        http2: bool = False,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        transport: httpx.AsyncBaseTransport | None = None,
+        read_retries: int = 0,
+        read_retry_backoff: float = 0.1,
+        read_retry_backoff_max: float = 2.0,
+        hedge_reads: bool = False,
+        hedge_quantile: float = 0.95,
+        hedge_min_delay: float = 0.05,
+        control_timeout: float = DEFAULT_CONTROL_TIMEOUT,
     ):
         self._settings = ClientSettings(
             base_url=base_url,
@@ -97,9 +277,34 @@ class BaseClient:
             insecure_ssl=insecure_ssl,
             headers=headers if headers is not None else dict(DEFAULT_HEADERS),
             websocket_kwargs=websocket_kwargs if websocket_kwargs is not None else {},
+            trusted_streams=trusted_streams,
+            json_codec=json_codec,
+            reconnect_streams=reconnect_streams,
+            reconnect_backoff=reconnect_backoff,
+            reconnect_backoff_max=reconnect_backoff_max,
+            stream_idle_timeout=stream_idle_timeout,
+            stream_buffer_size=stream_buffer_size,
+            stream_overflow=stream_overflow,
+            http2=http2,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            read_retries=read_retries,
+            read_retry_backoff=read_retry_backoff,
+            read_retry_backoff_max=read_retry_backoff_max,
+            hedge_reads=hedge_reads,
+            hedge_quantile=hedge_quantile,
+            hedge_min_delay=hedge_min_delay,
+            control_timeout=control_timeout,
         )
+        self._codec: JsonCodec = get_json_codec(self._settings.json_codec)
         self._default_user = default_user
-        self._client = client or create_httpx_client(self._settings)
+        self._stream_buffers: dict[str, StreamBuffer] = {}
+        self._frame_taps: list[FrameTap] = []
+        self._read_latencies: dict[str, LatencyWindow] = {}
+        # A shared ``transport`` belongs to the caller and outlives this client.
+        self._shares_transport = client is None and transport is not None
+        self._client = client or create_httpx_client(self._settings, transport=transport)
         self.logger = get_logger(log_level=log_level)
 
     @classmethod
@@ -110,6 +315,25 @@ class BaseClient:
             insecure_ssl=settings.insecure_ssl,
             headers=dict(settings.headers),
             websocket_kwargs=dict(settings.websocket_kwargs),
+            trusted_streams=settings.trusted_streams,
+            json_codec=settings.json_codec,
+            reconnect_streams=settings.reconnect_streams,
+            reconnect_backoff=settings.reconnect_backoff,
+            reconnect_backoff_max=settings.reconnect_backoff_max,
+            stream_idle_timeout=settings.stream_idle_timeout,
+            stream_buffer_size=settings.stream_buffer_size,
+            stream_overflow=settings.stream_overflow,
+            http2=settings.http2,
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry,
+            read_retries=settings.read_retries,
+            read_retry_backoff=settings.read_retry_backoff,
+            read_retry_backoff_max=settings.read_retry_backoff_max,
+            hedge_reads=settings.hedge_reads,
+            hedge_quantile=settings.hedge_quantile,
+            hedge_min_delay=settings.hedge_min_delay,
+            control_timeout=settings.control_timeout,
             **kwargs,
         )
 
@@ -121,6 +345,32 @@ class BaseClient:
             client=client._client,
         )
 
+    @property
+    def stream_buffers(self) -> dict[str, StreamBuffer]:
+        """
+        Buffers of the buffered streams opened by this client, keyed by path.
+        Check their ``dropped`` and ``conflated`` counters to see what a slow
+        consumer missed.
+        """
+        return self._stream_buffers
+
+    def add_frame_tap(self, tap: FrameTap) -> Callable[[], None]:
+        """
+        Call ``tap(path, message, data)`` with every raw WebSocket ``message``
+        (and its decoded JSON ``data``) received on this client's streams,
+        before parsing.
+
+        Returns:
+            A callable that removes the tap.
+        """
+        self._frame_taps.append(tap)
+
+        def remove() -> None:
+            if tap in self._frame_taps:
+                self._frame_taps.remove(tap)
+
+        return remove
+
     def _resolve_user(self, user: User | None = None) -> User:
         if user is not None:
             return user
@@ -211,13 +461,76 @@ class BaseClient:
         req_kwargs: dict[str, Any] = {
             "method": method,
             "url": relative_url,
-            "json": json_data,
             "params": params,
             "headers": merged_headers,
         }
+        if json_data is not None:
+            req_kwargs["content"] = self._codec.encode(json_data)
+            if not any(key.lower() == "content-type" for key in merged_headers):
+                req_kwargs["headers"] = {**merged_headers, "Content-Type": "application/json"}
+
         if request_timeout is not None:
             req_kwargs["timeout"] = request_timeout
 
+        settings = self._settings
+        if method not in IDEMPOTENT_METHODS or not (settings.read_retries or settings.hedge_reads):
+            return await self._send_once(req_kwargs)
+
+        attempt = 0
+        while True:
+            try:
+                response = await self._send_read(relative_url, req_kwargs)
+            except httpx.TransportError:
+                if attempt >= settings.read_retries:
+                    raise
+            else:
+                if attempt >= settings.read_retries or not is_retryable_response(response):
+                    return response
+
+            attempt += 1
+            delay = _backoff_delay(
+                attempt, settings.read_retry_backoff, settings.read_retry_backoff_max
+            )
+            self.logger.warning(
+                f"Retrying {method} {relative_url} in {delay:.2f}s "
+                f"(attempt {attempt}/{settings.read_retries})."
+            )
+            await asyncio.sleep(delay)
+
+    async def _send_read(self, relative_url: str, req_kwargs: dict[str, Any]) -> httpx.Response:
+        if not self._settings.hedge_reads:
+            return await self._send_once(req_kwargs)
+
+        route = route_template(relative_url)
+        if (latencies := self._read_latencies.get(route)) is None:
+            if len(self._read_latencies) >= MAX_LATENCY_WINDOWS:
+                return await self._send_once(req_kwargs)
+
+            latencies = self._read_latencies[route] = LatencyWindow()
+
+        # Only the first attempt's latency is observed: the hedged race would
+        # hide exactly the slow responses the deadline is derived from.
+        start = time.monotonic()
+
+        async def send_primary() -> httpx.Response:
+            try:
+                response = await self._send_once(req_kwargs)
+            except asyncio.CancelledError:
+                # Lost to the hedge; it took at least this long.
+                latencies.observe(time.monotonic() - start)
+                raise
+
+            latencies.observe(time.monotonic() - start)
+            return response
+
+        deadline = latencies.quantile(self._settings.hedge_quantile)
+        if deadline is None:
+            return await send_primary()
+
+        delay = max(deadline, self._settings.hedge_min_delay)
+        return await hedge(send_primary, delay, backup=lambda: self._send_once(req_kwargs))
+
+    async def _send_once(self, req_kwargs: dict[str, Any]) -> httpx.Response:
         try:
             return await self._client.request(**req_kwargs)
         except httpx.TimeoutException as err:
@@ -240,7 +553,7 @@ class BaseClient:
             return {}
 
         try:
-            json_response = response.json()
+            json_response = self._codec.loads(response.content)
             if json_response is None:
                 self.logger.warning(
                     f"API endpoint {response.request.url!r} returned JSON null. Treating as empty dictionary."
@@ -338,37 +651,151 @@ class BaseClient:
         control_handler: Callable[[dict[str, Any]], None] | None = None,
         requires_auth: bool = True,
         user: "UserType | None" = None,
+        reconnect: bool | None = None,
+        buffered: bool = True,
+        conflate_key: Callable[[Any], Any] | None = None,
+        conflate: Callable[[Any, Any], Any] | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Yield parsed messages from a WebSocket stream.
+
+        When ``reconnect`` (default: ``ClientSettings.reconnect_streams``) is set,
+        dropped or idle connections are re-opened with jittered exponential
+        backoff and a :class:`StreamResynced` marker is yielded after each
+        reconnect. Otherwise the stream ends when the socket closes.
+
+        When ``ClientSettings.stream_buffer_size`` is set (and ``buffered``), the
+        socket is read in a background task into a :class:`StreamBuffer`. With
+        the ``"conflate"`` overflow policy, parsed messages sharing a
+        ``conflate_key`` are merged with ``conflate`` (default: keep the newest).
+        """
+        source = self._read_ws(
+            path,
+            parser,
+            control_handler=control_handler,
+            requires_auth=requires_auth,
+            user=user,
+            reconnect=reconnect,
+        )
+        buffer_size = self._settings.stream_buffer_size
+        if not buffered or buffer_size is None:
+            async for item in source:
+                yield item
+
+            return
+
+        buffer = StreamBuffer(
+            buffer_size, self._settings.stream_overflow, key=conflate_key, merge=conflate
+        )
+        self._stream_buffers[path] = buffer
+        async for item in buffer.consume(source):
+            yield item
+
+    async def _read_ws(
+        self,
+        path: str,
+        parser: Callable[[Any], Any],
+        *,
+        control_handler: Callable[[dict[str, Any]], None] | None = None,
+        requires_auth: bool = True,
+        user: "UserType | None" = None,
+        reconnect: bool | None = None,
     ) -> AsyncIterator[Any]:
+        managed = self._settings.reconnect_streams if reconnect is None else reconnect
+        idle_timeout = self._settings.stream_idle_timeout if managed else None
         ws_url = self._get_websocket_url(path)
-        self.logger.debug("Connecting to %s stream: %s", path, ws_url)
-        websocket_cm = await self._open_ws(path, requires_auth=requires_auth, user=user)
-
-        async with websocket_cm as websocket:
-            async for message in websocket:
-                try:
-                    data = json.loads(message)
-                    if isinstance(data, dict) and data.get("type") in self.CONTROL_MESSAGE_TYPES:
-                        if control_handler is not None:
-                            control_handler(data)
-                        continue
-                    yield parser(data)
-                except json.JSONDecodeError:
-                    self.logger.warning(
-                        "Received non-JSON message on %s stream: %s…", path, message[:100]
-                    )
-                except Exception as e:
-                    self.logger.error(
-                        "Error processing message from %s stream: %s. Message: %s…",
-                        path,
-                        e,
-                        message[:100],
-                    )
+        attempts = 0
+
+        while True:
+            self.logger.debug("Connecting to %s stream: %s", path, ws_url)
+            try:
+                websocket_cm = await self._open_ws(path, requires_auth=requires_auth, user=user)
+                async with websocket_cm as websocket:
+                    if attempts:
+                        self.logger.info(
+                            "Reconnected to %s stream after %s attempt(s).", path, attempts
+                        )
+                        yield StreamResynced(path=path, attempts=attempts)
+
+                    async for message in _iter_ws_messages(websocket, idle_timeout):
+                        # Only a connection that delivers resets the backoff, so a
+                        # server that accepts and drops at once is not hammered.
+                        attempts = 0
+                        try:
+                            data = self._codec.loads(message)
+                            if self._frame_taps:
+                                self._run_frame_taps(path, message, data)
+
+                            if (
+                                isinstance(data, dict)
+                                and data.get("type") in self.CONTROL_MESSAGE_TYPES
+                            ):
+                                if control_handler is not None:
+                                    control_handler(data)
+                                continue
+                            parsed = parser(data)
+                        except json.JSONDecodeError:
+                            self.logger.warning(
+                                "Received non-JSON message on %s stream: %s…", path, message[:100]
+                            )
+                            continue
+                        except Exception as e:
+                            self.logger.error(
+                                "Error processing message from %s stream: %s. Message: %s…",
+                                path,
+                                e,
+                                message[:100],
+                            )
+                            continue
+
+                        yield parsed
+
+                reason = "closed by server"
+            except (
+                OSError,
+                asyncio.TimeoutError,
+                httpx.HTTPError,
+                websockets.ConnectionClosed,
+                websockets.InvalidHandshake,
+            ) as err:
+                if not managed:
+                    raise
+
+                reason = str(err) or type(err).__name__
+
+            if not managed:
+                return
+
+            attempts += 1
+            delay = _backoff_delay(
+                attempts, self._settings.reconnect_backoff, self._settings.reconnect_backoff_max
+            )
+            self.logger.warning(
+                "%s stream disconnected (%s); reconnecting in %.2fs (attempt %s).",
+                path,
+                reason,
+                delay,
+                attempts,
+            )
+            await asyncio.sleep(delay)
+
+    def _run_frame_taps(self, path: str, message: Any, data: Any) -> None:
+        for tap in list(self._frame_taps):
+            try:
+                tap(path, message, data)
+            except Exception as err:
+                # A failing tap must not drop the message for the stream's consumer.
+                self.logger.error("Frame tap failed on %s stream: %s", path, err)
 
     async def close(self) -> None:
         """
-        Closes the underlying httpx async client.
+        Closes the underlying httpx async client, unless it runs on a shared
+        ``transport``.
         """
         self.logger.debug("Closing async HTTP client.")
+        if self._shares_transport:
+            return
+
         if self._client and isinstance(self._client, httpx.AsyncClient):
             await self._client.aclose()
 
@@ -385,6 +812,27 @@ class BaseClient:
         await self.close()
 
 
+def _backoff_delay(attempt: int, initial: float, maximum: float) -> float:
+    # "Full jitter": uniform in [0, min(max, initial * 2**(attempt - 1))].
+    return random.uniform(0, min(maximum, initial * 2 ** (attempt - 1)))
+
+
+async def _iter_ws_messages(websocket, idle_timeout: float | None) -> AsyncIterator[Any]:
+    if idle_timeout is None:
+        async for message in websocket:
+            yield message
+
+        return
+
+    while True:
+        try:
+            message = await asyncio.wait_for(websocket.recv(), timeout=idle_timeout)
+        except websockets.ConnectionClosedOK:
+            return
+
+        yield message
+
+
 def raise_for_status_with_body(response: httpx.Response) -> None:
     """Raise a structured ``OmsError`` when the response carries the
     standardised error envelope, otherwise fall back to ``httpx.HTTPStatusError``
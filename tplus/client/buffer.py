@@ -0,0 +1,142 @@
+"""Bounded buffering between a WebSocket read loop and a (possibly slow) consumer."""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Hashable
+from typing import Any, Literal
+
+OverflowPolicy = Literal["block", "drop_oldest", "conflate"]
+
+
+class StreamBuffer:
+    """
+    A bounded queue filled by a background reader task.
+
+    Overflow policies:
+
+    * ``"block"``: the reader waits for the consumer (socket reads stall).
+    * ``"drop_oldest"``: the oldest buffered item is discarded.
+    * ``"conflate"``: an item whose ``key`` matches a buffered item is merged
+      into it; items without a key (``key`` returns ``None``) act as ordering
+      barriers. If the buffer is still full, the oldest item is discarded.
+
+    The ``dropped`` and ``conflated`` counters report how much the consumer
+    missed.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        overflow: OverflowPolicy = "block",
+        *,
+        key: Callable[[Any], Hashable | None] | None = None,
+        merge: Callable[[Any, Any], Any] | None = None,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.dropped = 0
+        self.conflated = 0
+        self._key = key if overflow == "conflate" else None
+        self._merge = merge or (lambda _, newer: newer)
+        self._items: deque[list[Any]] = deque()
+        self._pending: dict[Hashable, list[Any]] = {}
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._done = False
+        self._error: BaseException | None = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    async def put(self, item: Any) -> None:
+        """
+        Add ``item``, applying the overflow policy when the buffer is full.
+        """
+        item_key = self._key(item) if self._key is not None else None
+        if item_key is None:
+            self._pending.clear()
+        elif (entry := self._pending.get(item_key)) is not None:
+            entry[1] = self._merge(entry[1], item)
+            self.conflated += 1
+            return
+
+        while len(self._items) >= self.maxsize:
+            if self.overflow == "block":
+                self._not_full.clear()
+                await self._not_full.wait()
+                continue
+
+            oldest_key, _ = oldest = self._items.popleft()
+            if oldest_key is not None and self._pending.get(oldest_key) is oldest:
+                del self._pending[oldest_key]
+
+            self.dropped += 1
+
+        entry = [item_key, item]
+        self._items.append(entry)
+        if item_key is not None:
+            self._pending[item_key] = entry
+
+        self._not_empty.set()
+
+    async def get(self) -> Any:
+        """
+        Remove and return the oldest item.
+
+        Raises:
+            StopAsyncIteration: When the reader finished and the buffer is empty.
+        """
+        while not self._items:
+            if self._done:
+                if self._error is not None:
+                    raise self._error
+
+                raise StopAsyncIteration
+
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        item_key, item = entry = self._items.popleft()
+        if item_key is not None and self._pending.get(item_key) is entry:
+            del self._pending[item_key]
+
+        self._not_full.set()
+        return item
+
+    def finish(self, error: BaseException | None = None) -> None:
+        """
+        Mark the input as exhausted; ``error`` is raised once the buffer drains.
+        """
+        self._done = True
+        self._error = error
+        self._not_empty.set()
+
+    async def consume(self, source: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        """
+        Read ``source`` in a background task and yield its items from this buffer.
+        """
+
+        async def reader() -> None:
+            try:
+                async for item in source:
+                    await self.put(item)
+
+            except Exception as err:
+                self.finish(err)
+            else:
+                self.finish()
+
+        task = asyncio.create_task(reader())
+        try:
+            while True:
+                try:
+                    item = await self.get()
+                except StopAsyncIteration:
+                    return
+
+                yield item
+        finally:
+            task.cancel()
@@ -0,0 +1,283 @@
+"""Build multi-timeframe OHLCV bars locally from kline and trade streams."""
+
+from array import array
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, NamedTuple
+
+from tplus.model.asset_identifier import AssetIdentifier
+from tplus.model.klines import KlineUpdate
+from tplus.model.trades import Trade
+
+if TYPE_CHECKING:
+    from tplus.client.market_data import MarketDataClient
+
+DEFAULT_TIMEFRAMES = ("1s", "1m", "5m", "1h")
+DEFAULT_BAR_CAPACITY = 1_024
+# Server bars per asset whose last volume is remembered, so a late update of a
+# recent bar replaces its earlier contribution.
+SOURCE_BAR_HISTORY = 8
+
+_UNITS_NS = {
+    "s": 1_000_000_000,
+    "m": 60_000_000_000,
+    "h": 3_600_000_000_000,
+    "d": 86_400_000_000_000,
+}
+
+
+def parse_timeframe(timeframe: str) -> int:
+    """
+    Convert a timeframe such as ``"5m"`` (units ``s``, ``m``, ``h``, ``d``) to nanoseconds.
+    """
+    count, unit = timeframe[:-1], timeframe[-1:]
+    if unit not in _UNITS_NS or not count.isdigit() or int(count) < 1:
+        raise ValueError(f"Invalid timeframe {timeframe!r}.")
+
+    return int(count) * _UNITS_NS[unit]
+
+
+class Bar(NamedTuple):
+    open_timestamp_ns: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+class BarSeries:
+    """
+    The most recent ``capacity`` bars of one timeframe, in preallocated ring
+    buffers. Bars without any update in between are not materialized.
+
+    Index with ``series[-1]`` for the current (still open) bar; iteration goes
+    oldest first.
+    """
+
+    def __init__(self, timeframe_ns: int, capacity: int = DEFAULT_BAR_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+
+        self.timeframe_ns = timeframe_ns
+        self.capacity = capacity
+        self.late = 0
+        """Updates dropped because their bar had already left the buffer."""
+
+        self._open_ts = array("q", bytes(8 * capacity))
+        self._close_ts = array("q", bytes(8 * capacity))
+        self._open = array("d", bytes(8 * capacity))
+        self._high = array("d", bytes(8 * capacity))
+        self._low = array("d", bytes(8 * capacity))
+        self._close = array("d", bytes(8 * capacity))
+        self._volume = array("d", bytes(8 * capacity))
+        self._head = -1
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, idx: int) -> Bar:
+        if not -self._size <= idx < self._size:
+            raise IndexError("bar index out of range")
+
+        slot = self._slot_at(idx % self._size)
+        return Bar(
+            self._open_ts[slot],
+            self._open[slot],
+            self._high[slot],
+            self._low[slot],
+            self._close[slot],
+            self._volume[slot],
+        )
+
+    def __iter__(self):
+        for idx in range(self._size):
+            yield self[idx]
+
+    def __repr__(self) -> str:
+        return f"<BarSeries {self.timeframe_ns}ns {self._size}/{self.capacity}>"
+
+    def update(
+        self,
+        timestamp_ns: int,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        close_timestamp_ns: int | None = None,
+    ) -> None:
+        """
+        Fold a trade (``open_ == high == low == close``) or a finer bar starting
+        at ``timestamp_ns`` into its bar. ``close`` only replaces the bar's
+        close when ``close_timestamp_ns`` is not older than the one it has.
+        """
+        bucket = timestamp_ns - timestamp_ns % self.timeframe_ns
+        if close_timestamp_ns is None:
+            close_timestamp_ns = timestamp_ns
+
+        if self._size == 0 or bucket > self._open_ts[self._head]:
+            self._head = (self._head + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+            slot = self._head
+            self._open_ts[slot] = bucket
+            self._close_ts[slot] = close_timestamp_ns
+            self._open[slot] = open_
+            self._high[slot] = high
+            self._low[slot] = low
+            self._close[slot] = close
+            self._volume[slot] = volume
+            return
+
+        if (found := self._find(bucket)) is None:
+            self.late += 1
+            return
+
+        if high > self._high[found]:
+            self._high[found] = high
+        if low < self._low[found]:
+            self._low[found] = low
+        if close_timestamp_ns >= self._close_ts[found]:
+            self._close_ts[found] = close_timestamp_ns
+            self._close[found] = close
+
+        self._volume[found] += volume
+
+    def column(self, name: str) -> list[float]:
+        """One column (a :class:`Bar` field name), oldest first."""
+        columns: dict[str, array[int] | array[float]] = {
+            "open_timestamp_ns": self._open_ts,
+            "open": self._open,
+            "high": self._high,
+            "low": self._low,
+            "close": self._close,
+            "volume": self._volume,
+        }
+        source = columns[name]
+        return [source[self._slot_at(idx)] for idx in range(self._size)]
+
+    def _slot_at(self, idx: int) -> int:
+        return (self._head - self._size + 1 + idx) % self.capacity
+
+    def _find(self, bucket: int) -> int | None:
+        # Late updates almost always hit one of the newest bars; scan backwards.
+        for back in range(self._size):
+            slot = (self._head - back) % self.capacity
+            if self._open_ts[slot] == bucket:
+                return slot
+
+            if self._open_ts[slot] < bucket:
+                return None
+
+        return None
+
+
+class KlineAggregator:
+    """
+    Maintains rolling bars per asset for several timeframes, fed from
+    :meth:`MarketDataClient.stream_klines` and/or
+    :meth:`MarketDataClient.stream_finalized_trades`.
+
+    Feed each asset from one source only: trades build every timeframe, while
+    server klines only build timeframes at least as long as the server's bars.
+    Repeated updates of the same server bar replace its earlier contribution.
+
+    Usage example::
+
+        bars = KlineAggregator(["1m", "5m", "1h"])
+        asyncio.create_task(bars.run_trades(market_data_client))
+        ...
+        last_5m = bars.series(asset_id, "5m")[-1]
+
+    Args:
+        timeframes: Timeframe names (e.g. ``"5m"``) or a name-to-nanoseconds mapping.
+        capacity: Bars kept per series.
+    """
+
+    def __init__(
+        self,
+        timeframes: Iterable[str] | Mapping[str, int] = DEFAULT_TIMEFRAMES,
+        capacity: int = DEFAULT_BAR_CAPACITY,
+    ):
+        if isinstance(timeframes, Mapping):
+            self.timeframes = dict(timeframes)
+        else:
+            self.timeframes = {name: parse_timeframe(name) for name in timeframes}
+
+        self.capacity = capacity
+        self._series: dict[str, dict[str, BarSeries]] = {}
+        # Last seen volume of the recent server bars, by asset and open time.
+        self._source_bars: dict[str, dict[int, float]] = {}
+
+    def series(self, asset_id: AssetIdentifier | str, timeframe: str) -> BarSeries:
+        """The bars of ``asset_id`` for ``timeframe`` (created empty if unseen)."""
+        return self._asset_series(str(asset_id))[timeframe]
+
+    def add_trade(self, trade: Trade) -> None:
+        """Fold a finalized trade into every timeframe of its asset."""
+        if trade.status == "Rollbacked":
+            return
+
+        price = float(trade.price)
+        quantity = float(trade.quantity)
+        for series in self._asset_series(str(trade.asset_id)).values():
+            series.update(trade.timestamp_ns, price, price, price, price, quantity)
+
+    def add_kline(
+        self, asset_id: AssetIdentifier | str, kline: KlineUpdate | list[KlineUpdate]
+    ) -> None:
+        """Fold a server bar update (or a message's list of them) into the coarser timeframes."""
+        if isinstance(kline, list):
+            for item in kline:
+                self.add_kline(asset_id, item)
+
+            return
+
+        key = str(asset_id)
+        opened = kline.open_timestamp_ns
+        volume = float(kline.volume)
+        seen = self._source_bars.setdefault(key, {})
+        if (previous := seen.get(opened)) is not None:
+            delta = volume - previous
+            seen[opened] = volume
+        elif len(seen) >= SOURCE_BAR_HISTORY and opened < min(seen):
+            # Older than every remembered bar; its earlier volume is unknown.
+            delta = 0.0
+        else:
+            delta = volume
+            seen[opened] = volume
+            if len(seen) > SOURCE_BAR_HISTORY:
+                del seen[min(seen)]
+
+        duration = kline.close_timestamp_ns - kline.open_timestamp_ns
+        values = (
+            float(kline.open),
+            float(kline.high),
+            float(kline.low),
+            float(kline.close),
+            delta,
+        )
+        for series in self._asset_series(key).values():
+            if series.timeframe_ns >= duration:
+                series.update(opened, *values, kline.close_timestamp_ns)
+
+    async def run_klines(self, client: "MarketDataClient", asset_id: AssetIdentifier) -> None:
+        """Feed ``asset_id``'s kline stream into the aggregator until it ends."""
+        async for update in client.stream_klines(asset_id):
+            if isinstance(update, KlineUpdate | list):
+                self.add_kline(asset_id, update)
+
+    async def run_trades(self, client: "MarketDataClient") -> None:
+        """Feed the finalized-trade stream (all assets) into the aggregator until it ends."""
+        async for trade in client.stream_finalized_trades():
+            if isinstance(trade, Trade):
+                self.add_trade(trade)
+
+    def _asset_series(self, key: str) -> dict[str, BarSeries]:
+        if (series := self._series.get(key)) is None:
+            series = self._series[key] = {
+                name: BarSeries(timeframe_ns, self.capacity)
+                for name, timeframe_ns in self.timeframes.items()
+            }
+
+        return series
@@ -0,0 +1,199 @@
+"""Incremental k-line history stored per asset as local NumPy columns."""
+
+import os
+from collections.abc import Iterable
+from contextlib import aclosing
+from hashlib import sha256
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from tplus.client.paginate import DEFAULT_PAGE_CONCURRENCY
+from tplus.model.asset_identifier import AssetIdentifier
+from tplus.model.klines import KlineUpdate
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+    from tplus.client.market_data import MarketDataClient
+
+DEFAULT_KLINE_CACHE_DIR = Path.home() / ".tplus" / "klines"
+DEFAULT_KLINE_PAGE_SIZE = 1_000
+
+KLINE_FIELDS: tuple[tuple[str, str], ...] = (
+    ("open_timestamp_ns", "<i8"),
+    ("close_timestamp_ns", "<i8"),
+    ("open", "<f8"),
+    ("high", "<f8"),
+    ("low", "<f8"),
+    ("close", "<f8"),
+    ("volume", "<f8"),
+)
+
+
+def klines_to_array(klines: Iterable[KlineUpdate]) -> "np.ndarray":
+    """
+    Convert klines into a structured array with the :data:`KLINE_FIELDS` columns.
+
+    Prices and volumes become ``float64``; keep the :class:`KlineUpdate`
+    objects when exact ``Decimal`` values matter.
+    """
+    import numpy as np
+
+    rows = [
+        (
+            kline.open_timestamp_ns,
+            kline.close_timestamp_ns,
+            float(kline.open),
+            float(kline.high),
+            float(kline.low),
+            float(kline.close),
+            float(kline.volume),
+        )
+        for kline in klines
+    ]
+    return np.array(rows, dtype=list(KLINE_FIELDS))
+
+
+class KlineHistory:
+    """
+    Keeps a local, append-only copy of each asset's k-lines and only downloads
+    the candles it is missing.
+
+    Each asset is one ``.npy`` file of :data:`KLINE_FIELDS` rows sorted by
+    ``open_timestamp_ns``, stored per market-data URL and read back memory-mapped.
+    Requires the ``history`` extra (NumPy, and pandas for :meth:`to_dataframe`).
+
+    Usage example::
+
+        history = KlineHistory(market_data_client)
+        candles = await history.sync(asset_id, start_ns=start)
+        frame = history.to_dataframe(asset_id)
+
+    Args:
+        client: The market-data client to download with.
+        cache_dir: Root directory of the local files.
+        page_size: Klines requested per page.
+        concurrency: Maximum number of page requests in flight.
+    """
+
+    def __init__(
+        self,
+        client: "MarketDataClient",
+        cache_dir: Path = DEFAULT_KLINE_CACHE_DIR,
+        *,
+        page_size: int = DEFAULT_KLINE_PAGE_SIZE,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ):
+        self.client = client
+        self.page_size = page_size
+        self.concurrency = concurrency
+        host = sha256(client._settings.base_url.encode("utf-8")).hexdigest()[:12]
+        self._dir = cache_dir / host
+
+    def path(self, asset_id: AssetIdentifier | str) -> Path:
+        """The file holding ``asset_id``'s klines."""
+        return self._dir / f"{asset_id}.npy"
+
+    def load(self, asset_id: AssetIdentifier | str) -> "np.ndarray":
+        """
+        The stored klines for ``asset_id`` (memory-mapped), oldest first.
+        Empty when nothing has been synced yet.
+        """
+        import numpy as np
+
+        path = self.path(asset_id)
+        if not path.is_file():
+            return np.empty(0, dtype=list(KLINE_FIELDS))
+
+        return np.load(path, mmap_mode="r")
+
+    async def sync(
+        self, asset_id: AssetIdentifier | str, *, start_ns: int | None = None
+    ) -> "np.ndarray":
+        """
+        Download the klines missing locally and return the full history.
+
+        Fetches the candles newer than the newest stored one and, when
+        ``start_ns`` is before the oldest stored candle, backfills the older
+        ones via ``end_timestamp_ns``. The newest stored candle is always
+        re-fetched, since it may have been still open when saved.
+
+        Args:
+            asset_id: The asset to sync.
+            start_ns: Oldest open timestamp to return; everything available when omitted.
+
+        Returns:
+            The merged klines from ``start_ns`` on, oldest first. The file keeps
+            every stored candle, including older ones.
+        """
+        import numpy as np
+
+        if isinstance(asset_id, str):
+            asset_id = AssetIdentifier(asset_id)
+
+        stored = np.array(self.load(asset_id))
+        if len(stored) == 0:
+            fresh = await self._fetch(asset_id, stop_ns=start_ns)
+        else:
+            oldest = int(stored["open_timestamp_ns"][0])
+            newest = int(stored["open_timestamp_ns"][-1])
+            parts = [await self._fetch(asset_id, stop_ns=newest)]
+            if start_ns is None or start_ns < oldest:
+                parts.append(await self._fetch(asset_id, stop_ns=start_ns, end_ns=oldest))
+
+            fresh = np.concatenate(parts)
+
+        merged = _merge(fresh, stored)
+        self._save(asset_id, merged)
+        if start_ns is not None:
+            # Only the returned view is trimmed; older stored candles are kept.
+            merged = merged[merged["open_timestamp_ns"] >= start_ns]
+
+        return merged
+
+    def to_dataframe(self, asset_id: AssetIdentifier | str) -> "pd.DataFrame":
+        """The stored klines as a ``pandas.DataFrame`` indexed by open time.
+
+        Requires ``pandas`` (``pip install tpluspy[history]``).
+        """
+        import pandas as pd
+
+        frame = pd.DataFrame(self.load(asset_id))
+        frame.index = pd.to_datetime(frame.pop("open_timestamp_ns"), unit="ns", utc=True)
+        frame.index.name = "open_time"
+        return frame
+
+    async def _fetch(
+        self, asset_id: AssetIdentifier, *, stop_ns: int | None, end_ns: int | None = None
+    ) -> "np.ndarray":
+        # Pages are served newest first, so stop at the first candle at or before `stop_ns`.
+        klines: list[KlineUpdate] = []
+        stream = self.client.iter_klines(
+            asset_id, self.page_size, end_ns, concurrency=self.concurrency
+        )
+        async with aclosing(stream):
+            async for kline in stream:
+                klines.append(kline)
+                if stop_ns is not None and kline.open_timestamp_ns <= stop_ns:
+                    break
+
+        return klines_to_array(klines)
+
+    def _save(self, asset_id: AssetIdentifier, klines: "np.ndarray") -> None:
+        import numpy as np
+
+        path = self.path(asset_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+        np.save(tmp, klines)
+        tmp.replace(path)
+
+
+def _merge(fresh: "np.ndarray", stored: Any) -> "np.ndarray":
+    import numpy as np
+
+    # `np.unique` keeps the first occurrence, so freshly fetched candles win.
+    combined = np.concatenate([fresh, stored])
+    _, index = np.unique(combined["open_timestamp_ns"], return_index=True)
+    return combined[index]
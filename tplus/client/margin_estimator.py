@@ -0,0 +1,192 @@
+"""Local pre-trade margin estimates, calibrated from the OMS margin endpoints."""
+
+from decimal import Decimal
+from typing import NamedTuple
+
+from tplus.model.asset_identifier import AssetIdentifier
+from tplus.model.user_margin import AccountMarginInfo, PositionSide, UserMarginInfo
+from tplus.model.user_simulated_margin import UserSimulatedMargin
+
+DEFAULT_IM_RATE = Decimal("0.1")
+DEFAULT_MM_RATIO = Decimal("0.5")
+DEFAULT_SIMULATION_BUFFER = Decimal("0.1")
+
+_ZERO = Decimal(0)
+
+
+class MarginEstimate(NamedTuple):
+    """Projected margin state of one sub-account after a hypothetical fill."""
+
+    account_equity: Decimal
+    available_margin: Decimal
+    """Projected IM surplus."""
+
+    mm_surplus: Decimal
+    """Projected maintenance-margin surplus."""
+
+    margin_impact: Decimal
+    """Change in required initial margin; negative when the fill reduces exposure."""
+
+    position_size: Decimal
+    """Signed size of the position after the fill (negative when short)."""
+
+    is_solvent: bool
+    """Whether the projected IM surplus is non-negative."""
+
+    needs_simulation: bool
+    """
+    Whether the estimate is too close to a threshold to trust, so the order
+    should be checked with :meth:`OrderBookClient.init_margin_simulate`.
+    """
+
+
+def _asset_key(asset_id: AssetIdentifier | str) -> str:
+    # The margin endpoints name assets by variant (``"Index:1"``), while an
+    # ``AssetIdentifier`` prints as the bare value (``"1"``).
+    kind, sep, value = str(asset_id).partition(":")
+    return value if sep and kind.isalpha() else kind
+
+
+class _Position(NamedTuple):
+    size: Decimal
+    mark_price: Decimal
+
+
+class MarginEstimator:
+    """
+    Estimates IM and MM surplus after a hypothetical fill without a round-trip,
+    so only orders near a threshold need :meth:`OrderBookClient.init_margin_simulate`.
+
+    The engine's risk adjustments are not recomputed. Instead each sub-account's
+    last :class:`AccountMarginInfo` is the baseline, and the fill's effect is
+    projected with per-asset initial-margin rates (``margin / notional``) learned
+    from simulation responses via :meth:`observe`. Assets never simulated fall
+    back to the account's ``utilized_margin / notional``, then to ``default_im_rate``.
+    Maintenance requirements are projected as a fixed fraction of the initial ones,
+    also read off the account.
+
+    Sizes and prices are in the units of :class:`PositionMarginInfo`, i.e.
+    decimal amounts rather than book units.
+
+    Usage example::
+
+        estimator = MarginEstimator(await client.get_user_margin_info(include_positions=True))
+        estimate = estimator.estimate(1, asset_id, is_buy=True, size=size, price=price)
+        if estimate.needs_simulation:
+            simulated = await client.init_margin_simulate(...)
+            estimator.observe(simulated)
+
+    Args:
+        margin: The ``get_user_margin_info(include_positions=True)`` response.
+        default_im_rate: Initial-margin rate for assets with nothing to calibrate from.
+        simulation_buffer: Fraction of account equity; estimates whose IM or MM
+          surplus fall within it are flagged :attr:`MarginEstimate.needs_simulation`.
+    """
+
+    def __init__(
+        self,
+        margin: UserMarginInfo | None = None,
+        *,
+        default_im_rate: Decimal = DEFAULT_IM_RATE,
+        simulation_buffer: Decimal = DEFAULT_SIMULATION_BUFFER,
+    ):
+        self.default_im_rate = default_im_rate
+        self.simulation_buffer = simulation_buffer
+        self._accounts: dict[int, AccountMarginInfo] = {}
+        self._positions: dict[tuple[int, str], _Position] = {}
+        self._im_rates: dict[str, Decimal] = {}
+        if margin is not None:
+            self.refresh(margin)
+
+    def refresh(self, margin: UserMarginInfo) -> None:
+        """Replace the baseline with a new margin snapshot; learned rates are kept."""
+        self._accounts = dict(margin.accounts)
+        self._positions = {}
+        for index, account in self._accounts.items():
+            for position in account.positions or ():
+                size = -position.size if position.side == PositionSide.SHORT else position.size
+                mark = position.notional_value / position.size if position.size else _ZERO
+                self._positions[(index, _asset_key(position.asset_id))] = _Position(size, mark)
+
+    def observe(self, simulated: UserSimulatedMargin) -> None:
+        """Learn per-asset initial-margin rates from a simulation response."""
+        for position in simulated.positions:
+            if position.notional_value > 0:
+                rate = position.margin / position.notional_value
+                self._im_rates[_asset_key(position.asset_id)] = rate
+
+    def im_rate(self, asset_id: AssetIdentifier | str, sub_account: int | None = None) -> Decimal:
+        """The initial-margin rate used for ``asset_id``."""
+        if (rate := self._im_rates.get(_asset_key(asset_id))) is not None:
+            return rate
+
+        if sub_account is not None and (account := self._accounts.get(sub_account)) is not None:
+            positions = account.positions or ()
+            notional = sum((position.notional_value for position in positions), _ZERO)
+            if notional > 0 and account.utilized_margin > 0:
+                return account.utilized_margin / notional
+
+        return self.default_im_rate
+
+    def estimate(
+        self,
+        sub_account: int,
+        asset_id: AssetIdentifier | str,
+        is_buy: bool,
+        size: Decimal,
+        price: Decimal,
+        fee: Decimal = _ZERO,
+    ) -> MarginEstimate:
+        """
+        Project the margin state of ``sub_account`` after filling an order.
+
+        Args:
+            sub_account: The sub-account the order trades on.
+            asset_id: The asset traded.
+            is_buy: ``True`` for a buy.
+            size: The fill size (positive).
+            price: The fill price.
+            fee: The trading fee charged, in USD.
+
+        Returns:
+            The projected :class:`MarginEstimate`.
+
+        Raises:
+            KeyError: When there is no margin snapshot for ``sub_account``.
+        """
+        account = self._accounts[sub_account]
+        asset = _asset_key(asset_id)
+        held = self._positions.get((sub_account, asset), _Position(_ZERO, price))
+        mark = held.mark_price or price
+        signed = size if is_buy else -size
+        new_size = held.size + signed
+
+        # The fill is booked at ``price`` but valued at the mark.
+        pnl = (mark - price) * signed - fee
+        margin_impact = self.im_rate(asset, sub_account) * (abs(new_size) - abs(held.size)) * mark
+
+        equity = account.account_equity + pnl
+        available = account.available_margin + pnl - margin_impact
+        mm_surplus = (
+            account.maintenance_margin_surplus + pnl - margin_impact * self._mm_ratio(account)
+        )
+        buffer = self.simulation_buffer * max(equity, _ZERO)
+        return MarginEstimate(
+            account_equity=equity,
+            available_margin=available,
+            mm_surplus=mm_surplus,
+            margin_impact=margin_impact,
+            position_size=new_size,
+            is_solvent=available >= 0,
+            needs_simulation=available < buffer or mm_surplus < buffer,
+        )
+
+    def _mm_ratio(self, account: AccountMarginInfo) -> Decimal:
+        # Equity minus each surplus is (roughly) that requirement, so their
+        # ratio is how much of the initial requirement maintenance needs.
+        initial = account.account_equity - account.available_margin
+        maintenance = account.account_equity - account.maintenance_margin_surplus
+        if initial <= 0 or maintenance < 0:
+            return DEFAULT_MM_RATIO
+
+        return min(maintenance / initial, Decimal(1))
@@ -0,0 +1,195 @@
+"""Market metadata (price/quantity decimals) cache shared by order builders."""
+
+import json
+import os
+import time
+from collections.abc import Callable
+from hashlib import sha256
+from pathlib import Path
+
+from tplus.model.asset_identifier import AssetIdentifier
+from tplus.model.market import Market
+
+DEFAULT_MARKET_TTL = 3_600.0
+DEFAULT_SAVE_INTERVAL = 5.0
+VERSION = 1
+
+
+class MarketCache:
+    """
+    Caches :class:`Market` descriptions per asset, with a time-to-live and an
+    optional on-disk copy so new processes start warm.
+
+    Args:
+        ttl: Seconds before an entry is re-fetched. ``None`` never expires.
+        cache_dir: Directory to persist markets in (one file per OMS URL).
+            Nothing is written when omitted.
+        save_interval: Minimum seconds between two writes of the cache file;
+            markets cached in between are written by the next :meth:`save`.
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = DEFAULT_MARKET_TTL,
+        *,
+        cache_dir: Path | None = None,
+        save_interval: float = DEFAULT_SAVE_INTERVAL,
+    ):
+        self.ttl = ttl
+        self.save_interval = save_interval
+        self._cache_dir = cache_dir
+        self._entries: dict[str, tuple[Market, float]] = {}
+        self._hooks: list[Callable[[str | None], None]] = []
+        self._loaded: set[str] = set()
+        self._dirty = False
+        self._saved_at: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, asset_id: AssetIdentifier | str) -> Market | None:
+        """
+        The cached market for ``asset_id``, or ``None`` when missing or expired.
+        """
+        key = _cache_key(asset_id)
+        if (entry := self._entries.get(key)) is None:
+            return None
+
+        market, fetched_at = entry
+        if self.ttl is not None and time.time() - fetched_at > self.ttl:
+            del self._entries[key]
+            return None
+
+        return market
+
+    def set(
+        self,
+        market: Market,
+        fetched_at: float | None = None,
+        *,
+        asset_id: AssetIdentifier | str | None = None,
+    ) -> None:
+        """
+        Cache ``market``, fetched at ``fetched_at`` (epoch seconds, default now).
+
+        Args:
+            market: The market to cache.
+            fetched_at: When the market was fetched.
+            asset_id: The asset the market was requested by, used as the key
+                :meth:`get` looks it up with. Defaults to ``market.asset_id``.
+                Both are normalized, so ``"200"`` and ``AssetIdentifier("200")``
+                (or two spellings of one address) share an entry.
+        """
+        key = _cache_key(market.asset_id if asset_id is None else asset_id)
+        self._entries[key] = (market, time.time() if fetched_at is None else fetched_at)
+        self._dirty = True
+
+    def invalidate(self, asset_id: AssetIdentifier | str | None = None) -> None:
+        """
+        Drop ``asset_id`` (or every market when omitted) and notify the hooks.
+        """
+        key = None if asset_id is None else _cache_key(asset_id)
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+        for hook in list(self._hooks):
+            hook(key)
+
+    def on_invalidate(self, hook: Callable[[str | None], None]) -> Callable[[], None]:
+        """
+        Call ``hook`` with the invalidated asset id (``None`` for all markets),
+        e.g. to rebuild quote templates that captured stale decimals.
+
+        Returns:
+            A callable that unregisters the hook.
+        """
+        self._hooks.append(hook)
+
+        def unregister() -> None:
+            if hook in self._hooks:
+                self._hooks.remove(hook)
+
+        return unregister
+
+    def load(self, base_url: str) -> None:
+        """
+        Merge the markets persisted for ``base_url``, once per URL. Unreadable
+        or outdated files are ignored.
+        """
+        if self._cache_dir is None or base_url in self._loaded:
+            return
+
+        self._loaded.add(base_url)
+        path = cache_path(self._cache_dir, base_url)
+        if not path.is_file():
+            return
+
+        try:
+            blob = json.loads(path.read_text())
+            if blob.get("version") != VERSION or blob.get("base_url") != base_url:
+                return
+
+            for item in blob["markets"]:
+                market = Market.model_validate(item["market"])
+                key = _cache_key(item.get("asset_id", market.asset_id))
+                if key not in self._entries:
+                    self._entries[key] = (market, float(item["fetched_at"]))
+
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return
+
+    def save(self, base_url: str, *, force: bool = False) -> None:
+        """
+        Persist the cached markets for ``base_url``, if a ``cache_dir`` is set.
+
+        Nothing is written when no market changed since the last save, or when
+        the last write was less than ``save_interval`` seconds ago, so a burst
+        of fetches costs one write. Pass ``force`` to flush regardless, e.g.
+        when closing the client.
+        """
+        if self._cache_dir is None or not self._dirty:
+            return
+
+        now = time.monotonic()
+        if not force and self._saved_at is not None and now - self._saved_at < self.save_interval:
+            return
+
+        self._dirty = False
+        self._saved_at = now
+        blob = {
+            "version": VERSION,
+            "base_url": base_url,
+            "markets": [
+                {
+                    "asset_id": key,
+                    "market": market.model_dump(mode="json"),
+                    "fetched_at": fetched_at,
+                }
+                for key, (market, fetched_at) in self._entries.items()
+            ],
+        }
+        try:
+            path = cache_path(self._cache_dir, base_url)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(blob))
+            tmp.replace(path)
+        except OSError:
+            pass
+
+
+def _cache_key(asset_id: AssetIdentifier | str) -> str:
+    if isinstance(asset_id, AssetIdentifier):
+        return str(asset_id)
+
+    try:
+        return str(AssetIdentifier(asset_id))
+    except ValueError:
+        return asset_id
+
+
+def cache_path(cache_dir: Path, base_url: str) -> Path:
+    host = sha256(base_url.encode("utf-8")).hexdigest()[:12]
+    return cache_dir / f"markets-{host}.json"
@@ -1,25 +1,59 @@
 """Client for the `market-data-service` (public market data + per-user endpoints)."""
 
-from collections.abc import AsyncIterator
+import asyncio
+import contextlib
+import heapq
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
 from typing import TYPE_CHECKING, Any
 
 from tplus.client.base import BaseClient
+from tplus.client.paginate import DEFAULT_PAGE_CONCURRENCY, paginate
 from tplus.model.asset_identifier import AssetIdentifier
 
 if TYPE_CHECKING:
     from tplus.client.auth import AuthenticatedClient
     from tplus.types import UserType
-from tplus.model.klines import KlinesPage, KlineUpdate, parse_kline_update, parse_klines_page
-from tplus.model.orderbook import OrderBook, OrderBookDiff
+from tplus.model.klines import (
+    KlinesPage,
+    KlineUpdate,
+    construct_kline_update,
+    parse_kline_update,
+    parse_klines_page,
+)
+from tplus.model.orderbook import (
+    CompactDepth,
+    OrderBook,
+    OrderBookDiff,
+    construct_orderbook_diff,
+    merge_orderbook_diffs,
+)
+from tplus.model.stream import StreamResynced
 from tplus.model.trades import (
     Trade,
     TradeEvent,
+    construct_trade,
+    construct_trade_event,
     parse_single_trade,
     parse_trade_event,
     parse_trades,
 )
 
 DEFAULT_BASE_URL = "http://localhost:8011"
+MAX_PENDING_DIFFS = 1_000
+
+
+def _depth_conflate_key(item: Any) -> str | None:
+    # All diffs of one stream conflate together; resync markers do not.
+    return "diff" if isinstance(item, OrderBookDiff) else None
+
+
+def _kline_conflate_key(item: Any) -> tuple[int, ...] | None:
+    # Each message is a list of candles for the stream's asset; a newer message
+    # for the same candles replaces the buffered one.
+    if isinstance(item, list) and item and all(isinstance(k, KlineUpdate) for k in item):
+        return tuple(k.open_timestamp_ns for k in item)
+
+    return None
 
 
 def _pagination(page: int | None, limit: int | None) -> dict[str, Any]:
@@ -33,6 +67,179 @@ def _pagination(page: int | None, limit: int | None) -> dict[str, Any]:
     return params
 
 
+class _BookSide:
+    """Price levels for one side of a book.
+
+    Levels live in a dict for O(1) quantity lookups. A heap of prices (negated
+    for bids) tracks the best level: adding a level is O(log n), removing one
+    only drops it from the dict, and stale heap entries are discarded lazily
+    when they reach the top, so :meth:`best` is amortized O(log n). Listing the
+    top ``depth`` levels is O(n log depth).
+
+    Args:
+        descending: ``True`` for bids (best is the highest price).
+    """
+
+    __slots__ = ("_levels", "_heap", "_sign")
+
+    def __init__(self, descending: bool = False) -> None:
+        self._levels: dict[float, float] = {}
+        self._heap: list[float] = []
+        self._sign = -1.0 if descending else 1.0
+
+    def __len__(self) -> int:
+        return len(self._levels)
+
+    def clear(self) -> None:
+        self._levels.clear()
+        self._heap.clear()
+
+    def set(self, price: float, quantity: float) -> None:
+        """Set the quantity at ``price``; a zero quantity removes the level."""
+        if quantity <= 0:
+            self._levels.pop(price, None)
+            return
+
+        if price not in self._levels:
+            heapq.heappush(self._heap, self._sign * price)
+            if len(self._heap) > 2 * len(self._levels) + 64:
+                # Mostly stale entries: rebuild instead of letting the heap grow.
+                self._heap = [self._sign * level for level in self._levels]
+                self._heap.append(self._sign * price)
+                heapq.heapify(self._heap)
+
+        self._levels[price] = quantity
+
+    def best(self) -> tuple[float, float] | None:
+        heap, levels = self._heap, self._levels
+        while heap:
+            price = self._sign * heap[0]
+            if (quantity := levels.get(price)) is not None:
+                return price, quantity
+
+            heapq.heappop(heap)
+
+        return None
+
+    def levels(self, depth: int | None = None) -> list[list[float]]:
+        """Levels as ``[price, quantity]``, best first."""
+        if depth is None:
+            prices = sorted(self._levels, reverse=self._sign < 0)
+        elif self._sign < 0:
+            prices = heapq.nlargest(depth, self._levels)
+        else:
+            prices = heapq.nsmallest(depth, self._levels)
+
+        return [[price, self._levels[price]] for price in prices]
+
+
+class LocalOrderBook:
+    """An L2 order book kept in sync locally from a snapshot plus depth diffs.
+
+    Diffs must arrive with consecutive ``sequence_number`` values. Diffs at or
+    below the current sequence are stale and ignored; anything that skips ahead
+    marks the book as out of sync so the caller can resync from a fresh
+    snapshot. Use :meth:`MarketDataClient.stream_orderbook` to have the client
+    drive the snapshot/diff merging for you.
+
+    Args:
+        asset_id: The asset the book belongs to.
+    """
+
+    def __init__(self, asset_id: AssetIdentifier) -> None:
+        self.asset_id = asset_id
+        self.sequence_number = 0
+        self.synced = False
+        self._bids = _BookSide(descending=True)
+        self._asks = _BookSide()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} {self.asset_id} seq={self.sequence_number} "
+            f"bid={self.best_bid} ask={self.best_ask}>"
+        )
+
+    @property
+    def best_bid(self) -> tuple[float, float] | None:
+        """Highest bid as ``(price, quantity)``, or ``None`` if the side is empty."""
+        return self._bids.best()
+
+    @property
+    def best_ask(self) -> tuple[float, float] | None:
+        """Lowest ask as ``(price, quantity)``, or ``None`` if the side is empty."""
+        return self._asks.best()
+
+    @property
+    def spread(self) -> float | None:
+        """Best ask minus best bid, or ``None`` if either side is empty."""
+        bid, ask = self.best_bid, self.best_ask
+        if bid is None or ask is None:
+            return None
+
+        return ask[0] - bid[0]
+
+    def bids(self, depth: int | None = None) -> list[list[float]]:
+        """Bid levels as ``[price, quantity]``, best (highest) first."""
+        return self._bids.levels(depth)
+
+    def asks(self, depth: int | None = None) -> list[list[float]]:
+        """Ask levels as ``[price, quantity]``, best (lowest) first."""
+        return self._asks.levels(depth)
+
+    def apply_snapshot(self, snapshot: OrderBook) -> None:
+        """Replace the book contents with ``snapshot`` and mark it as synced."""
+        self._bids.clear()
+        self._asks.clear()
+        for price, quantity in snapshot.bids:
+            self._bids.set(price, quantity)
+
+        for price, quantity in snapshot.asks:
+            self._asks.set(price, quantity)
+
+        self.sequence_number = snapshot.sequence_number
+        self.synced = True
+
+    def apply_diff(self, diff: OrderBookDiff) -> bool:
+        """Apply ``diff`` to the book.
+
+        Args:
+            diff: The depth diff. Levels with a zero quantity are removed.
+
+        Returns:
+            ``True`` if the book is still in sync (the diff was applied or was
+            stale), ``False`` if the diff revealed a sequence gap or the book
+            was never synced.
+        """
+        if not self.synced:
+            return False
+
+        if diff.sequence_number <= self.sequence_number:
+            return True
+
+        first = diff.sequence_number
+        if diff.first_sequence_number is not None:
+            first = diff.first_sequence_number
+
+        if first > self.sequence_number + 1:
+            self.synced = False
+            return False
+
+        for price, quantity in diff.bids:
+            self._bids.set(price, quantity)
+
+        for price, quantity in diff.asks:
+            self._asks.set(price, quantity)
+
+        self.sequence_number = diff.sequence_number
+        return True
+
+    def to_orderbook(self, depth: int | None = None) -> OrderBook:
+        """Export the current state as an :class:`OrderBook` model."""
+        return OrderBook(
+            bids=self.bids(depth), asks=self.asks(depth), sequence_number=self.sequence_number
+        )
+
+
 class MarketDataClient(BaseClient):
     """Klines, order-book depth, public trades and 24h tickers (REST + WS streams)."""
 
@@ -75,6 +282,16 @@ class MarketDataClient(BaseClient):
         except TypeError as err:
             raise ValueError(f"Could not parse order book snapshot: {response}") from err
 
+    async def get_orderbook_snapshot_compact(
+        self, asset_id: AssetIdentifier, price_decimals: int, quantity_decimals: int
+    ) -> CompactDepth:
+        """Current order-book snapshot for `asset_id` as integer-scaled array columns."""
+        response = await self._request("GET", f"/marketdepth/{asset_id}", requires_auth=False)
+        if not isinstance(response, dict):
+            raise ValueError(f"Invalid response for order book snapshot: {response}")
+
+        return CompactDepth.from_payload(response, price_decimals, quantity_decimals)
+
     async def get_klines(
         self,
         asset_id: AssetIdentifier,
@@ -95,6 +312,21 @@ class MarketDataClient(BaseClient):
 
         return parse_klines_page(response)
 
+    def iter_klines(
+        self,
+        asset_id: AssetIdentifier,
+        limit: int | None = None,
+        end_timestamp_ns: int | None = None,
+        *,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> AsyncGenerator[KlineUpdate, None]:
+        """Every k-line for `asset_id`, fetching pages concurrently (see `paginate`)."""
+
+        async def fetch(page: int) -> KlinesPage:
+            return await self.get_klines(asset_id, page, limit, end_timestamp_ns)
+
+        return paginate(fetch, lambda page: page.items, concurrency=concurrency)
+
     async def get_ticker(self, asset_id: AssetIdentifier) -> dict[str, Any]:
         """24h ticker for `asset_id`."""
         response = await self._request("GET", f"/ticker/{asset_id}", requires_auth=False)
@@ -133,27 +365,140 @@ class MarketDataClient(BaseClient):
 
         return parse_trades(response)
 
-    async def stream_finalized_trades(self) -> AsyncIterator[Trade]:
+    async def stream_finalized_trades(self) -> AsyncIterator[Trade | StreamResynced]:
         """Confirmed/finalized trades."""
-        async for trade in self._stream_ws("/trades", parse_single_trade, requires_auth=False):
+        parser = construct_trade if self._settings.trusted_streams else parse_single_trade
+        async for trade in self._stream_ws("/trades", parser, requires_auth=False):
             yield trade
 
-    async def stream_all_trades(self) -> AsyncIterator[TradeEvent]:
+    async def stream_all_trades(self) -> AsyncIterator[TradeEvent | StreamResynced]:
         """Every trade event, including pending and rolled-back states."""
-        async for event in self._stream_ws(
-            "/trades/events", parse_trade_event, requires_auth=False
-        ):
+        parser = construct_trade_event if self._settings.trusted_streams else parse_trade_event
+        async for event in self._stream_ws("/trades/events", parser, requires_auth=False):
             yield event
 
-    async def stream_depth(self, asset_id: AssetIdentifier) -> AsyncIterator[OrderBookDiff]:
+    async def stream_depth(
+        self, asset_id: AssetIdentifier
+    ) -> AsyncIterator[OrderBookDiff | StreamResynced]:
         """Order-book diff updates for `asset_id`."""
         path = f"/marketdepth/diff/{asset_id}"
-        async for diff in self._stream_ws(path, lambda d: OrderBookDiff(**d), requires_auth=False):
+        parser: Callable[[Any], OrderBookDiff] = (
+            construct_orderbook_diff
+            if self._settings.trusted_streams
+            else lambda d: OrderBookDiff(**d)
+        )
+        async for diff in self._stream_ws(
+            path,
+            parser,
+            requires_auth=False,
+            conflate_key=_depth_conflate_key,
+            conflate=merge_orderbook_diffs,
+        ):
+            yield diff
+
+    async def stream_depth_compact(
+        self, asset_id: AssetIdentifier, price_decimals: int, quantity_decimals: int
+    ) -> AsyncIterator[CompactDepth | StreamResynced]:
+        """Order-book diffs for `asset_id` parsed into integer-scaled array columns.
+
+        A single :class:`CompactDepth` is refilled in place for every message,
+        so consume (or copy out of) each yielded value before advancing.
+        """
+        depth = CompactDepth(price_decimals, quantity_decimals)
+        path = f"/marketdepth/diff/{asset_id}"
+        # Never buffered: the same ``CompactDepth`` instance is refilled per message.
+        async for diff in self._stream_ws(path, depth.fill, requires_auth=False, buffered=False):
             yield diff
 
-    async def stream_klines(self, asset_id: AssetIdentifier) -> AsyncIterator[KlineUpdate]:
-        """Candlestick (kline) updates for `asset_id`."""
+    async def stream_orderbook(
+        self, asset_id: AssetIdentifier, *, book: LocalOrderBook | None = None
+    ) -> AsyncIterator[LocalOrderBook]:
+        """A :class:`LocalOrderBook` for `asset_id`, yielded after every applied diff.
+
+        The book is seeded from :meth:`get_orderbook_snapshot` once the diff
+        stream is open, and re-seeded whenever a sequence gap is detected. Each
+        resync fetches one snapshot in the background; diffs received meanwhile
+        are buffered and replayed on top of it. After a managed stream reconnects
+        (see ``ClientSettings.reconnect_streams``) the book is re-seeded as well.
+        """
+        book = book or LocalOrderBook(asset_id)
+        pending: list[OrderBookDiff] = []
+        diffs = self.stream_depth(asset_id).__aiter__()
+        next_diff: asyncio.Future | None = None
+        # At most one snapshot is in flight; diffs are buffered until it arrives.
+        snapshot: asyncio.Future | None = None
+        try:
+            while True:
+                if next_diff is None:
+                    next_diff = asyncio.ensure_future(diffs.__anext__())
+
+                waiting = {next_diff} if snapshot is None else {next_diff, snapshot}
+                await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+                if snapshot is not None and snapshot.done():
+                    fetched, snapshot = snapshot, None
+                    book.apply_snapshot(fetched.result())
+                    pending = [d for d in pending if d.sequence_number > book.sequence_number]
+                    if all(book.apply_diff(buffered) for buffered in pending):
+                        pending.clear()
+                        yield book
+                    else:
+                        # The snapshot is older than the buffered diffs; fetch a newer one.
+                        book.synced = False
+                        snapshot = asyncio.ensure_future(self.get_orderbook_snapshot(asset_id))
+
+                if not next_diff.done():
+                    continue
+
+                received, next_diff = next_diff, None
+                try:
+                    diff = received.result()
+                except StopAsyncIteration:
+                    return
+
+                if isinstance(diff, StreamResynced):
+                    book.synced = False
+                    pending.clear()
+                    continue
+
+                if book.synced:
+                    if book.apply_diff(diff):
+                        yield book
+                        continue
+
+                    self.logger.warning(
+                        "Sequence gap on %s depth stream (book at %s, diff %s); resyncing.",
+                        asset_id,
+                        book.sequence_number,
+                        diff.sequence_number,
+                    )
+                    book.synced = False
+
+                pending.append(diff)
+                if len(pending) > MAX_PENDING_DIFFS:
+                    pending = pending[-MAX_PENDING_DIFFS:]
+
+                if snapshot is None:
+                    snapshot = asyncio.ensure_future(self.get_orderbook_snapshot(asset_id))
+        finally:
+            for future in (snapshot, next_diff):
+                if future is not None:
+                    future.cancel()
+                    with contextlib.suppress(asyncio.CancelledError, Exception):
+                        await future
+
+            if (aclose := getattr(diffs, "aclose", None)) is not None:
+                await aclose()
+
+    async def stream_klines(
+        self, asset_id: AssetIdentifier
+    ) -> AsyncIterator[list[KlineUpdate] | StreamResynced]:
+        """Candlestick (kline) updates for `asset_id`, one list per stream message."""
+        parser = construct_kline_update if self._settings.trusted_streams else parse_kline_update
         async for kline in self._stream_ws(
-            f"/klines/diff/{asset_id}", parse_kline_update, requires_auth=False
+            f"/klines/diff/{asset_id}",
+            parser,
+            requires_auth=False,
+            conflate_key=_kline_conflate_key,
         ):
             yield kline
@@ -0,0 +1,150 @@
+"""Share WebSocket streams between many consumers in one process."""
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from typing import Any
+
+from tplus.model.stream import StreamLagged
+
+DEFAULT_MAX_QUEUE_SIZE = 1_000
+
+
+class _Closed:
+    def __init__(self, error: BaseException | None = None):
+        self.error = error
+
+
+class _Subscription:
+    def __init__(self, max_queue_size: int):
+        self.queue: asyncio.Queue[Any] = asyncio.Queue(max_queue_size)
+        self.dropped = 0
+
+    def put(self, item: Any) -> None:
+        if self.queue.full():
+            # Drop the oldest message so a slow consumer never blocks the others.
+            self.queue.get_nowait()
+            self.dropped += 1
+
+        self.queue.put_nowait(item)
+
+
+class _Channel:
+    def __init__(self):
+        self.subscribers: set[_Subscription] = set()
+        self.task: asyncio.Task | None = None
+
+
+class StreamMultiplexer:
+    """
+    Fan a single WebSocket stream out to any number of subscribers.
+
+    Each distinct ``(stream, *args)`` pair -- e.g.
+    ``(client.stream_depth, asset_id)`` -- is backed by one socket that is opened
+    on the first subscription and closed when the last subscriber leaves.
+    Every subscriber reads from its own bounded queue; when it falls behind the
+    oldest messages are dropped and a :class:`StreamLagged` marker is yielded
+    before the next one.
+
+    Items are shared between subscribers, so streams that refill a value in
+    place (``stream_depth_compact``) must not be multiplexed.
+
+    Usage example::
+
+        mux = StreamMultiplexer()
+        async for diff in mux.subscribe(client.stream_depth, asset_id):
+            ...
+    """
+
+    def __init__(self, *, max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE):
+        self._max_queue_size = max_queue_size
+        self._channels: dict[tuple[Any, ...], _Channel] = {}
+
+    @property
+    def active_streams(self) -> int:
+        """Number of underlying streams (sockets) currently open."""
+        return len(self._channels)
+
+    async def subscribe(
+        self, stream: Callable[..., AsyncIterator[Any]], *args: Any
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Yield items from ``stream(*args)``, sharing its socket with other subscribers.
+
+        Args:
+            stream: A client stream method, such as ``MarketDataClient.stream_depth``.
+            *args: Positional arguments for ``stream``; part of the sharing key.
+
+        Raises:
+            Exception: Whatever the underlying stream raised, re-raised in every subscriber.
+        """
+        # Stream arguments (e.g. ``AssetIdentifier``) compare by their string form.
+        key = (stream, *(f"{arg}" for arg in args))
+        channel = self._channels.get(key)
+        if channel is None:
+            channel = self._channels[key] = _Channel()
+            channel.task = asyncio.create_task(self._pump(key, channel, stream, args))
+
+        subscription = _Subscription(self._max_queue_size)
+        channel.subscribers.add(subscription)
+        try:
+            while True:
+                item = await subscription.queue.get()
+                if subscription.dropped:
+                    yield StreamLagged(dropped=subscription.dropped)
+                    subscription.dropped = 0
+
+                if isinstance(item, _Closed):
+                    if item.error is not None:
+                        raise item.error
+
+                    return
+
+                yield item
+        finally:
+            channel.subscribers.discard(subscription)
+            if not channel.subscribers:
+                self._release(key, channel)
+
+    async def close(self) -> None:
+        """
+        Close every underlying stream; active subscriptions end normally.
+        """
+        for key, channel in list(self._channels.items()):
+            self._release(key, channel)
+            for subscription in channel.subscribers:
+                subscription.put(_Closed())
+
+    async def _pump(
+        self,
+        key: tuple[Any, ...],
+        channel: _Channel,
+        stream: Callable[..., AsyncIterator[Any]],
+        args: tuple[Any, ...],
+    ) -> None:
+        closed = _Closed()
+        try:
+            async for item in stream(*args):
+                for subscription in channel.subscribers:
+                    subscription.put(item)
+
+        except Exception as err:
+            closed.error = err
+
+        if self._channels.get(key) is channel:
+            del self._channels[key]
+
+        for subscription in channel.subscribers:
+            subscription.put(closed)
+
+    def _release(self, key: tuple[Any, ...], channel: _Channel) -> None:
+        if self._channels.get(key) is channel:
+            del self._channels[key]
+
+        if channel.task is not None and not channel.task.done():
+            channel.task.cancel()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
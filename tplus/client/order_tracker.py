@@ -0,0 +1,264 @@
+"""Live index of the user's open orders, folded from the ``/orders`` event stream."""
+
+import asyncio
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from tplus.model.asset_identifier import AssetIdentifier
+from tplus.model.limit_order import LimitOrderDetails
+from tplus.model.order import (
+    OrderCancelledEvent,
+    OrderCreatedEvent,
+    OrderCreateFailedEvent,
+    OrderEvent,
+    OrderRemovedEvent,
+    OrderReplacedEvent,
+    OrderResponse,
+    OrderUpdatedEvent,
+    Side,
+)
+from tplus.model.stream import StreamResynced
+
+if TYPE_CHECKING:
+    from tplus.client.orderbook import OrderBookClient
+    from tplus.types import UserType
+
+
+class TrackedOrder:
+    """
+    The live state of one open order. Quantities and prices are in book units.
+    """
+
+    __slots__ = (
+        "order_id",
+        "asset_id",
+        "side",
+        "limit_price",
+        "quantity",
+        "filled_quantity",
+        "remaining_quantity",
+        "status",
+        "updated_ns",
+    )
+
+    def __init__(
+        self,
+        order_id: str,
+        asset_id: str,
+        side: Side,
+        limit_price: int | None,
+        quantity: int,
+        filled_quantity: int,
+        status: str,
+        updated_ns: int,
+    ):
+        self.order_id = order_id
+        self.asset_id = asset_id
+        self.side = side
+        self.limit_price = limit_price
+        self.quantity = quantity
+        self.filled_quantity = filled_quantity
+        self.remaining_quantity = max(0, quantity - filled_quantity)
+        self.status = status
+        self.updated_ns = updated_ns
+
+    def __repr__(self) -> str:
+        return (
+            f"<TrackedOrder {self.order_id} {self.asset_id} {self.side.value} "
+            f"{self.remaining_quantity}/{self.quantity} @ {self.limit_price}>"
+        )
+
+    @classmethod
+    def from_response(cls, order: OrderResponse) -> "TrackedOrder":
+        filled = int(order.confirmed_filled_quantity or 0) + int(order.pending_filled_quantity or 0)
+        return cls(
+            order.order_id,
+            str(order.base_asset),
+            order.side,
+            None if order.limit_price is None else int(order.limit_price),
+            int(order.quantity or 0),
+            filled,
+            order.status,
+            order.last_update_timestamp_ns or order.timestamp_ns,
+        )
+
+
+class OrderTracker:
+    """
+    Keeps the user's open orders up to date from :meth:`OrderBookClient.stream_orders`,
+    bootstrapping once from REST instead of polling ``get_open_orders_for_book``.
+
+    Orders are indexed by id and by ``(asset, side)``, so lookups by id and
+    remaining-quantity queries are O(1).
+
+    Usage example::
+
+        tracker = OrderTracker(client)
+        task = asyncio.create_task(tracker.run([asset_id]))
+        await tracker.ready.wait()
+        for order in tracker.orders(asset_id, "Buy"):
+            ...
+
+    Args:
+        client: The OMS client.
+        user: The user whose orders to track. Defaults to the client's default user.
+    """
+
+    def __init__(self, client: "OrderBookClient", *, user: "UserType | None" = None):
+        self.client = client
+        self.user = user
+        self.ready = asyncio.Event()
+        """Set once the REST bootstrap has been applied."""
+
+        self._orders: dict[str, TrackedOrder] = {}
+        # Insertion-ordered dicts used as sets, for O(1) removal.
+        self._books: dict[tuple[str, Side], dict[str, TrackedOrder]] = {}
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self._orders
+
+    def get(self, order_id: str) -> TrackedOrder | None:
+        """The open order ``order_id``, or ``None`` if it is not open."""
+        return self._orders.get(order_id)
+
+    def remaining_quantity(self, order_id: str) -> int:
+        """Unfilled quantity of ``order_id``; ``0`` once it is no longer open."""
+        order = self._orders.get(order_id)
+        return 0 if order is None else order.remaining_quantity
+
+    def orders(
+        self, asset_id: AssetIdentifier | str | None = None, side: Side | str | None = None
+    ) -> Iterator[TrackedOrder]:
+        """Open orders, optionally only those of ``asset_id`` and/or ``side``."""
+        if asset_id is None:
+            if side is None:
+                yield from list(self._orders.values())
+            else:
+                yield from [o for o in self._orders.values() if o.side == Side(side)]
+            return
+
+        sides = (Side.BUY, Side.SELL) if side is None else (Side(side),)
+        for book_side in sides:
+            yield from list(self._books.get((str(asset_id), book_side), {}).values())
+
+    def load(self, orders: Iterable[OrderResponse]) -> None:
+        """Add open orders from a REST snapshot."""
+        for response in orders:
+            order = TrackedOrder.from_response(response)
+            if order.remaining_quantity > 0:
+                self._add(order)
+
+    async def bootstrap(self, asset_ids: Iterable[AssetIdentifier] | None = None) -> None:
+        """
+        Replace the state with the open orders from REST.
+
+        Args:
+            asset_ids: Books to load; every market when omitted.
+        """
+        if asset_ids is None:
+            markets = await self.client.prefetch_markets()
+            asset_ids = [market.asset_id for market in markets.values()]
+
+        books = await asyncio.gather(
+            *(
+                self.client.get_open_orders_for_book(asset_id, user=self.user)
+                for asset_id in asset_ids
+            )
+        )
+        self._orders.clear()
+        self._books.clear()
+        for orders in books:
+            self.load(orders)
+
+    def apply(self, event: OrderEvent) -> TrackedOrder | None:
+        """
+        Fold one order event into the index.
+
+        Returns:
+            The affected order (also when it was just closed), if it is tracked.
+        """
+        if isinstance(event, OrderCreatedEvent):
+            order = event.user_order
+            if order.order_id in self._orders or not isinstance(order.details, LimitOrderDetails):
+                return self._orders.get(order.order_id)
+
+            tracked = TrackedOrder(
+                order.order_id,
+                str(order.base_asset),
+                order.side,
+                order.details.limit_price,
+                order.details.quantity,
+                0,
+                "Created",
+                event.book_timestamp_ns,
+            )
+            self._add(tracked)
+            return tracked
+
+        if (existing := self._orders.get(event.order_id)) is None:
+            return None
+
+        if isinstance(event, OrderUpdatedEvent):
+            existing.status = event.status
+            existing.filled_quantity = event.filled_quantity
+            existing.remaining_quantity = event.remaining_quantity
+            existing.updated_ns = event.update_timestamp_ns
+            if event.remaining_quantity <= 0:
+                self._remove(existing)
+
+        elif isinstance(event, OrderReplacedEvent):
+            existing.quantity = event.new_quantity
+            existing.limit_price = event.new_price
+            existing.remaining_quantity = max(0, event.new_quantity - existing.filled_quantity)
+
+        elif isinstance(event, OrderCancelledEvent | OrderRemovedEvent | OrderCreateFailedEvent):
+            existing.status = event.event_type
+            existing.remaining_quantity = 0
+            self._remove(existing)
+
+        return existing
+
+    async def run(self, asset_ids: Iterable[AssetIdentifier] | None = None) -> None:
+        """
+        Bootstrap and then apply order events until the stream ends.
+
+        The stream is opened before the REST snapshot is requested, and events
+        received while it loads are applied on top of it. After a reconnect
+        (:class:`StreamResynced`) the state is bootstrapped again.
+        """
+        asset_ids = None if asset_ids is None else list(asset_ids)
+        events: asyncio.Queue[OrderEvent | StreamResynced | None] = asyncio.Queue()
+
+        async def pump() -> None:
+            try:
+                async for event in self.client.stream_orders(user=self.user):
+                    events.put_nowait(event)
+            finally:
+                events.put_nowait(None)
+
+        task = asyncio.create_task(pump())
+        try:
+            await self.bootstrap(asset_ids)
+            self.ready.set()
+            while (event := await events.get()) is not None:
+                if isinstance(event, StreamResynced):
+                    await self.bootstrap(asset_ids)
+                else:
+                    self.apply(event)
+
+            # Surface the stream's error, if it failed.
+            await task
+        finally:
+            task.cancel()
+
+    def _add(self, order: TrackedOrder) -> None:
+        self._orders[order.order_id] = order
+        self._books.setdefault((order.asset_id, order.side), {})[order.order_id] = order
+
+    def _remove(self, order: TrackedOrder) -> None:
+        self._orders.pop(order.order_id, None)
+        if (book := self._books.get((order.asset_id, order.side))) is not None:
+            book.pop(order.order_id, None)
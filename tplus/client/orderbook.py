@@ -5,14 +5,18 @@ import contextlib
 import json
 import time
 import uuid
-from collections.abc import AsyncIterator, Callable
-from functools import cached_property
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import Executor
+from functools import cached_property, partial
 from typing import TYPE_CHECKING, Any
 
 import httpx
 
 from tplus.client.auth import AuthenticatedClient
+from tplus.client.market_cache import MarketCache
 from tplus.client.oms.assetregistry import AssetRegistryClient
+from tplus.client.paginate import DEFAULT_PAGE_CONCURRENCY, paginate
+from tplus.client.pipeline import DEFAULT_PIPELINE_WINDOW, OrderPipeline
 from tplus.exceptions import NotFoundError
 from tplus.model.asset_identifier import AssetIdentifier
 from tplus.model.batch_order import (
@@ -37,6 +41,7 @@ from tplus.model.order import (
     OrderOperationResponse,
     OrderResponse,
     TradeTarget,
+    construct_order_event,
     parse_order_event,
     parse_orders,
 )
@@ -47,6 +52,7 @@ from tplus.model.position import (
     parse_positions_page,
 )
 from tplus.model.settlement import TxSettlementRequest
+from tplus.model.stream import StreamResynced
 from tplus.model.trades import (
     UserTrade,
     UserTradesPage,
@@ -69,11 +75,13 @@ from tplus.model.user_solvency import (
 )
 from tplus.types import UserType
 from tplus.utils.limit_order import (
+    create_limit_order_batch_payload,
     create_limit_order_ob_request_payload,
 )
 from tplus.utils.market_order import (
     create_market_order_ob_request_payload,
 )
+from tplus.utils.quote_template import OrderIdPool, QuoteTemplate, SignedQuote
 from tplus.utils.replace_order import (
     create_replace_order_ob_request_payload,
 )
@@ -86,6 +94,14 @@ if TYPE_CHECKING:
 
     from tplus.utils.user import User
 
+# Request variants of the ``/control`` socket mapped to the response variants
+# the server answers with.
+_CONTROL_RESPONSE_VARIANTS = {
+    "CreateOrderRequest": "CreateOrderResponse",
+    "CancelOrderRequest": "CancelOrderResponse",
+    "ReplaceOrderRequest": "ReplaceOrderResponse",
+}
+
 
 def compute_remaining(order: OrderResponse) -> int:
     # Deprecated: server-side open filtering is now supported; retained for backward compatibility.
@@ -117,11 +133,12 @@ class OrderBookClient(AuthenticatedClient):
         base_url: str = "http://localhost:3032",
         *,
         use_ws_control: bool = False,
+        market_cache: MarketCache | None = None,
         **kwargs,
     ) -> None:
         super().__init__(base_url, **kwargs)
         # Cache Market details per asset to avoid repeated GET /market calls
-        self._market_cache: dict[str, Market] = {}
+        self._market_cache = market_cache if market_cache is not None else MarketCache()
         # When True, create/replace/cancel are sent via WS /control instead of HTTP
         if not isinstance(use_ws_control, bool):
             raise TypeError("use_ws_control must be a bool")
@@ -163,8 +180,13 @@ class OrderBookClient(AuthenticatedClient):
             "POST", "/market/create", json_data=message_dict, requires_auth=False
         )
 
+    @property
+    def market_cache(self) -> MarketCache:
+        """The :class:`MarketCache` backing :meth:`get_market`."""
+        return self._market_cache
+
     async def get_market(self, asset_id: AssetIdentifier) -> Market:
-        """Fetch a market description with simple per-asset caching.
+        """Fetch a market description, cached per asset (see :class:`MarketCache`).
 
         Args:
             asset_id: Asset whose market to fetch.
@@ -175,17 +197,61 @@ class OrderBookClient(AuthenticatedClient):
         Raises:
             ValueError: If the OMS response is missing required fields.
         """
-        key = str(asset_id)
-        if (cached := self._market_cache.get(key)) is not None:
+        self._market_cache.load(self._settings.base_url)
+        if (cached := self._market_cache.get(asset_id)) is not None:
             return cached
 
+        market = await self._fetch_market(asset_id)
+        self._market_cache.save(self._settings.base_url)
+        return market
+
+    async def prefetch_markets(
+        self, asset_ids: Iterable[AssetIdentifier | str] | None = None
+    ) -> dict[str, Market]:
+        """Warm the market cache so the first order on each market skips ``GET /market``.
+
+        Args:
+            asset_ids: Assets to load concurrently; only missing or expired
+                entries are fetched. When omitted, every market is loaded with
+                a single ``GET /markets``.
+
+        Returns:
+            The markets, keyed by asset id.
+        """
+        base_url = self._settings.base_url
+        self._market_cache.load(base_url)
+        if asset_ids is None:
+            response: Any = await self._request("GET", "/markets", requires_auth=False)
+            markets = [parse_market(data) for data in response or []]
+            for market in markets:
+                self._market_cache.set(market)
+
+            self._market_cache.save(base_url)
+            return {str(market.asset_id): market for market in markets}
+
+        result: dict[str, Market] = {}
+        missing: dict[str, AssetIdentifier | str] = {}
+        for asset_id in asset_ids:
+            if (cached := self._market_cache.get(asset_id)) is not None:
+                result[str(asset_id)] = cached
+            else:
+                missing[str(asset_id)] = asset_id
+
+        if missing:
+            fetched = await asyncio.gather(*(self._fetch_market(a) for a in missing.values()))
+            result.update(zip(missing, fetched, strict=True))
+            self._market_cache.save(base_url)
+
+        return result
+
+    async def _fetch_market(self, asset_id: AssetIdentifier | str) -> Market:
         response = await self._request("GET", f"/market/{asset_id}", requires_auth=False)
 
         if "asset_id" not in response:
             raise ValueError(f"Invalid market data: {response}")
 
         market = parse_market(response)
-        self._market_cache[key] = market
+        self._market_cache.set(market, asset_id=asset_id)
         return market
 
     async def create_market_order(
@@ -355,7 +421,7 @@ class OrderBookClient(AuthenticatedClient):
         trigger: OrderTrigger | None = None,
         order_id: str | None = None,
         user: "User | None" = None,
-    ):
+    ) -> tuple[str, CreateOrderRequest]:
         user = self._resolve_user(user=user)
         asset_id_unwrapped: AssetIdentifier = asset_id  # type: ignore
         order_id = order_id or str(base64.b64encode(uuid.uuid4().bytes).decode("ascii"))
@@ -376,8 +442,59 @@ class OrderBookClient(AuthenticatedClient):
         )
         return order_id, signed_message
 
-    async def send_multiple_orders(self, create_order_requests: list[CreateOrderRequest]):
-        request = BatchCreateOrderRequest(orders=create_order_requests)
+    async def prepare_limit_order_batch(
+        self,
+        orders: list[dict[str, Any]],
+        *,
+        executor: Executor | None = None,
+        user: "User | None" = None,
+    ) -> BatchCreateOrderRequest:
+        """Build and sign many limit orders off the event loop.
+
+        Args:
+            orders: One dict per order with ``quantity``, ``price``, ``side`` and
+                ``asset_id``, plus any of ``order_id``, ``time_in_force``,
+                ``target``, ``trigger``, ``max_trading_fees_rate`` and
+                ``reduce_only``.
+            executor: Executor to sign on. Use a ``ProcessPoolExecutor`` to sign
+                in parallel; by default orders are signed sequentially on the
+                loop's default thread pool.
+            user: Optional signer. Defaults to the client's default user.
+
+        Returns:
+            A :class:`BatchCreateOrderRequest` for :meth:`send_multiple_orders`.
+        """
+        user = self._resolve_user(user=user)
+        markets: dict[str, Market] = {}
+        payloads: list[dict[str, Any]] = []
+        for order in orders:
+            order = dict(order)
+            asset_id = order.pop("asset_id")
+            if (market := markets.get(str(asset_id))) is None:
+                market = markets[str(asset_id)] = await self.get_market(asset_id)
+
+            order.setdefault("order_id", str(base64.b64encode(uuid.uuid4().bytes).decode("ascii")))
+            payloads.append(
+                {
+                    **order,
+                    "asset_identifier": asset_id,
+                    "book_quantity_decimals": market.book_quantity_decimals,
+                    "book_price_decimals": market.book_price_decimals,
+                }
+            )
+
+        return await asyncio.get_running_loop().run_in_executor(
+            None, partial(create_limit_order_batch_payload, payloads, user, executor=executor)
+        )
+
+    async def send_multiple_orders(
+        self, create_order_requests: list[CreateOrderRequest] | BatchCreateOrderRequest
+    ):
+        request = (
+            create_order_requests
+            if isinstance(create_order_requests, BatchCreateOrderRequest)
+            else BatchCreateOrderRequest(orders=create_order_requests)
+        )
         if self._use_ws_control:
             return await self._control_ws_send_batch(request)
         batch_order_response_data = await self._request(
@@ -397,10 +514,7 @@ class OrderBookClient(AuthenticatedClient):
         Returns:
             The :class:`OrderOperationResponse` from the OMS.
         """
-        user = self._resolve_user(user=user)
-        signed_message = create_cancel_order_ob_request_payload(
-            order_id=order_id, asset_identifier=asset_id, signer=user
-        )
+        signed_message = self.prepare_cancel_order_request(order_id, asset_id, user=user)
         self.logger.debug(f"Sending Cancel Order Request: OrderID={order_id}, Asset={asset_id}")
         if self._use_ws_control:
             payload = {"CancelOrderRequest": signed_message.model_dump()}
@@ -430,16 +544,12 @@ class OrderBookClient(AuthenticatedClient):
         Returns:
             The :class:`OrderOperationResponse` from the OMS.
         """
-        user = self._resolve_user(user=user)
-        market = await self.get_market(asset_id)
-        signed_message = create_replace_order_ob_request_payload(
-            original_order_id=original_order_id,
-            asset_identifier=asset_id,
-            signer=user,
-            new_price=new_price,
+        signed_message = await self.prepare_replace_order_request(
+            original_order_id,
+            asset_id,
             new_quantity=new_quantity,
-            book_price_decimals=market.book_price_decimals,
-            book_quantity_decimals=market.book_quantity_decimals,
+            new_price=new_price,
+            user=user,
         )
         self.logger.debug(
             f"Sending Replace Order for original OrderID {original_order_id} (Asset {asset_id}): "
@@ -456,6 +566,117 @@ class OrderBookClient(AuthenticatedClient):
         )
         return OrderOperationResponse.model_validate(resp)
 
+    def prepare_cancel_order_request(
+        self, order_id: str, asset_id: AssetIdentifier, user: "User | None" = None
+    ):
+        user = self._resolve_user(user=user)
+        return create_cancel_order_ob_request_payload(
+            order_id=order_id, asset_identifier=asset_id, signer=user
+        )
+
+    async def prepare_replace_order_request(
+        self,
+        original_order_id: str,
+        asset_id: AssetIdentifier,
+        new_quantity: int | None = None,
+        new_price: int | None = None,
+        user: "User | None" = None,
+    ):
+        user = self._resolve_user(user=user)
+        market = await self.get_market(asset_id)
+        return create_replace_order_ob_request_payload(
+            original_order_id=original_order_id,
+            asset_identifier=asset_id,
+            signer=user,
+            new_price=new_price,
+            new_quantity=new_quantity,
+            book_price_decimals=market.book_price_decimals,
+            book_quantity_decimals=market.book_quantity_decimals,
+        )
+
+    def pipeline(
+        self, *, window: int = DEFAULT_PIPELINE_WINDOW, timeout: float | None = None
+    ) -> OrderPipeline:
+        """Create an :class:`OrderPipeline` that keeps up to ``window`` control
+        requests in flight on the ``/control`` WebSocket.
+
+        Requires ``use_ws_control=True``. ``timeout`` defaults to the
+        ``control_timeout`` setting.
+        """
+        if timeout is None:
+            timeout = self._settings.control_timeout
+
+        return OrderPipeline(self, window=window, timeout=timeout)
+
+    async def quote_template(
+        self,
+        asset_id: AssetIdentifier | str,
+        side: str,
+        *,
+        time_in_force: GTC | GTD | IOC | None = None,
+        target: TradeTarget | None = None,
+        max_trading_fees_rate: int | None = None,
+        reduce_only: bool = False,
+        order_ids: OrderIdPool | None = None,
+        user: "User | None" = None,
+    ) -> QuoteTemplate:
+        """Create a :class:`QuoteTemplate` for repeatedly quoting one market and side.
+
+        The market's decimals are fetched (and cached) once here, so building
+        quotes from the template never touches the network. Send the results
+        with :meth:`send_quote` or :meth:`OrderPipeline.submit_quote`.
+
+        Args:
+            asset_id: Asset to quote.
+            side: ``"Buy"`` or ``"Sell"``.
+            time_in_force: Defaults to GTC if omitted.
+            target: Optional sub-account / collateral target for the trade.
+            max_trading_fees_rate: Optional maximum trading fee rate.
+            reduce_only: Whether the orders may only reduce a position.
+            order_ids: Optional :class:`OrderIdPool` shared between templates.
+
+        Returns:
+            The :class:`QuoteTemplate`.
+        """
+        if isinstance(asset_id, str):
+            asset_id = AssetIdentifier(asset_id)
+        user = self._resolve_user(user=user)
+        market = await self.get_market(asset_id)
+        return QuoteTemplate(
+            user,
+            asset_id,
+            side,
+            market.book_price_decimals,
+            market.book_quantity_decimals,
+            time_in_force=time_in_force,
+            target=target,
+            max_trading_fees_rate=max_trading_fees_rate,
+            reduce_only=reduce_only,
+            order_ids=order_ids,
+        )
+
+    async def send_quote(self, quote: SignedQuote) -> OrderOperationResponse:
+        """Send a quote built by a :class:`QuoteTemplate`.
+
+        Args:
+            quote: The signed quote.
+
+        Returns:
+            The :class:`OrderOperationResponse` from the OMS.
+        """
+        if self._use_ws_control:
+            key = self._response_key("CreateOrderRequest", quote.asset_id, quote.order_id)
+            fut = await self._control_ws_submit_frame(key, quote.control_frame())
+            try:
+                ws_resp = await asyncio.wait_for(fut, timeout=self._settings.control_timeout)
+            finally:
+                self._pending_control.pop(key, None)
+            return self._extract_operation_response(ws_resp)
+        resp = await self._request(
+            "POST", "/orders/create", json_data=self._codec.loads(quote.request_json())
+        )
+        return OrderOperationResponse.model_validate(resp)
+
     def parse_user_trades(self, trades_data: list[dict[str, Any]]) -> list[UserTrade]:
         """Parse user trade data into UserTrade objects."""
         return parse_user_trades(trades_data)
@@ -508,6 +729,23 @@ class OrderBookClient(AuthenticatedClient):
             return parse_user_trades_page([])
         return parse_user_trades_page(data)
 
+    def iter_user_trades(
+        self,
+        *,
+        asset_id: AssetIdentifier | None = None,
+        limit: int | None = None,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        user: UserType | None = None,
+    ) -> AsyncIterator[UserTrade]:
+        """Every user trade, newest first, fetching pages concurrently (see `paginate`)."""
+
+        async def fetch(page: int) -> UserTradesPage:
+            return await self.get_user_trades_page(
+                asset_id=asset_id, page=page, limit=limit, user=user
+            )
+
+        return paginate(fetch, lambda page: page.trades, concurrency=concurrency)
+
     async def get_user_position_for_asset(
         self,
         asset_id: AssetIdentifier,
@@ -563,6 +801,23 @@ class OrderBookClient(AuthenticatedClient):
             return parse_positions_page([])
         return parse_positions_page(data)
 
+    def iter_user_positions(
+        self,
+        *,
+        sub_account: int | None = None,
+        limit: int | None = None,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        user: UserType | None = None,
+    ) -> AsyncIterator[PositionResponse]:
+        """Every open position, fetching pages concurrently (see `paginate`)."""
+
+        async def fetch(page: int) -> UserPositionsPage:
+            return await self.get_user_positions_page(
+                sub_account=sub_account, page=page, limit=limit, user=user
+            )
+
+        return paginate(fetch, lambda page: page.positions, concurrency=concurrency)
+
     async def get_user_orders(
         self, user: UserType | None = None, *, page: int | None = None, limit: int | None = None
     ) -> tuple[list[OrderResponse], dict[str, Any]]:
@@ -620,7 +875,7 @@ class OrderBookClient(AuthenticatedClient):
                 params_dict["open_only"] = bool(open_only)
         self.logger.debug(f"Getting Orders for user {public_key}, asset {asset_id}")
         try:
-            response_data = await self._request("GET", endpoint, params=params_dict)
+            response_data = await self._request("GET", endpoint, params=params_dict, user=user)
 
             if isinstance(response_data, dict) and "error" in response_data:
                 self.logger.error(
@@ -667,20 +922,50 @@ class OrderBookClient(AuthenticatedClient):
         return parsed_orders
 
     async def get_open_orders_for_book(
-        self, asset_id: AssetIdentifier, *, limit: int = 1000, max_pages: int = 50
+        self,
+        asset_id: AssetIdentifier,
+        *,
+        limit: int = 1000,
+        max_pages: int = 50,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        user: UserType | None = None,
     ) -> list[OrderResponse]:
         """Return open orders directly from server (source of truth)."""
-        page = 0
-        open_orders: list[OrderResponse] = []
-        while page < max_pages:
-            parsed = await self.get_user_orders_for_book(
-                asset_id, page=page, limit=limit, open_only=True
+        return [
+            order
+            async for order in self.iter_open_orders_for_book(
+                asset_id, limit=limit, max_pages=max_pages, concurrency=concurrency, user=user
             )
-            open_orders.extend(parsed)
-            if len(parsed) < limit:
-                break
-            page += 1
-        return open_orders
+        ]
+
+    def iter_open_orders_for_book(
+        self,
+        asset_id: AssetIdentifier,
+        *,
+        limit: int = 1000,
+        max_pages: int | None = None,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        user: UserType | None = None,
+    ) -> AsyncIterator[OrderResponse]:
+        """Stream open orders for ``asset_id``.
+
+        The endpoint returns bare pages, so once the first page comes back full
+        the following pages are fetched ``concurrency`` at a time until one is
+        short (see `paginate`).
+        """
+
+        async def fetch(page: int) -> list[OrderResponse]:
+            return await self.get_user_orders_for_book(
+                asset_id, page=page, limit=limit, open_only=True, user=user
+            )
+
+        return paginate(
+            fetch,
+            lambda page: page,
+            concurrency=concurrency,
+            page_size=limit,
+            max_pages=max_pages,
+        )
 
     # ------------------------------------------------------------------
     # Optional persistent WebSocket control channel for create/replace/cancel
@@ -721,7 +1006,7 @@ class OrderBookClient(AuthenticatedClient):
                 return
             async for message in ws:
                 try:
-                    data = json.loads(message)
+                    data = self._codec.loads(message)
                     if isinstance(data, dict) and data.get("type") in {
                         "subscriptions",
                         "ping",
@@ -782,22 +1067,52 @@ class OrderBookClient(AuthenticatedClient):
     async def _control_ws_send(
         self, payload: dict[str, Any], *, expected_order_id: str, timeout: float = 5.0
     ) -> dict[str, Any]:
+        key, fut = await self._control_ws_submit(payload, expected_order_id=expected_order_id)
+        try:
+            return await asyncio.wait_for(fut, timeout=timeout)
+        finally:
+            # Ensure cleanup if timed out
+            self._pending_control.pop(key, None)
+
+    async def _control_ws_submit(
+        self, payload: dict[str, Any], *, expected_order_id: str
+    ) -> tuple[str, asyncio.Future]:
+        """Send ``payload`` without waiting for the response.
+
+        Returns the pending-control key and the future the reader resolves with
+        the raw response. The caller owns removing the key from
+        ``_pending_control`` once it stops waiting.
+        """
+        key = self._control_key(payload, expected_order_id)
+        return key, await self._control_ws_submit_frame(key, self._codec.dumps(payload))
+
+    async def _control_ws_submit_frame(self, key: str, frame: str) -> asyncio.Future:
+        """Send an already-encoded control ``frame`` whose response resolves ``key``."""
         await self._ensure_control_ws()
         # If connection couldn't be established, fallback
         if not self._control_ws:
             raise RuntimeError("WS control not connected")
+        self._claim_control_key(key)
         fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending_control[key] = fut
+        try:
+            await self._control_ws.send(frame)
+        except BaseException:
+            self._pending_control.pop(key, None)
+            raise
+        return fut
+
+    def _claim_control_key(self, key: str) -> None:
+        # Responses are matched by key alone, so a second request for the same
+        # order would steal the first one's response.
+        if (pending := self._pending_control.get(key)) is not None and not pending.done():
+            raise RuntimeError(f"A control request for {key!r} is already in flight.")
+
+    def _control_key(self, payload: dict[str, Any], expected_order_id: str) -> str:
         # Determine expected response variant and asset_id from payload to build key
         if len(payload) != 1:
             raise ValueError("Invalid WS control payload shape")
         request_variant, content = next(iter(payload.items()))
-        # Map request variant to response variant names sent by server
-        response_variant_map = {
-            "CreateOrderRequest": "CreateOrderResponse",
-            "CancelOrderRequest": "CancelOrderResponse",
-            "ReplaceOrderRequest": "ReplaceOrderResponse",
-        }
-        response_variant = response_variant_map.get(request_variant, request_variant)
         asset_id: str | None = None
         if isinstance(content, dict):
             if isinstance(content.get("asset_id"), str):
@@ -812,14 +1127,12 @@ class OrderBookClient(AuthenticatedClient):
                 asset_id = content["order"]["base_asset"]
         if asset_id is None:
             raise ValueError("WS control payload missing asset_id")
-        key = f"{response_variant}:{asset_id}:{expected_order_id}"
-        self._pending_control[key] = fut
-        await self._control_ws.send(json.dumps(payload))
-        try:
-            return await asyncio.wait_for(fut, timeout=timeout)
-        finally:
-            # Ensure cleanup if timed out
-            self._pending_control.pop(key, None)
+        return self._response_key(request_variant, asset_id, expected_order_id)
+
+    @staticmethod
+    def _response_key(request_variant: str, asset_id: str, order_id: str) -> str:
+        response_variant = _CONTROL_RESPONSE_VARIANTS.get(request_variant, request_variant)
+        return f"{response_variant}:{asset_id}:{order_id}"
 
     async def _control_ws_send_batch(
         self, request: BatchCreateOrderRequest, *, timeout: float = 15.0
@@ -837,17 +1150,20 @@ class OrderBookClient(AuthenticatedClient):
 
         loop = asyncio.get_running_loop()
         dumped = request.model_dump()
+        keys = [
+            self._response_key("CreateOrderRequest", order["base_asset"], order["order_id"])
+            for order in (order_request["order"] for order_request in dumped["orders"])
+        ]
+        for key in keys:
+            self._claim_control_key(key)
+
         pending: list[tuple[str, asyncio.Future]] = []
-        for order_request in dumped["orders"]:
-            order = order_request["order"]
-            asset_id = order["base_asset"]
-            order_id = order["order_id"]
-            key = f"CreateOrderResponse:{asset_id}:{order_id}"
+        for key in keys:
             fut: asyncio.Future = loop.create_future()
             self._pending_control[key] = fut
             pending.append((key, fut))
 
-        await self._control_ws.send(json.dumps({"BatchCreateRequest": dumped}))
+        await self._control_ws.send(self._codec.dumps({"BatchCreateRequest": dumped}))
         try:
             results = await asyncio.wait_for(
                 asyncio.gather(*(fut for _, fut in pending)), timeout=timeout
@@ -893,6 +1209,7 @@ class OrderBookClient(AuthenticatedClient):
         finally:
             self._control_ws = None
             self._control_ws_task = None
+        self._market_cache.save(self._settings.base_url, force=True)
         await super().close()
 
     async def get_user_inventory(self, user: UserType | None = None) -> dict[str, Any]:
@@ -925,7 +1242,9 @@ class OrderBookClient(AuthenticatedClient):
                 "thresholds": {"low": 1, "medium": 1, "high": 1},
             }
 
-    async def stream_orders(self, user: UserType | None = None) -> AsyncIterator[OrderEvent]:
+    async def stream_orders(
+        self, user: UserType | None = None
+    ) -> AsyncIterator[OrderEvent | StreamResynced]:
         """Stream order events for the authenticated user.
 
         Args:
@@ -934,12 +1253,13 @@ class OrderBookClient(AuthenticatedClient):
         Yields:
             :class:`OrderEvent` records as they arrive on the WebSocket.
         """
-        async for event in self._stream_ws("/orders", parse_order_event, user=user):
+        parser = construct_order_event if self._settings.trusted_streams else parse_order_event
+        async for event in self._stream_ws("/orders", parser, user=user):
             yield event
 
     async def stream_user_trade_events(
         self, user: UserType | None = None
-    ) -> AsyncIterator[UserTrade]:
+    ) -> AsyncIterator[UserTrade | StreamResynced]:
         """
         Stream **all** trade events (``Pending``, ``Confirmed``, ``Rollbacked``) for a specific user.
 
@@ -955,7 +1275,7 @@ class OrderBookClient(AuthenticatedClient):
 
     async def stream_user_finalized_trades(
         self, user: UserType | None = None
-    ) -> AsyncIterator[UserTrade]:
+    ) -> AsyncIterator[UserTrade | StreamResynced]:
         """
         Stream **finalized** (confirmed) trades for a specific user.
 
@@ -969,7 +1289,9 @@ class OrderBookClient(AuthenticatedClient):
         async for trade in self._stream_ws(path, parse_single_user_trade):
             yield trade
 
-    async def stream_user_trades(self, user: UserType | None = None) -> AsyncIterator[UserTrade]:
+    async def stream_user_trades(
+        self, user: UserType | None = None
+    ) -> AsyncIterator[UserTrade | StreamResynced]:
         """
         [DEPRECATED] Use stream_user_trade_events or stream_user_finalized_trades instead.
         This method streams finalized (confirmed) trades for a specific user.
@@ -979,7 +1301,7 @@ class OrderBookClient(AuthenticatedClient):
 
     async def stream_user_events(
         self, user: UserType | None = None
-    ) -> AsyncIterator[UserActivityEvent]:
+    ) -> AsyncIterator[UserActivityEvent | StreamResynced]:
         """Stream typed user-activity events on `/account/events/{user_id}`.
 
         Each event is a `DepositLanded`, `WithdrawalCompleted`,
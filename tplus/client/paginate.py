@@ -0,0 +1,95 @@
+"""Concurrent page fetching for the paginated OMS / market-data endpoints."""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
+from typing import Any, TypeVar
+
+DEFAULT_PAGE_CONCURRENCY = 4
+
+P = TypeVar("P")
+T = TypeVar("T")
+
+
+def _page_meta(page: Any, name: str) -> Any:
+    if isinstance(page, dict):
+        return page.get(name)
+
+    return getattr(page, name, None)
+
+
+async def paginate(
+    fetch_page: Callable[[int], Awaitable[P]],
+    get_items: Callable[[P], Sequence[T]],
+    *,
+    concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    page_size: int | None = None,
+    first_page: int = 0,
+    max_pages: int | None = None,
+) -> AsyncGenerator[T, None]:
+    """
+    Yield every item across pages, in page order.
+
+    The first page is fetched alone. When it reports ``total_pages``, the
+    remaining pages are fetched with up to ``concurrency`` requests in flight;
+    otherwise pages are fetched speculatively ``concurrency`` at a time until
+    one reports ``has_next_page=False``, is shorter than ``page_size`` or is
+    empty. At most ``concurrency`` pages are held in memory at once.
+
+    Args:
+        fetch_page: Fetches the page with the given index.
+        get_items: Extracts the items from a fetched page.
+        concurrency: Maximum number of page requests in flight.
+        page_size: The requested page size, used to detect the last page of
+            endpoints that return bare lists.
+        first_page: The index of the first page.
+        max_pages: Optional cap on the number of pages fetched.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+
+    def is_last(page: P, items: Sequence[T]) -> bool:
+        if (has_next := _page_meta(page, "has_next_page")) is not None:
+            return not has_next
+
+        return not items or (page_size is not None and len(items) < page_size)
+
+    page = await fetch_page(first_page)
+    items = get_items(page)
+    for item in items:
+        yield item
+
+    if is_last(page, items):
+        return
+
+    last_page: int | None = None
+    if (total_pages := _page_meta(page, "total_pages")) is not None:
+        last_page = first_page + int(total_pages) - 1
+    if max_pages is not None:
+        capped = first_page + max_pages - 1
+        last_page = capped if last_page is None else min(last_page, capped)
+
+    pending: deque[asyncio.Task] = deque()
+    next_page = first_page + 1
+
+    def schedule() -> None:
+        nonlocal next_page
+        while len(pending) < concurrency and (last_page is None or next_page <= last_page):
+            pending.append(asyncio.ensure_future(fetch_page(next_page)))
+            next_page += 1
+
+    try:
+        schedule()
+        while pending:
+            page = await pending.popleft()
+            items = get_items(page)
+            for item in items:
+                yield item
+
+            if is_last(page, items):
+                return
+
+            schedule()
+    finally:
+        for task in pending:
+            task.cancel()
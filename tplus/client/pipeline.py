@@ -0,0 +1,268 @@
+"""Pipelined order submission over the OMS ``/control`` WebSocket."""
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from typing import TYPE_CHECKING, Any
+
+from tplus.model.order import OrderOperationResponse
+
+if TYPE_CHECKING:
+    from tplus.client.orderbook import OrderBookClient
+    from tplus.model.asset_identifier import AssetIdentifier
+    from tplus.model.limit_order import GTC, GTD, IOC
+    from tplus.model.order import TradeTarget
+    from tplus.model.order_trigger import OrderTrigger
+    from tplus.utils.quote_template import SignedQuote
+    from tplus.utils.user import User
+
+DEFAULT_PIPELINE_WINDOW = 64
+
+
+class PipelinedOrderResult:
+    """
+    Outcome of one pipelined control request.
+    """
+
+    __slots__ = ("order_id", "response", "error", "latency")
+
+    def __init__(
+        self,
+        order_id: str,
+        latency: float,
+        response: OrderOperationResponse | None = None,
+        error: BaseException | None = None,
+    ):
+        self.order_id = order_id
+        """The order id the request was keyed by."""
+
+        self.latency = latency
+        """Round-trip time in seconds, from send until the response (or error)."""
+
+        self.response = response
+        """The OMS response, when one arrived."""
+
+        self.error = error
+        """The failure (timeout, disconnect, malformed response), if any."""
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        outcome = self.response if self.error is None else repr(self.error)
+        return f"<PipelinedOrderResult {self.order_id} {self.latency * 1e3:.2f}ms {outcome}>"
+
+
+class OrderPipeline:
+    """
+    Keep many create/cancel/replace requests in flight on one ``/control`` socket.
+
+    Each ``submit_*`` call sends immediately and returns a future resolving to a
+    :class:`PipelinedOrderResult`; it only waits when ``window`` requests are
+    already in flight. Futures never raise: failures are reported in
+    ``PipelinedOrderResult.error``. Only one request per order may be in flight;
+    a second create/cancel/replace of the same order raises ``RuntimeError``
+    until the first one is answered.
+
+    Usage example::
+
+        pipeline = client.pipeline(window=128)
+        for price in prices:
+            await pipeline.submit_limit_order(qty, price, "Buy", asset_id)
+
+        for result in await pipeline.drain():
+            print(result.order_id, result.latency)
+
+    To handle outcomes in completion order while still submitting, iterate
+    :meth:`results` in a separate task started before the submissions.
+    """
+
+    def __init__(
+        self,
+        client: "OrderBookClient",
+        *,
+        window: int = DEFAULT_PIPELINE_WINDOW,
+        timeout: float = 15.0,
+    ):
+        if window < 1:
+            raise ValueError("window must be at least 1.")
+
+        self._client = client
+        self._window = asyncio.Semaphore(window)
+        self._timeout = timeout
+        self._in_flight: set[asyncio.Future] = set()
+        self._completed: asyncio.Queue[PipelinedOrderResult] | None = None
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests awaiting a response."""
+        return len(self._in_flight)
+
+    async def submit(
+        self, payload: dict[str, Any], *, expected_order_id: str
+    ) -> "asyncio.Future[PipelinedOrderResult]":
+        """
+        Send a raw control ``payload`` (e.g. ``{"CreateOrderRequest": ...}``).
+
+        Args:
+            payload: The control request, keyed by its request variant.
+            expected_order_id: The order id the response will carry.
+
+        Returns:
+            A future resolving to the :class:`PipelinedOrderResult`.
+        """
+        await self._window.acquire()
+        started = time.perf_counter()
+        try:
+            key, response = await self._client._control_ws_submit(
+                payload, expected_order_id=expected_order_id
+            )
+        except BaseException:
+            self._window.release()
+            raise
+
+        return self._track(key, response, expected_order_id, started)
+
+    async def submit_quote(self, quote: "SignedQuote") -> "asyncio.Future[PipelinedOrderResult]":
+        """
+        Pipelined :meth:`OrderBookClient.send_quote`.
+        """
+        await self._window.acquire()
+        started = time.perf_counter()
+        key = self._client._response_key("CreateOrderRequest", quote.asset_id, quote.order_id)
+        try:
+            response = await self._client._control_ws_submit_frame(key, quote.control_frame())
+        except BaseException:
+            self._window.release()
+            raise
+
+        return self._track(key, response, quote.order_id, started)
+
+    def _track(
+        self, key: str, response: asyncio.Future, expected_order_id: str, started: float
+    ) -> "asyncio.Future[PipelinedOrderResult]":
+        loop = asyncio.get_running_loop()
+        result: asyncio.Future[PipelinedOrderResult] = loop.create_future()
+        self._in_flight.add(result)
+
+        def expire() -> None:
+            if not response.done():
+                response.set_exception(
+                    TimeoutError(f"No control response for {expected_order_id!r}.")
+                )
+
+        timer = loop.call_later(self._timeout, expire)
+
+        def complete(fut: asyncio.Future) -> None:
+            latency = time.perf_counter() - started
+            timer.cancel()
+            if self._client._pending_control.get(key) is fut:
+                del self._client._pending_control[key]
+
+            self._window.release()
+            self._in_flight.discard(result)
+            outcome = PipelinedOrderResult(expected_order_id, latency)
+            if fut.cancelled():
+                outcome.error = asyncio.CancelledError()
+            elif (error := fut.exception()) is not None:
+                outcome.error = error
+            else:
+                try:
+                    outcome.response = self._client._extract_operation_response(fut.result())
+                except Exception as err:
+                    outcome.error = err
+
+            if not result.done():
+                result.set_result(outcome)
+
+            if self._completed is not None:
+                self._completed.put_nowait(outcome)
+
+        response.add_done_callback(complete)
+        return result
+
+    async def submit_limit_order(
+        self,
+        quantity: int,
+        price: int,
+        side: str,
+        asset_id: "AssetIdentifier",
+        time_in_force: "GTC | GTD | IOC | None" = None,
+        order_id: str | None = None,
+        target: "TradeTarget | None" = None,
+        max_trading_fees_rate: int | None = None,
+        trigger: "OrderTrigger | None" = None,
+        user: "User | None" = None,
+    ) -> "asyncio.Future[PipelinedOrderResult]":
+        """
+        Pipelined :meth:`OrderBookClient.create_limit_order`.
+        """
+        order_id, signed_message = await self._client.prepare_limit_order_request(
+            asset_id,
+            price,
+            quantity,
+            side,
+            target,
+            time_in_force,
+            order_id=order_id,
+            max_trading_fees_rate=max_trading_fees_rate,
+            trigger=trigger,
+            user=user,
+        )
+        payload = {"CreateOrderRequest": signed_message.model_dump()}
+        return await self.submit(payload, expected_order_id=order_id)
+
+    async def submit_cancel_order(
+        self, order_id: str, asset_id: "AssetIdentifier", user: "User | None" = None
+    ) -> "asyncio.Future[PipelinedOrderResult]":
+        """
+        Pipelined :meth:`OrderBookClient.cancel_order`.
+        """
+        signed_message = self._client.prepare_cancel_order_request(order_id, asset_id, user=user)
+        payload = {"CancelOrderRequest": signed_message.model_dump()}
+        return await self.submit(payload, expected_order_id=order_id)
+
+    async def submit_replace_order(
+        self,
+        original_order_id: str,
+        asset_id: "AssetIdentifier",
+        new_quantity: int | None = None,
+        new_price: int | None = None,
+        user: "User | None" = None,
+    ) -> "asyncio.Future[PipelinedOrderResult]":
+        """
+        Pipelined :meth:`OrderBookClient.replace_order`.
+        """
+        signed_message = await self._client.prepare_replace_order_request(
+            original_order_id,
+            asset_id,
+            new_quantity=new_quantity,
+            new_price=new_price,
+            user=user,
+        )
+        payload = {"ReplaceOrderRequest": signed_message.model_dump(exclude_none=True)}
+        return await self.submit(payload, expected_order_id=original_order_id)
+
+    async def results(self) -> AsyncGenerator[PipelinedOrderResult, None]:
+        """
+        Yield results in completion order while iterating. Results that
+        completed before iteration began (or after it stopped) are not
+        replayed; use the futures from ``submit_*`` or :meth:`drain` for those.
+        Runs until the consumer stops.
+        """
+        completed: asyncio.Queue[PipelinedOrderResult] = asyncio.Queue()
+        self._completed = completed
+        try:
+            while True:
+                yield await completed.get()
+        finally:
+            # Nothing is queued once nobody is consuming.
+            if self._completed is completed:
+                self._completed = None
+
+    async def drain(self) -> list[PipelinedOrderResult]:
+        """
+        Wait for every in-flight request and return their results.
+        """
+        return list(await asyncio.gather(*self._in_flight))
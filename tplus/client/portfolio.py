@@ -0,0 +1,329 @@
+"""Local positions and balances, folded from the user-event and user-trade streams."""
+
+import asyncio
+import time
+from collections.abc import Iterable, Iterator
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from tplus.model.asset_identifier import AssetIdentifier
+from tplus.model.position import PositionResponse
+from tplus.model.stream import StreamResynced
+from tplus.model.trades import UserTrade
+from tplus.model.user_event import (
+    DepositLanded,
+    PositionCleared,
+    SubAccountAssetTransferred,
+    UserActivityEvent,
+    WithdrawalCompleted,
+)
+
+if TYPE_CHECKING:
+    from tplus.client.orderbook import OrderBookClient
+    from tplus.model.user_margin import UserMarginInfo
+    from tplus.types import UserType
+
+DEFAULT_DRIFT_INTERVAL = 30.0
+MAX_SEEN_EVENTS = 10_000
+
+# Deposits and withdrawals carry no sub-account; they land on the main account.
+MAIN_SUB_ACCOUNT = 0
+
+
+class Drift(NamedTuple):
+    kind: str
+    """``"balance"`` or ``"position"``."""
+
+    sub_account: int
+    asset: str
+    local: int | Decimal
+    remote: int | Decimal
+
+
+def _parse_amount(value: Any) -> int:
+    # Inventory amounts are U256s, sent as 0x-hex or as decimal strings.
+    if isinstance(value, str):
+        return int(value, 16) if value.startswith(("0x", "0X")) else int(value)
+
+    return int(value or 0)
+
+
+def _signed_size(position: PositionResponse) -> Decimal:
+    return -position.size if position.side == "short" else position.size
+
+
+def _event_key(event: UserActivityEvent | UserTrade) -> tuple | None:
+    # Events that carry an id; the others cannot be told apart from a repeat.
+    if isinstance(event, DepositLanded):
+        return "deposit", event.chain_id, event.deposit_nonce
+    elif isinstance(event, WithdrawalCompleted):
+        return "withdrawal", event.chain_id, event.withdrawal_nonce
+    elif isinstance(event, UserTrade):
+        return "trade", event.trade_id, event.is_buyer, event.status
+
+    return None
+
+
+class Portfolio:
+    """
+    Keeps the user's balances and positions up to date from
+    :meth:`OrderBookClient.stream_user_events` and confirmed fills, seeding once
+    from REST instead of polling ``get_user_positions`` / ``get_user_inventory``.
+
+    Balances are spot balances per ``(sub_account, asset)`` in inventory
+    decimals (1e18). Positions are signed sizes (negative when short) per
+    ``(sub_account, asset)``, in the units of :class:`PositionResponse`.
+    :attr:`margin` is the last REST margin snapshot and is only refreshed by
+    :meth:`bootstrap` / :meth:`check_drift`.
+
+    Spot fills are not applied (they would need each market's decimals);
+    :meth:`run` reconciles them, and anything else missed, with periodic drift
+    checks against REST.
+
+    Usage example::
+
+        portfolio = Portfolio(client)
+        task = asyncio.create_task(portfolio.run())
+        await portfolio.ready.wait()
+        if portfolio.position(asset_id, sub_account=1) > limit:
+            ...
+
+    Args:
+        client: The OMS client.
+        user: The user whose portfolio to track. Defaults to the client's default user.
+        drift_interval: Seconds between drift checks in :meth:`run`. ``None`` disables them.
+    """
+
+    def __init__(
+        self,
+        client: "OrderBookClient",
+        *,
+        user: "UserType | None" = None,
+        drift_interval: float | None = DEFAULT_DRIFT_INTERVAL,
+    ):
+        self.client = client
+        self.user = user
+        self.drift_interval = drift_interval
+        self.ready = asyncio.Event()
+        """Set once the REST bootstrap has been applied."""
+
+        self.margin: UserMarginInfo | None = None
+        self._balances: dict[tuple[int, str], int] = {}
+        self._positions: dict[tuple[int, str], Decimal] = {}
+        # Local monotonic time the last snapshot was requested; events received
+        # earlier are reflected in it (see :meth:`apply`).
+        self._snapshot_ns = 0
+        self._seen: dict[tuple, None] = {}
+
+    def balance(self, asset: AssetIdentifier | str, sub_account: int = MAIN_SUB_ACCOUNT) -> int:
+        """Spot balance of ``asset`` in inventory decimals; ``0`` when there is none."""
+        return self._balances.get((sub_account, str(asset)), 0)
+
+    def balances(self, sub_account: int | None = None) -> dict[tuple[int, str], int]:
+        """Non-zero balances keyed by ``(sub_account, asset)``."""
+        return {
+            key: amount
+            for key, amount in self._balances.items()
+            if amount and (sub_account is None or key[0] == sub_account)
+        }
+
+    def position(self, asset_id: AssetIdentifier | str, sub_account: int) -> Decimal:
+        """Signed size of the position in ``asset_id``; ``0`` when there is none."""
+        return self._positions.get((sub_account, str(asset_id)), Decimal(0))
+
+    def positions(self, sub_account: int | None = None) -> Iterator[tuple[int, str, Decimal]]:
+        """Open positions as ``(sub_account, asset, signed_size)``."""
+        for (index, asset), size in list(self._positions.items()):
+            if sub_account is None or index == sub_account:
+                yield index, asset, size
+
+    def load(
+        self,
+        inventory: dict[str, Any],
+        positions: Iterable[PositionResponse],
+        margin: "UserMarginInfo | None" = None,
+    ) -> None:
+        """
+        Replace the state with REST snapshots.
+
+        Args:
+            inventory: The raw ``get_user_inventory`` response.
+            positions: Open positions, e.g. from ``get_user_positions``.
+            margin: The ``get_user_margin_info`` response, if fetched.
+        """
+        self._balances, self._positions = self._parse(inventory, positions)
+        self.margin = margin
+
+    async def bootstrap(self) -> None:
+        """Replace the state with the user's balances, positions and margin from REST."""
+        requested_ns = time.monotonic_ns()
+        inventory, positions, margin = await self._fetch()
+        self.load(inventory, positions, margin)
+        self._snapshot_ns = requested_ns
+
+    async def check_drift(self) -> list[Drift]:
+        """
+        Compare the local state with REST and re-seed from REST.
+
+        Returns:
+            Every balance and position that differed.
+        """
+        requested_ns = time.monotonic_ns()
+        inventory, positions, margin = await self._fetch()
+        balances, sizes = self._parse(inventory, positions)
+
+        drift = [
+            Drift(kind, index, asset, local.get((index, asset), 0), remote.get((index, asset), 0))
+            for kind, local, remote in (
+                ("balance", self._balances, balances),
+                ("position", self._positions, sizes),
+            )
+            for index, asset in sorted(local.keys() | remote.keys())
+            if local.get((index, asset), 0) != remote.get((index, asset), 0)
+        ]
+        if drift:
+            self.client.logger.warning(f"Portfolio drifted from REST: {drift}")
+
+        self._balances, self._positions = balances, sizes
+        self.margin = margin
+        self._snapshot_ns = requested_ns
+        return drift
+
+    def apply(self, event: UserActivityEvent | UserTrade, received_ns: int | None = None) -> None:
+        """
+        Fold one user-activity event or user trade into the state.
+
+        Deposits, withdrawals and fills already applied (by nonce or trade id)
+        are skipped, e.g. when a stream re-delivers them after a reconnect.
+
+        Args:
+            event: The event.
+            received_ns: When the event was received, as ``time.monotonic_ns()``.
+                Events received before the last REST snapshot was requested are
+                already in it and are skipped. One received while the snapshot
+                was in flight may be in it too and is applied anyway; the next
+                :meth:`check_drift` corrects it.
+        """
+        if (key := _event_key(event)) is not None:
+            if key in self._seen:
+                return
+
+            self._seen[key] = None
+            if len(self._seen) > MAX_SEEN_EVENTS:
+                del self._seen[next(iter(self._seen))]
+
+        if received_ns is not None and received_ns < self._snapshot_ns:
+            return
+
+        if isinstance(event, DepositLanded):
+            self._credit(MAIN_SUB_ACCOUNT, event.asset, _parse_amount(event.amount))
+
+        elif isinstance(event, WithdrawalCompleted):
+            self._credit(MAIN_SUB_ACCOUNT, event.asset, -_parse_amount(event.amount))
+
+        elif isinstance(event, SubAccountAssetTransferred):
+            amount = _parse_amount(event.amount)
+            self._credit(event.source_sub_account_index, event.asset, -amount)
+            self._credit(event.target_sub_account_index, event.asset, amount)
+
+        elif isinstance(event, PositionCleared):
+            self._positions.pop((event.sub_account_index, event.asset), None)
+
+        elif isinstance(event, UserTrade):
+            if event.status != "Confirmed" or event.sub_account == MAIN_SUB_ACCOUNT:
+                return
+
+            key = (event.sub_account, str(event.asset_id))
+            size = self._positions.get(key, Decimal(0))
+            size += event.quantity if event.is_buyer else -event.quantity
+            if size:
+                self._positions[key] = size
+            else:
+                self._positions.pop(key, None)
+
+    async def run(self) -> None:
+        """
+        Bootstrap and then apply user events and confirmed fills until a stream ends.
+
+        Both streams are opened before the REST snapshot is requested. After a
+        reconnect (:class:`StreamResynced`) the state is bootstrapped again, and
+        every :attr:`drift_interval` seconds it is checked against REST.
+        """
+        events: asyncio.Queue[tuple[int, UserActivityEvent | UserTrade | StreamResynced] | None]
+        events = asyncio.Queue()
+
+        async def pump(stream) -> None:
+            try:
+                async for event in stream:
+                    events.put_nowait((time.monotonic_ns(), event))
+            finally:
+                events.put_nowait(None)
+
+        tasks = [
+            asyncio.create_task(pump(self.client.stream_user_events(user=self.user))),
+            asyncio.create_task(pump(self.client.stream_user_finalized_trades(user=self.user))),
+        ]
+        try:
+            await self.bootstrap()
+            self.ready.set()
+            loop = asyncio.get_running_loop()
+            interval = self.drift_interval
+            next_check = None if interval is None else loop.time() + interval
+            while True:
+                try:
+                    timeout = None if next_check is None else max(0, next_check - loop.time())
+                    item = await asyncio.wait_for(events.get(), timeout)
+                except asyncio.TimeoutError:
+                    await self.check_drift()
+                    next_check = None if interval is None else loop.time() + interval
+                    continue
+
+                if item is None:
+                    break
+
+                received_ns, event = item
+                if isinstance(event, StreamResynced):
+                    await self.bootstrap()
+                else:
+                    self.apply(event, received_ns)
+
+            # Surface the streams' errors, if either failed.
+            for task in tasks:
+                if task.done():
+                    await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _fetch(self) -> tuple[dict[str, Any], list[PositionResponse], "UserMarginInfo"]:
+        positions: list[PositionResponse] = []
+
+        async def collect() -> None:
+            async for position in self.client.iter_user_positions(user=self.user):
+                positions.append(position)
+
+        inventory, _, margin = await asyncio.gather(
+            self.client.get_user_inventory(user=self.user),
+            collect(),
+            self.client.get_user_margin_info(user=self.user),
+        )
+        return inventory, positions, margin
+
+    def _parse(
+        self, inventory: dict[str, Any], positions: Iterable[PositionResponse]
+    ) -> tuple[dict[tuple[int, str], int], dict[tuple[int, str], Decimal]]:
+        balances = {
+            (int(index), str(asset)): _parse_amount(amount)
+            for index, account in (inventory.get("accounts") or {}).items()
+            for asset, amount in (account.get("spot") or {}).items()
+        }
+        sizes = {
+            (position.sub_account_index, str(position.asset_id)): _signed_size(position)
+            for position in positions
+            if position.side != "closed" and position.size
+        }
+        return balances, sizes
+
+    def _credit(self, sub_account: int, asset: str, amount: int) -> None:
+        key = (sub_account, asset)
+        self._balances[key] = self._balances.get(key, 0) + amount
@@ -0,0 +1,121 @@
+"""Retry and hedging helpers for idempotent (``GET``) requests."""
+
+import asyncio
+import json
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+# OMS error codes worth retrying even without ``"retryable": true``. A read
+# that timed out inside the OMS can simply be asked again.
+RETRYABLE_CODES = frozenset({"TIMEOUT", "TIMEOUT_UNKNOWN_STATE"})
+
+DEFAULT_WINDOW_SIZE = 200
+DEFAULT_MIN_SAMPLES = 20
+# Endpoints whose latencies are tracked; reads to further routes are not hedged.
+MAX_LATENCY_WINDOWS = 256
+
+
+class LatencyWindow:
+    """
+    The most recent request latencies of one endpoint, for a hedge deadline
+    that follows the server's actual tail latency.
+
+    Args:
+        size: How many latencies are kept.
+        min_samples: Latencies needed before :meth:`quantile` answers.
+    """
+
+    def __init__(self, size: int = DEFAULT_WINDOW_SIZE, min_samples: int = DEFAULT_MIN_SAMPLES):
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def quantile(self, q: float) -> float | None:
+        """
+        The ``q`` quantile (e.g. ``0.95``) of the kept latencies, or ``None``
+        while fewer than ``min_samples`` were observed.
+        """
+        if len(self._samples) < self.min_samples:
+            return None
+
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def route_template(relative_url: str) -> str:
+    """
+    The route of ``relative_url`` with its id-like segments (any containing a
+    digit, such as asset ids, public keys or order ids) replaced by ``{}``, e.g.
+    ``/ticker/200`` -> ``/ticker/{}``. Reads of one route share a latency window.
+    """
+    path = relative_url.split("?", 1)[0]
+    return "/".join(
+        "{}" if any(char.isdigit() for char in segment) else segment for segment in path.split("/")
+    )
+
+
+def is_retryable_response(response: httpx.Response) -> bool:
+    """
+    Whether a failed response is worth retrying: any 5xx, or an OMS error
+    envelope that is marked ``retryable`` or carries a :data:`RETRYABLE_CODES` code.
+    """
+    if response.status_code >= 500:
+        return True
+
+    if response.is_success:
+        return False
+
+    try:
+        error = response.json().get("error")
+    except (json.JSONDecodeError, ValueError, AttributeError):
+        return False
+
+    return isinstance(error, dict) and (
+        error.get("retryable") is True or error.get("code") in RETRYABLE_CODES
+    )
+
+
+async def hedge(
+    send: Callable[[], Awaitable[T]],
+    delay: float,
+    *,
+    backup: Callable[[], Awaitable[T]] | None = None,
+) -> T:
+    """
+    Await ``send()``; if it has not finished after ``delay`` seconds, call
+    ``backup`` (default: ``send``) and return whichever result arrives first.
+    The other call is cancelled. Only use with idempotent requests.
+
+    Raises:
+        The error of the last call to fail, when both fail.
+    """
+    tasks = [asyncio.ensure_future(send())]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            tasks.append(asyncio.ensure_future((backup or send)()))
+
+        pending = set(tasks)
+        while True:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+
+            if not pending:
+                return task.result()  # Raises the last error.
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,200 @@
+"""Many users' OMS sessions over one shared HTTP connection pool."""
+
+import asyncio
+import importlib.util
+import time
+from collections.abc import Iterable
+
+from tplus.client.auth import Auth
+from tplus.client.base import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    ClientSettings,
+    create_httpx_client,
+)
+from tplus.client.orderbook import OrderBookClient
+from tplus.utils.user import User
+
+# Refresh tokens this long before ``Auth.is_expired`` would trigger a refresh
+# on the request path.
+DEFAULT_REFRESH_AHEAD_NS = 2 * Auth.SAFETY_MARGIN_NS
+RETRY_DELAY_NS = 5 * 1_000_000_000
+MIN_REFRESH_DELAY_NS = 1_000_000_000
+
+
+class SessionPool:
+    """
+    One :class:`OrderBookClient` per user, all multiplexed over a single
+    ``httpx.AsyncClient`` with explicit connection limits (and HTTP/2 when
+    ``h2`` is installed), instead of a connection pool and TLS handshakes per user.
+
+    Every user keeps their own token. :meth:`authenticate` signs everyone in
+    concurrently, and :meth:`start` keeps the tokens fresh in the background,
+    re-authenticating each one ``refresh_ahead_ns`` before it expires so the
+    ``nonce -> sign -> /auth`` handshake never runs on the request path.
+
+    Usage example::
+
+        async with SessionPool(base_url, users) as pool:
+            await pool.start()
+            await pool[user].create_limit_order(...)
+
+    Args:
+        base_url: The OMS URL.
+        users: The users to open sessions for. More can be added with :meth:`add`.
+        http2: Use HTTP/2; defaults to whether ``h2`` is installed.
+        max_connections: Connection cap of the shared pool.
+        max_keepalive_connections: Idle connections kept open.
+        keepalive_expiry: Seconds an idle connection is kept open.
+        refresh_ahead_ns: How long before expiry a token is refreshed.
+        **kwargs: Passed to every :class:`OrderBookClient`, e.g. ``timeout``.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        users: Iterable[User] = (),
+        *,
+        http2: bool | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        refresh_ahead_ns: int = DEFAULT_REFRESH_AHEAD_NS,
+        **kwargs,
+    ):
+        if http2 is None:
+            http2 = importlib.util.find_spec("h2") is not None
+
+        self.refresh_ahead_ns = refresh_ahead_ns
+        self._kwargs = kwargs
+        self._http = create_httpx_client(
+            ClientSettings.from_url(
+                base_url,
+                http2=http2,
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+                **_settings_kwargs(kwargs),
+            )
+        )
+        self._base_url = base_url
+        self._clients: dict[str, OrderBookClient] = {}
+        self._refresher: asyncio.Task | None = None
+        for user in users:
+            self.add(user)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __iter__(self):
+        return iter(list(self._clients.values()))
+
+    def __getitem__(self, user: User | str) -> OrderBookClient:
+        """The client of ``user`` (a :class:`User` or public key)."""
+        return self._clients[user if isinstance(user, str) else user.public_key]
+
+    def add(self, user: User) -> OrderBookClient:
+        """Open a session for ``user`` on the shared pool, or return the existing one."""
+        if (client := self._clients.get(user.public_key)) is None:
+            client = OrderBookClient(
+                self._base_url,
+                default_user=user,
+                client=self._http,
+                auth=Auth(),
+                **self._kwargs,
+            )
+            self._clients[user.public_key] = client
+
+        return client
+
+    async def authenticate(self) -> dict[str, BaseException]:
+        """
+        Sign every user without a valid token in concurrently.
+
+        Returns:
+            The error of each user (by public key) whose handshake failed.
+        """
+        clients = list(self._clients.items())
+        results = await asyncio.gather(
+            *(client.renew_auth() for _, client in clients), return_exceptions=True
+        )
+        return {
+            public_key: result
+            for (public_key, _), result in zip(clients, results, strict=True)
+            if isinstance(result, BaseException)
+        }
+
+    async def refresh(self, *, force: bool = False) -> dict[str, BaseException]:
+        """
+        Concurrently re-authenticate every user whose token expires within
+        :attr:`refresh_ahead_ns` (or everyone, with ``force``).
+
+        Returns:
+            The error of each user (by public key) whose handshake failed.
+        """
+        deadline_ns = time.time_ns() + self.refresh_ahead_ns
+        due = [
+            (public_key, client)
+            for public_key, client in self._clients.items()
+            if force or client.auth_expiry_ns <= deadline_ns
+        ]
+        results = await asyncio.gather(
+            *(client.renew_auth(ahead_ns=self.refresh_ahead_ns, force=force) for _, client in due),
+            return_exceptions=True,
+        )
+        errors = {
+            public_key: result
+            for (public_key, _), result in zip(due, results, strict=True)
+            if isinstance(result, BaseException)
+        }
+        for public_key, error in errors.items():
+            client = self._clients[public_key]
+            client.logger.error(f"Token refresh failed for {public_key}: {error}")
+
+        return errors
+
+    async def start(self) -> None:
+        """Sign everyone in and start refreshing tokens in the background."""
+        await self.authenticate()
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.create_task(self._refresh_forever())
+
+    async def aclose(self) -> None:
+        """Stop the refresher and close every client and the shared connection pool."""
+        if self._refresher is not None:
+            self._refresher.cancel()
+            self._refresher = None
+
+        for client in self._clients.values():
+            await client.close()
+
+        await self._http.aclose()
+
+    async def _refresh_forever(self) -> None:
+        while True:
+            await self.refresh()
+            # Sleep until the next token enters the refresh window. Failed
+            # handshakes leave ``expiry_ns == 0`` and are retried shortly.
+            now_ns = time.time_ns()
+            wake_ns = min(
+                (
+                    client.auth_expiry_ns - self.refresh_ahead_ns - now_ns
+                    if client.auth_expiry_ns
+                    else RETRY_DELAY_NS
+                    for client in self._clients.values()
+                ),
+                default=RETRY_DELAY_NS,
+            )
+            await asyncio.sleep(max(wake_ns, MIN_REFRESH_DELAY_NS) / 1_000_000_000)
+
+
+def _settings_kwargs(kwargs: dict) -> dict:
+    fields = ("timeout", "insecure_ssl", "headers")
+    return {name: kwargs[name] for name in fields if kwargs.get(name) is not None}
@@ -0,0 +1,318 @@
+"""Append-only on-disk tape of raw stream frames, with a trade index and replay."""
+
+import json
+import mmap
+import queue
+import struct
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, NamedTuple, TypeVar
+
+from tplus.logger import get_logger
+
+if TYPE_CHECKING:
+    from tplus.client.base import BaseClient
+
+DEFAULT_SEGMENT_SIZE = 64 * 1024 * 1024
+DEFAULT_TAPE_PATHS = ("/trades",)
+
+# received_ns, trade_id, trade timestamp_ns, byte offset of the frame in its segment.
+_INDEX_RECORD = struct.Struct("<qqqq")
+_MISSING = -1
+
+T = TypeVar("T")
+
+
+class TapeFrame(NamedTuple):
+    received_ns: int
+    """Wall-clock time the frame was recorded."""
+
+    path: str
+    """The stream path the frame arrived on, e.g. ``/trades/events``."""
+
+    data: Any
+    """The decoded JSON frame, as handed to the stream's parser."""
+
+
+def _trade_fields(data: Any) -> tuple[int, int]:
+    # Trades arrive bare or wrapped in their event type, e.g. ``{"Pending": {...}}``.
+    trade = data
+    if isinstance(data, dict) and "trade_id" not in data and len(data) == 1:
+        trade = next(iter(data.values()))
+
+    if isinstance(trade, dict) and "trade_id" in trade:
+        try:
+            return int(trade["trade_id"]), int(trade.get("timestamp_ns", _MISSING))
+        except (TypeError, ValueError):
+            pass
+
+    return _MISSING, _MISSING
+
+
+@contextmanager
+def _read_mapped(path: Path) -> Iterator[bytes | mmap.mmap]:
+    with path.open("rb") as file:
+        if file.seek(0, 2) == 0:
+            yield b""
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def _path_field(line: bytes) -> bytes:
+    # Records start with `{"received_ns":N,"path":"...","frame":`, so the path
+    # can be matched without decoding the frame.
+    start = line.index(b',"path":') + len(b',"path":')
+    return line[start : line.index(b',"frame":', start)]
+
+
+class TradeTape:
+    """
+    Records raw WebSocket frames (by default the ``/trades`` streams, so every
+    ``Pending``/``Confirmed``/``Rollbacked`` transition) into JSONL segment files.
+
+    Each segment ``NNNNNNNN.jsonl`` has a fixed-width binary ``NNNNNNNN.idx``
+    holding the receive time, ``trade_id`` and trade timestamp of every frame,
+    so lookups never parse the log. Both are read back memory-mapped.
+
+    Frames recorded through :meth:`attach` are written by a background thread,
+    so the stream's event loop never waits on the disk. Reads (and
+    :meth:`flush`) first wait for the queued frames to be written.
+
+    Usage example::
+
+        tape = TradeTape(Path("tape"))
+        tape.attach(market_data_client)
+        async for event in market_data_client.stream_all_trades():
+            ...
+
+        for event in tape.replay(parse_trade_event, paths=["/trades/events"]):
+            ...
+
+    Args:
+        directory: Where the segments are written.
+        segment_size: Bytes after which a new segment is started.
+        paths: Stream path prefixes recorded by :meth:`attach`.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        paths: Iterable[str] = DEFAULT_TAPE_PATHS,
+    ):
+        self.directory = Path(directory)
+        self.segment_size = segment_size
+        self.paths = tuple(paths)
+        self._log: IO[bytes] | None = None
+        self._index: IO[bytes] | None = None
+        self._offset = 0
+        self._lock = threading.RLock()
+        self._queue: queue.SimpleQueue[tuple[str, Any, Any, int] | threading.Event | None] = (
+            queue.SimpleQueue()
+        )
+        self._writer: threading.Thread | None = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def attach(self, client: "BaseClient") -> Callable[[], None]:
+        """
+        Record every frame ``client`` receives on a stream under :attr:`paths`.
+
+        Returns:
+            A callable that stops recording.
+        """
+
+        def tap(path: str, message: Any, data: Any) -> None:
+            if path.startswith(self.paths):
+                self._start_writer()
+                self._queue.put((path, message, data, time.time_ns()))
+
+        return client.add_frame_tap(tap)
+
+    def append(
+        self,
+        path: str,
+        message: str | bytes,
+        data: Any = None,
+        *,
+        received_ns: int | None = None,
+    ) -> None:
+        """
+        Append one raw frame.
+
+        Args:
+            path: The stream path.
+            message: The raw JSON frame, stored verbatim.
+            data: The decoded frame, if already available (used for indexing).
+            received_ns: Receive time; defaults to now.
+        """
+        if received_ns is None:
+            received_ns = time.time_ns()
+
+        raw = message.encode() if isinstance(message, str) else bytes(message)
+        # Outside of strings (where they are escaped), newlines in JSON are whitespace.
+        raw = raw.replace(b"\n", b" ").replace(b"\r", b" ")
+        line = b'{"received_ns":%d,"path":%s,"frame":%s}\n' % (
+            received_ns,
+            json.dumps(path).encode(),
+            raw,
+        )
+        trade_id, timestamp_ns = _trade_fields(json.loads(raw) if data is None else data)
+        with self._lock:
+            if self._log is None or (self._offset and self._offset + len(line) > self.segment_size):
+                self._roll()
+
+            assert self._log is not None and self._index is not None
+            self._log.write(line)
+            self._index.write(_INDEX_RECORD.pack(received_ns, trade_id, timestamp_ns, self._offset))
+            self._offset += len(line)
+
+    def flush(self) -> None:
+        """Write the frames queued by :meth:`attach` and flush the segment files."""
+        if self._writer is not None:
+            written = threading.Event()
+            self._queue.put(written)
+            written.wait()
+
+        with self._lock:
+            if self._log is not None and self._index is not None:
+                self._log.flush()
+                self._index.flush()
+
+    def close(self) -> None:
+        """Write the queued frames and close the segment files."""
+        if (writer := self._writer) is not None:
+            self._queue.put(None)
+            writer.join()
+            self._writer = None
+
+        with self._lock:
+            self._close_segment()
+
+    def segments(self) -> list[int]:
+        """The segment numbers on disk, oldest first."""
+        return sorted(int(path.stem) for path in self.directory.glob("*.jsonl"))
+
+    def frames(
+        self,
+        *,
+        start_ns: int | None = None,
+        end_ns: int | None = None,
+        paths: Iterable[str] | None = None,
+    ) -> Iterator[TapeFrame]:
+        """
+        Yield recorded frames in recording order.
+
+        Args:
+            start_ns: Skip frames received before this time.
+            end_ns: Skip frames received after this time.
+            paths: Only frames from these exact stream paths. Other frames are
+                skipped without being decoded.
+        """
+        wanted = None if paths is None else {json.dumps(path).encode() for path in paths}
+        self.flush()
+        for segment in self.segments():
+            entries = [
+                entry
+                for entry in self._entries(segment)
+                if (start_ns is None or entry[0] >= start_ns)
+                and (end_ns is None or entry[0] <= end_ns)
+            ]
+            yield from self._read(segment, entries, wanted)
+
+    def find(self, trade_id: int) -> list[TapeFrame]:
+        """Every recorded frame for ``trade_id``, e.g. its Pending and Confirmed events."""
+        frames: list[TapeFrame] = []
+        self.flush()
+        for segment in self.segments():
+            entries = [entry for entry in self._entries(segment) if entry[1] == trade_id]
+            frames.extend(self._read(segment, entries))
+
+        return frames
+
+    def replay(
+        self,
+        parser: Callable[[Any], T],
+        *,
+        start_ns: int | None = None,
+        end_ns: int | None = None,
+        paths: Iterable[str] | None = None,
+    ) -> Iterator[T]:
+        """
+        Feed recorded frames through a stream parser (e.g. ``parse_trade_event``),
+        as fast as they parse. Arguments filter like :meth:`frames`.
+        """
+        for frame in self.frames(start_ns=start_ns, end_ns=end_ns, paths=paths):
+            yield parser(frame.data)
+
+    def _start_writer(self) -> None:
+        if self._writer is None:
+            with self._lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(
+                        target=self._write_queued, name="tplus-tape", daemon=True
+                    )
+                    self._writer.start()
+
+    def _write_queued(self) -> None:
+        while (item := self._queue.get()) is not None:
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+
+            path, message, data, received_ns = item
+            try:
+                self.append(path, message, data, received_ns=received_ns)
+            except Exception as err:
+                # A frame that cannot be recorded must not stop the recording.
+                get_logger().error("Tape failed to record a %s frame: %s", path, err)
+
+    def _close_segment(self) -> None:
+        if self._log is not None and self._index is not None:
+            self._log.close()
+            self._index.close()
+
+        self._log = self._index = None
+
+    def _roll(self) -> None:
+        self._close_segment()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        segments = self.segments()
+        name = f"{segments[-1] + 1 if segments else 0:08d}"
+        self._log = (self.directory / f"{name}.jsonl").open("ab")
+        self._index = (self.directory / f"{name}.idx").open("ab")
+        self._offset = 0
+
+    def _entries(self, segment: int) -> list[tuple[int, int, int, int]]:
+        with _read_mapped(self.directory / f"{segment:08d}.idx") as index:
+            usable = len(index) - len(index) % _INDEX_RECORD.size
+            return list(_INDEX_RECORD.iter_unpack(index[:usable]))
+
+    def _read(
+        self,
+        segment: int,
+        entries: list[tuple[int, int, int, int]],
+        wanted: set[bytes] | None = None,
+    ) -> Iterator[TapeFrame]:
+        if not entries:
+            return
+
+        with _read_mapped(self.directory / f"{segment:08d}.jsonl") as log:
+            for received_ns, _, _, offset in entries:
+                end = log.find(b"\n", offset)
+                line = log[offset : end if end >= 0 else len(log)]
+                if wanted is not None and _path_field(line) not in wanted:
+                    continue
+
+                record = json.loads(line)
+                yield TapeFrame(received_ns, record["path"], record["frame"])
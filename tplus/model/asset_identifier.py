@@ -1,4 +1,4 @@
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Any, TypeAlias
 
 from eth_pydantic_types.address import AddressType
@@ -70,3 +70,23 @@ class AssetIdentifier(ChainAddress):
             raise ValueError("Indexed asset identifiers do not have an address.")
 
         return super().evm_address
+
+
+@lru_cache(maxsize=4096)
+def _cached_asset_identifier(value: str) -> AssetIdentifier:
+    return AssetIdentifier(value)
+
+
+def cached_asset_identifier(value: Any) -> AssetIdentifier:
+    """
+    A validated :class:`AssetIdentifier` for ``value``, memoised per string.
+
+    Stream payloads repeat the same few asset ids on every message, so this
+    skips re-running chain-address validation for each one. Treat the returned
+    instance as immutable; it is shared between callers. Non-string inputs
+    (e.g. the backend's ``{"Index": ...}`` dict form) are validated uncached.
+    """
+    if isinstance(value, str):
+        return _cached_asset_identifier(value)
+
+    return AssetIdentifier(value)
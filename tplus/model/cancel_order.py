@@ -2,6 +2,7 @@ from pydantic import BaseModel
 
 from tplus.model.asset_identifier import AssetIdentifier
 from tplus.model.types import UserPublicKey
+from tplus.utils.canonical import canonical_json
 
 
 class CancelOrder(BaseModel):
@@ -12,6 +13,10 @@ class CancelOrder(BaseModel):
     signer: UserPublicKey  # Public key of the signer, included in the signed payload
     protocol_version: int = 1
 
+    def signable_bytes(self) -> bytes:
+        """The exact bytes to sign; see :meth:`~tplus.utils.user.User.sign_bytes`."""
+        return canonical_json(self)
+
 
 class CancelOrderRequest(BaseModel):
     """The payload for ObRequest representing a cancel order operation."""
@@ -4,6 +4,8 @@ from typing import Any
 
 from pydantic import BaseModel
 
+from tplus.utils.construct import fast_construct, to_decimal
+
 
 class KlineUpdate(BaseModel):
     """Represents a single K-line (candlestick) update from the WebSocket stream."""
@@ -64,6 +66,25 @@ def parse_kline_update(data: list[dict[str, Any]]) -> list[KlineUpdate]:
         raise ValueError(f"Invalid KlineUpdate data received: {data}") from e
 
 
+def construct_kline_update(data: list[dict[str, Any]]) -> list[KlineUpdate]:
+    """Build KlineUpdate objects from a trusted stream payload without pydantic validation."""
+    return [
+        fast_construct(
+            KlineUpdate,
+            {
+                "open": to_decimal(item["open"]),
+                "high": to_decimal(item["high"]),
+                "low": to_decimal(item["low"]),
+                "close": to_decimal(item["close"]),
+                "volume": to_decimal(item["volume"]),
+                "open_timestamp_ns": item["open_timestamp_ns"],
+                "close_timestamp_ns": item["close_timestamp_ns"],
+            },
+        )
+        for item in data
+    ]
+
+
 def parse_klines_page(data: dict[str, Any] | list[dict[str, Any]]) -> KlinesPage:
     """Parse the `/klines` page envelope, tolerating a bare list from older servers."""
     if isinstance(data, list):
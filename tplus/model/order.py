@@ -5,11 +5,13 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, ValidationError, field_serializer
 
-from tplus.model.asset_identifier import AssetIdentifier
+from tplus.model.asset_identifier import AssetIdentifier, cached_asset_identifier
 from tplus.model.limit_order import LimitOrderDetails
 from tplus.model.market_order import MarketOrderDetails
 from tplus.model.order_trigger import OrderTrigger
 from tplus.model.types import UserPublicKey
+from tplus.utils.canonical import canonical_json
+from tplus.utils.construct import fast_construct
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +78,10 @@ class Order(BaseModel):
     def signable_part(self) -> str:
         return self.model_dump_json()
 
+    def signable_bytes(self) -> bytes:
+        """The exact bytes to sign; see :meth:`~tplus.utils.user.User.sign_bytes`."""
+        return canonical_json(self)
+
     @field_serializer("trigger")
     def serialize_trigger(self, trigger, _info):
         return None if trigger is None else trigger.model_dump()
@@ -291,6 +297,33 @@ def parse_order_event(data: dict[str, Any]) -> OrderEvent:
         raise
 
 
+def construct_order_event(data: dict[str, Any]) -> OrderEvent:
+    """
+    Fast-path counterpart of :func:`parse_order_event` for trusted streams.
+
+    Builds the event without validation, using cached asset identifiers
+    instead of running full pydantic validation. The nested order on
+    ``CREATED`` events is still validated so its details/trigger models are
+    well-formed. Only use it on payloads from a trusted server.
+    """
+    if len(data) != 1:
+        raise ValueError(f"Invalid order event structure: expected a single event key, got {data}")
+
+    event_type_key, payload = next(iter(data.items()))
+    event_type_upper = event_type_key.upper()
+    model_cls = _EVENT_TYPE_MODEL_MAP.get(event_type_upper)
+    if model_cls is None:
+        raise ValueError(f"Unknown order event type: {event_type_key}")
+
+    fields = {"event_type": event_type_upper, **payload}
+    if "asset_id" in fields:
+        fields["asset_id"] = cached_asset_identifier(fields["asset_id"])
+    if "user_order" in fields:
+        fields["user_order"] = Order.model_validate(fields["user_order"])
+
+    return fast_construct(model_cls, fields)  # type: ignore[return-value]
+
+
 # ---------------------------------------------------------------------------
 # HTTP response models for create/replace/cancel (mirror OMS endpoints)
 # ---------------------------------------------------------------------------
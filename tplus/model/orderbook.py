@@ -1,9 +1,21 @@
+from array import array
 from decimal import Decimal
-from typing import Any, Literal
+from operator import mul
+from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import BaseModel
 
 from tplus.model.asset_identifier import AssetIdentifier
+from tplus.utils.construct import fast_construct
+
+if TYPE_CHECKING:
+    import numpy as np
+
+DEFAULT_DEPTH_CAPACITY = 64
+
+# Below this magnitude a float product carries well under 1e-6 of rounding
+# error, so a product that close to an integer is that integer exactly.
+_FLOAT_SCALE_LIMIT = 2**31
 
 
 class OrderBook(BaseModel):
@@ -17,6 +29,213 @@ class OrderBookDiff(BaseModel):
     bids: list[list[float]]
     asks: list[list[float]]
     sequence_number: int
+    first_sequence_number: int | None = None  # Set when several diffs were merged
+
+
+def merge_orderbook_diffs(older: OrderBookDiff, newer: OrderBookDiff) -> OrderBookDiff:
+    """Merge two consecutive diffs into one covering both sequence ranges.
+
+    Levels from ``newer`` replace the same price levels from ``older``.
+    """
+
+    def _merge(old: list[list[float]], new: list[list[float]]) -> list[list[float]]:
+        levels = {price: quantity for price, quantity in old}
+        levels.update((price, quantity) for price, quantity in new)
+        return [[price, quantity] for price, quantity in levels.items()]
+
+    first = older.first_sequence_number
+    return fast_construct(
+        OrderBookDiff,
+        {
+            "bids": _merge(older.bids, newer.bids),
+            "asks": _merge(older.asks, newer.asks),
+            "sequence_number": newer.sequence_number,
+            "first_sequence_number": older.sequence_number if first is None else first,
+        },
+    )
+
+
+def construct_orderbook_diff(data: dict[str, Any]) -> OrderBookDiff:
+    """Build an :class:`OrderBookDiff` from a trusted stream payload without validation."""
+    return fast_construct(
+        OrderBookDiff,
+        {"bids": data["bids"], "asks": data["asks"], "sequence_number": data["sequence_number"]},
+    )
+
+
+def _to_scaled_int(value: Any, scale: int) -> int:
+    """Scale a JSON price/quantity to an integer number of ``1 / scale`` units."""
+    if isinstance(value, int):
+        return value * scale
+
+    if isinstance(value, float):
+        scaled = value * scale
+        if -_FLOAT_SCALE_LIMIT < scaled < _FLOAT_SCALE_LIMIT:
+            rounded = round(scaled)
+            if abs(scaled - rounded) < 1e-6:
+                return rounded
+
+        # Scale the shortest decimal form: ``1.1 * 10**18`` is off in the last digits.
+        value = repr(value)
+
+    return int((Decimal(value) * scale).to_integral_value())
+
+
+class _DepthSide:
+    """Preallocated ``int64`` price/quantity columns for one side of a book."""
+
+    __slots__ = ("prices", "quantities", "size")
+
+    def __init__(self, capacity: int) -> None:
+        self.prices = array("q", bytes(8 * capacity))
+        self.quantities = array("q", bytes(8 * capacity))
+        self.size = 0
+
+    def fill(self, levels: list, price_scale: int, quantity_scale: int) -> None:
+        count = len(levels)
+        if count > len(self.prices):
+            grow = bytes(8 * (count - len(self.prices)))
+            self.prices.frombytes(grow)
+            self.quantities.frombytes(grow)
+
+        prices, quantities = self.prices, self.quantities
+        try:
+            for idx, (price, quantity) in enumerate(levels):
+                prices[idx] = _to_scaled_int(price, price_scale)
+                quantities[idx] = _to_scaled_int(quantity, quantity_scale)
+        except OverflowError as err:
+            raise ValueError(
+                f"Level {levels[idx]} does not fit int64 at this scale; use fewer decimals."
+            ) from err
+
+        self.size = count
+
+
+class CompactDepth:
+    """Array-backed, integer-exact view of an order-book snapshot or diff.
+
+    Prices and quantities are stored as ``int64`` columns scaled by the book's
+    ``book_price_decimals`` / ``book_quantity_decimals``, so no per-level
+    Python lists or pydantic models are built. Columns are preallocated and
+    reused by :meth:`fill`, growing only when a payload has more levels than
+    the current capacity. Levels keep the order the server sent them in
+    (best first for snapshots).
+
+    Args:
+        price_decimals: Decimals used to scale prices to integers.
+        quantity_decimals: Decimals used to scale quantities to integers.
+        capacity: Number of levels per side to preallocate.
+    """
+
+    __slots__ = ("price_decimals", "quantity_decimals", "sequence_number", "_bids", "_asks")
+
+    def __init__(
+        self,
+        price_decimals: int,
+        quantity_decimals: int,
+        capacity: int = DEFAULT_DEPTH_CAPACITY,
+    ) -> None:
+        self.price_decimals = price_decimals
+        self.quantity_decimals = quantity_decimals
+        self.sequence_number = 0
+        self._bids = _DepthSide(capacity)
+        self._asks = _DepthSide(capacity)
+
+    @classmethod
+    def from_payload(
+        cls, data: dict[str, Any], price_decimals: int, quantity_decimals: int
+    ) -> "CompactDepth":
+        """Build a new instance from a decoded ``/marketdepth`` payload."""
+        levels = max(len(data.get("bids", ())), len(data.get("asks", ())))
+        depth = cls(price_decimals, quantity_decimals, capacity=max(levels, 1))
+        return depth.fill(data)
+
+    def fill(self, data: dict[str, Any]) -> "CompactDepth":
+        """Overwrite this instance in place from a decoded depth payload.
+
+        Accepts both snapshot (``OrderBook``) and diff (``OrderBookDiff``)
+        payloads. Use ``json.loads(raw, parse_float=Decimal)`` upstream for
+        exact scaling of prices with many significant digits.
+        """
+        price_scale = 10**self.price_decimals
+        quantity_scale = 10**self.quantity_decimals
+        self._bids.fill(data.get("bids", ()), price_scale, quantity_scale)
+        self._asks.fill(data.get("asks", ()), price_scale, quantity_scale)
+        self.sequence_number = int(data.get("sequence_number", 0))
+        return self
+
+    def _side(self, side: Literal["bids", "asks"]) -> _DepthSide:
+        if side == "bids":
+            return self._bids
+        elif side == "asks":
+            return self._asks
+
+        raise ValueError(f"Unknown book side: {side!r}")
+
+    def level_count(self, side: Literal["bids", "asks"]) -> int:
+        """Number of levels currently held on ``side``."""
+        return self._side(side).size
+
+    def top(self, side: Literal["bids", "asks"], n: int) -> list[tuple[int, int]]:
+        """The first ``n`` levels of ``side`` as scaled ``(price, quantity)`` pairs."""
+        book_side = self._side(side)
+        count = min(n, book_side.size)
+        return list(zip(book_side.prices[:count], book_side.quantities[:count], strict=True))
+
+    def vwap(self, side: Literal["bids", "asks"], quantity: int | None = None) -> Decimal | None:
+        """Volume-weighted average price to fill ``quantity`` against ``side``.
+
+        Args:
+            side: ``"asks"`` to price a buy, ``"bids"`` to price a sell.
+            quantity: Scaled quantity to fill. Defaults to the whole side.
+
+        Returns:
+            The unscaled VWAP as a :class:`Decimal`, or ``None`` if the side
+            is empty. If ``quantity`` exceeds the visible depth, the VWAP of
+            the full side is returned.
+        """
+        book_side = self._side(side)
+        size = book_side.size
+        if size == 0:
+            return None
+
+        # Exact integer arithmetic: at book scales ``price * quantity`` easily
+        # exceeds int64, so NumPy would overflow or fall back to float64.
+        prices = book_side.prices[:size]
+        quantities = book_side.quantities[:size]
+        if quantity is not None:
+            remaining = quantity
+            for idx, level in enumerate(quantities):
+                if level >= remaining:
+                    quantities = quantities[: idx + 1]
+                    prices = prices[: idx + 1]
+                    quantities[idx] = remaining
+                    break
+
+                remaining -= level
+
+        filled = sum(quantities)
+        if filled == 0:
+            return None
+
+        notional = sum(map(mul, prices, quantities))
+        return (Decimal(notional) / Decimal(filled)).scaleb(-self.price_decimals)
+
+    def as_numpy(self, side: Literal["bids", "asks"]) -> "tuple[np.ndarray, np.ndarray]":
+        """NumPy copies of the ``(prices, quantities)`` columns of ``side``.
+
+        Requires ``numpy`` (the ``numpy`` extra). The arrays are copies, so they
+        stay valid across later :meth:`fill` calls, which may have to grow the
+        buffers.
+        """
+        import numpy as np
+
+        book_side = self._side(side)
+        size = book_side.size
+        # Slicing copies, so NumPy never holds an export of the growable buffers.
+        prices = np.frombuffer(book_side.prices[:size], dtype=np.int64)
+        quantities = np.frombuffer(book_side.quantities[:size], dtype=np.int64)
+        return prices, quantities
 
 
 # Model for individual Price Level Updates (Potentially for a different stream?)
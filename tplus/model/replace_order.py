@@ -4,6 +4,7 @@ from pydantic import BaseModel, model_serializer
 
 from tplus.model.asset_identifier import AssetIdentifier
 from tplus.model.order_trigger import TriggerAbove, TriggerBelow
+from tplus.utils.canonical import canonical_json
 
 
 class ReplaceOrderDetails(BaseModel):
@@ -22,6 +23,10 @@ class ReplaceOrderDetails(BaseModel):
     # If specific fields must be present even if null, they don't need exclude_none.
     # If fields should be omitted if None, model_dump(exclude_none=True) is used by caller.
 
+    def signable_bytes(self) -> bytes:
+        """The exact bytes to sign; see :meth:`~tplus.utils.user.User.sign_bytes`."""
+        return canonical_json(self)
+
 
 class ReplaceOrderRequestPayload(BaseModel):
     """
@@ -7,6 +7,7 @@ from pydantic import BaseModel, field_serializer
 
 from tplus.model.asset_identifier import Address32, AssetAddress
 from tplus.model.types import ChainID, UserPublicKey
+from tplus.utils.canonical import SIGNING_WHITESPACE, canonical_json
 from tplus.utils.decimals import to_inventory_decimals
 from tplus.utils.hex import str_to_vec
 
@@ -135,6 +136,19 @@ class InnerSettlementRequest(BaseSettlement):
         )
 
     def signing_payload(self) -> str:
+        return (
+            json.dumps(self._signing_fields(), separators=(",", ":"))
+            .replace(" ", "")
+            .replace("\n", "")
+            .replace("\t", "")
+        )
+
+    def signing_bytes(self) -> bytes:
+        """The exact bytes to sign; see :meth:`~tplus.utils.user.User.sign_bytes`."""
+        payload = json.dumps(self._signing_fields(), separators=(",", ":")).encode("utf-8")
+        return payload.translate(None, SIGNING_WHITESPACE + b"\t")
+
+    def _signing_fields(self) -> dict:
         base_data = self.model_dump(mode="json", exclude_none=True)
 
         user = base_data.pop("tplus_user")
@@ -156,13 +170,7 @@ class InnerSettlementRequest(BaseSettlement):
         payload["chain_id"] = chain_id
         payload["expires_at"] = expires_at
         payload["mm_pubkey"] = mm_pubkey
-
-        return (
-            json.dumps(payload, separators=(",", ":"))
-            .replace(" ", "")
-            .replace("\n", "")
-            .replace("\t", "")
-        )
+        return payload
 
 
 class InnerMakerOrderAttachment(BaseModel):
@@ -234,9 +242,7 @@ class TxSettlementRequest(BaseModel):
 
             inner = InnerSettlementRequest.model_validate(inner)
 
-        signing_payload = inner.signing_payload()
-
-        signature = str_to_vec(signer.sign(signing_payload).hex())
+        signature = str_to_vec(signer.sign_bytes(inner.signing_bytes()).hex())
         return cls(inner=inner, signature=signature)
 
     @classmethod
@@ -272,7 +278,7 @@ class TxSettlementRequest(BaseModel):
                 "the CE will reject this as MmPubkeyMismatch."
             )
 
-        signature = str_to_vec(signer.sign(inner.signing_payload()).hex())
+        signature = str_to_vec(signer.sign_bytes(inner.signing_bytes()).hex())
         return cls(inner=inner, signature=signature, maker_order=maker_order)
 
     def signing_payload(self) -> str:
@@ -304,7 +310,7 @@ class BatchSettlementRequest(BaseModel):
     def create_signed(
         cls, inner: "InnerBatchSettlementRequest", signer: "User"
     ) -> "BatchSettlementRequest":
-        signature = str_to_vec(signer.sign(inner.signing_payload()).hex())
+        signature = str_to_vec(signer.sign_bytes(inner.signing_bytes()).hex())
         return cls(inner=inner, signature=signature)
 
     def signing_payload(self) -> str:
@@ -353,3 +359,7 @@ class InnerBatchSettlementRequest(BaseModel):
             .replace("\r", "")
             .replace("\n", "")
         )
+
+    def signing_bytes(self) -> bytes:
+        """The exact bytes to sign; see :meth:`~tplus.utils.user.User.sign_bytes`."""
+        return canonical_json(self, exclude_none=True)
@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+
+
+class StreamResynced(BaseModel):
+    """
+    Yielded by a managed (auto-reconnecting) stream right after it reconnects.
+
+    Messages sent while the socket was down are lost, so any state built from
+    the stream (order books, open orders, positions) may be stale and should be
+    re-fetched.
+    """
+
+    path: str
+    """The stream path that reconnected."""
+
+    attempts: int
+    """Number of connection attempts it took to reconnect."""
+
+
+class StreamLagged(BaseModel):
+    """
+    Yielded by a :class:`~tplus.client.multiplex.StreamMultiplexer` subscription
+    when it fell behind and its oldest buffered messages were dropped.
+    """
+
+    dropped: int
+    """Number of messages dropped since the last delivered one."""
@@ -3,7 +3,8 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
-from tplus.model.asset_identifier import AssetIdentifier
+from tplus.model.asset_identifier import AssetIdentifier, cached_asset_identifier
+from tplus.utils.construct import fast_construct, to_decimal
 
 
 class Trade(BaseModel):
@@ -177,3 +178,47 @@ def parse_trade_event(data: dict[str, Any]) -> TradeEvent:
 
     except (KeyError, ValueError, TypeError) as e:
         raise ValueError(f"Invalid data for trade event type {event_type}: {data}") from e
+
+
+_TRADE_EVENT_MODELS: dict[str, type[BaseTradeEvent]] = {
+    "Pending": TradePendingEvent,
+    "Confirmed": TradeConfirmedEvent,
+    "Rollbacked": TradeRollbackedEvent,
+}
+
+
+def construct_trade(item: dict[str, Any]) -> Trade:
+    """Build a :class:`Trade` from a trusted stream payload without pydantic validation."""
+    return fast_construct(
+        Trade,
+        {
+            "asset_id": cached_asset_identifier(item["asset_id"]),
+            "trade_id": item["trade_id"],
+            "order_id": item.get("order_id", ""),
+            "price": to_decimal(item["price"]),
+            "quantity": to_decimal(item["quantity"]),
+            "timestamp_ns": item["timestamp_ns"],
+            "buyer_is_maker": item["buyer_is_maker"],
+            "status": item.get("status", "Confirmed"),
+        },
+    )
+
+
+def construct_trade_event(data: dict[str, Any]) -> TradeEvent:
+    """
+    Fast-path counterpart of :func:`parse_trade_event` for trusted streams.
+
+    Skips pydantic validation and reuses cached asset identifiers. Only use
+    it on payloads from a trusted server; malformed input surfaces as
+    ``KeyError`` or ``ValueError`` rather than a validation error.
+    """
+    if len(data) != 1:
+        raise ValueError(f"Invalid trade event structure: {data}")
+
+    event_type, payload = next(iter(data.items()))
+    if (model_cls := _TRADE_EVENT_MODELS.get(event_type)) is None:
+        raise ValueError(f"Invalid trade event structure: {data}")
+
+    return fast_construct(  # type: ignore[return-value]
+        model_cls, {"event_type": event_type, "trade": construct_trade(payload)}
+    )
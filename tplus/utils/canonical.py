@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+# T+ verifies signatures over compact JSON with these bytes removed.
+SIGNING_WHITESPACE = b" \r\n"
+
+
+def canonical_json(model: BaseModel, *, exclude_none: bool = False) -> bytes:
+    """
+    Serialize ``model`` straight to the compact UTF-8 JSON bytes T+ signs.
+
+    Byte-for-byte equal to stripping ``model.model_dump_json()`` and encoding
+    it, without the intermediate ``str`` copies.
+    """
+    raw = model.__pydantic_serializer__.to_json(model, exclude_none=exclude_none)
+    return raw.translate(None, SIGNING_WHITESPACE)
@@ -0,0 +1,38 @@
+from decimal import Decimal
+from functools import cache
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@cache
+def _static_defaults(model_cls: type[BaseModel]) -> dict[str, Any]:
+    return {
+        name: field.default
+        for name, field in model_cls.model_fields.items()
+        if not field.is_required() and field.default_factory is None
+    }
+
+
+def fast_construct(model_cls: type[ModelT], values: dict[str, Any]) -> ModelT:
+    """
+    Instantiate ``model_cls`` from trusted, already-typed ``values`` without validation.
+
+    A leaner ``BaseModel.model_construct`` for hot stream-parsing paths: static
+    field defaults are resolved once per class and the instance state is set
+    directly. Fields with a ``default_factory`` must be supplied by the caller.
+    """
+    instance = model_cls.__new__(model_cls)
+    object.__setattr__(instance, "__dict__", {**_static_defaults(model_cls), **values})
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def to_decimal(value: Any) -> Decimal:
+    """A :class:`Decimal` from a JSON number or numeric string, going through
+    ``str`` for floats so ``0.1`` stays ``Decimal("0.1")``."""
+    return Decimal(value) if isinstance(value, str | int) else Decimal(str(value))
@@ -0,0 +1,149 @@
+"""
+Pluggable JSON encoding/decoding for HTTP bodies and WebSocket frames.
+
+``orjson`` and ``msgspec`` are used when installed and fall back to the
+standard library otherwise. Both fast libraries are limited to 64-bit
+integers (``orjson`` silently decodes larger ones as floats), so documents
+containing a run of 20+ digits -- e.g. ``u128`` amounts -- are always routed
+through the standard library to keep them exact.
+"""
+
+import importlib.util
+import json
+import re
+from typing import Any, Literal
+
+JsonCodecName = Literal["auto", "orjson", "msgspec", "json"]
+
+# u64::MAX has 20 digits; anything this long may not fit in 64 bits.
+_WIDE_INT_BYTES = re.compile(rb"\d{20}")
+_WIDE_INT_STR = re.compile(r"\d{20}")
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _has_wide_int(data: bytes | str) -> bool:
+    if isinstance(data, str):
+        return _WIDE_INT_STR.search(data) is not None
+
+    return _WIDE_INT_BYTES.search(data) is not None
+
+
+class JsonCodec:
+    """
+    Standard-library JSON codec; the base for the accelerated codecs.
+
+    Decode failures always raise :class:`json.JSONDecodeError` regardless of
+    the backend, so callers only need to handle one exception type.
+    """
+
+    name = "json"
+
+    def encode(self, obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON bytes (HTTP bodies)."""
+        return _stdlib_dumps(obj).encode("utf-8")
+
+    def dumps(self, obj: Any) -> str:
+        """Serialize ``obj`` to a compact JSON string (WebSocket text frames)."""
+        return _stdlib_dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        """Deserialize a JSON document."""
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec backed by ``orjson``."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._option = orjson.OPT_NON_STR_KEYS
+
+    def encode(self, obj: Any) -> bytes:
+        try:
+            return self._orjson.dumps(obj, option=self._option)
+        except TypeError:
+            # Integers wider than 64 bits (or types orjson does not know).
+            return super().encode(obj)
+
+    def dumps(self, obj: Any) -> str:
+        return self.encode(obj).decode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        if _has_wide_int(data):
+            return super().loads(data)
+
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec backed by ``msgspec``."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec  # type: ignore[import-not-found]
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, obj: Any) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except (TypeError, OverflowError, self._msgspec.EncodeError):
+            return super().encode(obj)
+
+    def dumps(self, obj: Any) -> str:
+        return self.encode(obj).decode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        if _has_wide_int(data):
+            return super().loads(data)
+
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as err:
+            doc = data if isinstance(data, str) else data.decode("utf-8", errors="replace")
+            raise json.JSONDecodeError(str(err), doc, 0) from err
+
+
+_CODECS: dict[str, type[JsonCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": JsonCodec,
+}
+
+
+def get_json_codec(name: JsonCodecName = "auto") -> JsonCodec:
+    """
+    Return a JSON codec by name.
+
+    Args:
+        name: ``"orjson"``, ``"msgspec"`` or ``"json"`` (standard library).
+            ``"auto"`` picks the fastest installed backend, in that order.
+
+    Raises:
+        ValueError: If ``name`` is unknown.
+        ImportError: If the requested backend is not installed.
+    """
+    if name == "auto":
+        for candidate in ("orjson", "msgspec"):
+            if importlib.util.find_spec(candidate) is not None:
+                return _CODECS[candidate]()
+
+        return JsonCodec()
+
+    if (codec_cls := _CODECS.get(name)) is None:
+        raise ValueError(f"Unknown JSON codec: {name!r}")
+
+    return codec_cls()
@@ -1,6 +1,17 @@
 import time
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Any
+
+from cryptography.hazmat.primitives.serialization import (  # type: ignore
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+)
 
 from tplus.model.asset_identifier import AssetIdentifier
+from tplus.model.batch_order import BatchCreateOrderRequest
 from tplus.model.limit_order import GTC, GTD, IOC, LimitOrderDetails
 from tplus.model.order import CreateOrderRequest, Order, Side, TradeTarget
 from tplus.model.order_trigger import OrderTrigger
@@ -46,14 +57,69 @@ def create_limit_order_ob_request_payload(
         reduce_only=reduce_only,
         max_trading_fees_rate=(50000 if max_trading_fees_rate is None else max_trading_fees_rate),
     )
-    sign_payload_json = order.signable_part()
-    signature_bytes = signer.sign(sign_payload_json)
+    signature_bytes = signer.sign_bytes(order.signable_bytes())
 
     return CreateOrderRequest(
         order=order, signature=list(signature_bytes), post_sign_timestamp=time.time_ns()
     )
 
 
+def create_limit_order_batch_payload(
+    orders: Sequence[dict[str, Any]],
+    signer: User,
+    *,
+    executor: Executor | None = None,
+    chunk_size: int = 50,
+) -> BatchCreateOrderRequest:
+    """Build and sign many limit orders as one :class:`BatchCreateOrderRequest`.
+
+    Args:
+        orders: Keyword arguments for :func:`create_limit_order_ob_request_payload`
+            per order, without ``signer``.
+        signer: The user signing every order.
+        executor: Optional executor to sign chunks of orders on. With a
+            ``ProcessPoolExecutor`` each worker rebuilds the private key
+            (keeping only the most recent one), so signing runs truly in
+            parallel. Signers whose key is not unlocked (e.g. an ``AgentUser``
+            signing through the agent) sign sequentially instead of unlocking
+            it for the workers.
+        chunk_size: Orders per executor task.
+
+    Returns:
+        The batch, with orders in input order.
+    """
+    if executor is None or (isinstance(executor, ProcessPoolExecutor) and not signer.is_unlocked):
+        return BatchCreateOrderRequest(orders=_sign_limit_orders(signer, orders))
+
+    if isinstance(executor, ProcessPoolExecutor):
+        # Key objects cannot be pickled; ship the raw seed instead.
+        seed = signer.sk.private_bytes(Encoding.Raw, PrivateFormat.Raw, NoEncryption())
+        sign_chunk = partial(_sign_limit_orders_with_seed, seed)
+    else:
+        sign_chunk = partial(_sign_limit_orders, signer)
+
+    chunks = [orders[idx : idx + chunk_size] for idx in range(0, len(orders), chunk_size)]
+    signed = [request for chunk in executor.map(sign_chunk, chunks) for request in chunk]
+    return BatchCreateOrderRequest(orders=signed)
+
+
+def _sign_limit_orders(signer: User, orders: Sequence[dict[str, Any]]) -> list[CreateOrderRequest]:
+    return [create_limit_order_ob_request_payload(signer=signer, **order) for order in orders]
+
+
+# One signer per worker: a batch reuses it across chunks, and a worker never
+# holds more than the most recent key.
+@lru_cache(maxsize=1)
+def _cached_signer(seed: bytes) -> User:
+    return User(seed)
+
+
+def _sign_limit_orders_with_seed(
+    seed: bytes, orders: Sequence[dict[str, Any]]
+) -> list[CreateOrderRequest]:
+    return _sign_limit_orders(_cached_signer(seed), orders)
+
+
 if __name__ == "__main__":
     order = create_limit_order_ob_request_payload(
         100, 50000, "Buy", User(), 3, 3, AssetIdentifier(root="200"), "zrhgiuzegf"
@@ -49,8 +49,7 @@ def create_market_order_ob_request_payload(
         max_trading_fees_rate=(50000 if max_trading_fees_rate is None else max_trading_fees_rate),
     )
 
-    sign_payload_json = order.signable_part()
-    signature_bytes = signer.sign(sign_payload_json)
+    signature_bytes = signer.sign_bytes(order.signable_bytes())
 
     return CreateOrderRequest(
         order=order, signature=list(signature_bytes), post_sign_timestamp=time.time_ns()
@@ -0,0 +1,212 @@
+import base64
+import time
+import uuid
+from collections import deque
+from operator import index
+
+from pydantic_core import to_json
+
+from tplus.model.asset_identifier import AssetIdentifier
+from tplus.model.limit_order import GTC, GTD, IOC, LimitOrderDetails
+from tplus.model.order import CreateOrderRequest, Order, Side, TradeTarget
+from tplus.utils.canonical import SIGNING_WHITESPACE
+from tplus.utils.user import User
+
+DEFAULT_ORDER_ID_POOL_SIZE = 1_024
+
+# Placeholders serialized into the prototype order and later cut out of it.
+_ORDER_ID = "__tplus_order_id__"
+_PRICE = 1_000_000_000_000_000_001
+_QUANTITY = 1_000_000_000_000_000_002
+_TIMESTAMP = 1_000_000_000_000_000_003
+
+
+def new_order_id() -> str:
+    """A fresh base64-encoded UUID4 order id, as generated by the order builders."""
+    return base64.b64encode(uuid.uuid4().bytes).decode("ascii")
+
+
+class OrderIdPool:
+    """
+    A pool of pregenerated order ids, refilled in bulk when it runs dry.
+
+    Args:
+        size: Number of ids generated per refill.
+    """
+
+    def __init__(self, size: int = DEFAULT_ORDER_ID_POOL_SIZE):
+        self.size = size
+        self._ids: deque[str] = deque()
+        self.refill()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def refill(self) -> None:
+        """Top the pool back up to ``size`` ids, e.g. while the strategy is idle."""
+        self._ids.extend(new_order_id() for _ in range(self.size - len(self._ids)))
+
+    def take(self) -> str:
+        """Remove and return an unused order id."""
+        if not self._ids:
+            self.refill()
+
+        return self._ids.popleft()
+
+
+class SignedQuote:
+    """
+    A signed limit order produced by :meth:`QuoteTemplate.build`, kept as JSON bytes.
+    """
+
+    __slots__ = ("asset_id", "order_id", "order_json", "signature", "post_sign_timestamp")
+
+    def __init__(
+        self,
+        asset_id: str,
+        order_id: str,
+        order_json: bytes,
+        signature: bytes,
+        post_sign_timestamp: int,
+    ):
+        self.asset_id = asset_id
+        self.order_id = order_id
+        self.order_json = order_json
+        self.signature = signature
+        self.post_sign_timestamp = post_sign_timestamp
+
+    def __repr__(self) -> str:
+        return f"<SignedQuote {self.order_id} {self.asset_id}>"
+
+    def request_json(self) -> bytes:
+        """The ``CreateOrderRequest`` as JSON bytes (HTTP body)."""
+        signature = ",".join(map(str, self.signature)).encode()
+        return b"".join(
+            (
+                b'{"order":',
+                self.order_json,
+                b',"signature":[',
+                signature,
+                b'],"post_sign_timestamp":%d}' % self.post_sign_timestamp,
+            )
+        )
+
+    def control_frame(self) -> str:
+        """The ``/control`` WebSocket frame creating this order."""
+        return f'{{"CreateOrderRequest":{self.request_json().decode()}}}'
+
+    def to_request(self) -> CreateOrderRequest:
+        """Parse into a :class:`CreateOrderRequest` model (slow path)."""
+        return CreateOrderRequest.model_validate_json(self.request_json())
+
+
+class QuoteTemplate:
+    """
+    Builds signed limit orders for one market and side, filling in only the
+    price, quantity, order id and timestamp.
+
+    Every other field is serialized once, up front, into static JSON fragments.
+    The bytes produced are identical to signing a full :class:`Order` model.
+
+    Args:
+        signer: The user signing the orders.
+        asset_id: The market's base asset.
+        side: ``"Buy"`` or ``"Sell"``.
+        book_price_decimals: The market's price decimals.
+        book_quantity_decimals: The market's quantity decimals.
+        time_in_force: Defaults to GTC (not post-only), like ``create_limit_order``.
+        target: Defaults to the margin account spending spot balance.
+        max_trading_fees_rate: Defaults to ``50000``.
+        reduce_only: Whether the orders may only reduce a position.
+        order_ids: Pool to draw order ids from. A private pool is created if omitted.
+    """
+
+    def __init__(
+        self,
+        signer: User,
+        asset_id: AssetIdentifier | str,
+        side: str,
+        book_price_decimals: int,
+        book_quantity_decimals: int,
+        *,
+        time_in_force: GTC | GTD | IOC | None = None,
+        target: TradeTarget | None = None,
+        max_trading_fees_rate: int | None = None,
+        reduce_only: bool = False,
+        order_ids: OrderIdPool | None = None,
+    ):
+        self.signer = signer
+        self.asset_id = AssetIdentifier(asset_id) if isinstance(asset_id, str) else asset_id
+        self.side = Side.SELL if side.lower() == "sell" else Side.BUY
+        self.order_ids = order_ids if order_ids is not None else OrderIdPool()
+
+        prototype = Order(
+            signer=signer.public_key,
+            order_id=_ORDER_ID,
+            base_asset=self.asset_id,
+            book_quantity_decimals=book_quantity_decimals,
+            book_price_decimals=book_price_decimals,
+            details=LimitOrderDetails(
+                quantity=_QUANTITY,
+                limit_price=_PRICE,
+                time_in_force=GTC(post_only=False) if time_in_force is None else time_in_force,
+            ),
+            side=self.side,
+            creation_timestamp_ns=_TIMESTAMP,
+            target=TradeTarget.margin_account_spot_trade() if target is None else target,
+            reduce_only=reduce_only,
+            max_trading_fees_rate=50000 if max_trading_fees_rate is None else max_trading_fees_rate,
+        )
+        raw = prototype.signable_bytes()
+        placeholders = {
+            "order_id": to_json(_ORDER_ID),
+            "price": b"%d" % _PRICE,
+            "quantity": b"%d" % _QUANTITY,
+            "timestamp": b"%d" % _TIMESTAMP,
+        }
+        found = []
+        for name, token in placeholders.items():
+            if raw.count(token) != 1:
+                raise ValueError(f"Cannot template order field {name!r}.")
+
+            found.append((raw.index(token), name, token))
+
+        self._fragments: list[bytes] = []
+        self._slots: list[str] = []
+        cursor = 0
+        for position, name, token in sorted(found):
+            self._fragments.append(raw[cursor:position])
+            self._slots.append(name)
+            cursor = position + len(token)
+
+        self._fragments.append(raw[cursor:])
+
+    def build(self, price: int, quantity: int, *, order_id: str | None = None) -> SignedQuote:
+        """
+        Build and sign a limit order.
+
+        Args:
+            price: Limit price in the book's quote-asset units.
+            quantity: Quantity in the book's base-asset units.
+            order_id: Optional caller-supplied order id; drawn from the pool otherwise.
+        """
+        if order_id is None:
+            order_id = self.order_ids.take()
+        elif order_id.encode().translate(None, SIGNING_WHITESPACE) != order_id.encode():
+            raise ValueError("Templated order ids cannot contain whitespace.")
+
+        values = {
+            "order_id": to_json(order_id),
+            "price": b"%d" % index(price),
+            "quantity": b"%d" % index(quantity),
+            "timestamp": b"%d" % time.time_ns(),
+        }
+        fragments = self._fragments
+        parts = [fragments[0]]
+        for idx, name in enumerate(self._slots, start=1):
+            parts.append(values[name])
+            parts.append(fragments[idx])
+
+        order_json = b"".join(parts)
+        signature = self.signer.sign_bytes(order_json)
+        return SignedQuote(str(self.asset_id), order_id, order_json, signature, time.time_ns())
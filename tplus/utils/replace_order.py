@@ -37,17 +37,7 @@ def create_replace_order_ob_request_payload(
 
     # Sign the ReplaceOrderDetails part
     # The Rust equivalent is ReplaceOrder::signable_part -> serde_json::to_string without spaces
-    sign_payload_json = replace_details.model_dump_json(
-        exclude_none=False
-    )  # Ensure compact like server
-
-    # Server does: payload.replace(" ", "").replace("\r", "").replace("\n", "") before signing
-    # Pydantic's model_dump_json might not be compact enough by default for perfect match.
-    # For exactness with Rust's specific string replacement for signing:
-    compact_sign_payload_json = (
-        sign_payload_json.replace(" ", "").replace("\r", "").replace("\n", "")
-    )
-    signature_bytes = signer.sign(compact_sign_payload_json)
+    signature_bytes = signer.sign_bytes(replace_details.signable_bytes())
 
     return ReplaceOrderRequestPayload(
         request=replace_details,
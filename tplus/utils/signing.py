@@ -18,11 +18,7 @@ def create_cancel_order_ob_request_payload(
     This now only includes the order_id, matching the Rust struct.
     """
     cancel = CancelOrder(order_id=order_id, asset_id=asset_identifier, signer=signer.public_key)
-    sign_payload_json = cancel.model_dump_json()
-    compact_sign_payload_json = (
-        sign_payload_json.replace(" ", "").replace("\r", "").replace("\n", "")
-    )
-    signature_bytes = signer.sign(compact_sign_payload_json)
+    signature_bytes = signer.sign_bytes(cancel.signable_bytes())
     return CancelOrderRequest(
         cancel=cancel, signature=list(signature_bytes), post_sign_timestamp=time.time_ns()
     )
@@ -1,5 +1,5 @@
 from tplus.utils.user.manager import UserManager
-from tplus.utils.user.model import LocalUser, User
+from tplus.utils.user.model import AgentUser, LocalUser, User
 
 
 def load_user(name: str | None = None, password: str | None = None) -> User:
@@ -29,4 +29,4 @@ def load_user(name: str | None = None, password: str | None = None) -> User:
     raise ValueError("No default user; please add a user.")
 
 
-__all__ = ("LocalUser", "User", "UserManager", "load_user")
+__all__ = ("AgentUser", "LocalUser", "User", "UserManager", "load_user")
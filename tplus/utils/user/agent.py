@@ -0,0 +1,206 @@
+"""Optional local session agent that keeps unlocked keys and auth tokens in memory.
+
+Run ``tplus agent start`` once; like ``ssh-agent``, it then signs for users
+whose keys it holds, so later ``tplus`` invocations neither unlock the keyfile
+(262,144 PBKDF2 iterations) nor decrypt the token cache. Keys never leave the
+agent. The socket is only accessible to the current OS user, and keys are
+dropped after ``key_ttl`` seconds.
+
+Every client function returns ``None`` (or does nothing) when no agent is
+running, so callers can always try the agent first.
+"""
+
+import asyncio
+import contextlib
+import json
+import os
+import socket
+import time
+from pathlib import Path
+from typing import Any
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey  # type: ignore
+from cryptography.hazmat.primitives.serialization import (  # type: ignore
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+    PublicFormat,
+)
+
+AGENT_SOCKET_ENV_VAR = "TPLUS_AGENT_SOCK"
+DEFAULT_AGENT_SOCKET = Path.home() / ".tplus" / "agent.sock"
+DEFAULT_KEY_TTL = 8 * 3600.0
+_CLIENT_TIMEOUT = 1.0
+_MAX_MESSAGE = 64 * 1024
+
+
+def socket_path() -> Path:
+    """The agent's socket: ``$TPLUS_AGENT_SOCK`` or ``~/.tplus/agent.sock``."""
+    if path := os.environ.get(AGENT_SOCKET_ENV_VAR):
+        return Path(path)
+
+    return DEFAULT_AGENT_SOCKET
+
+
+class SessionAgent:
+    """
+    The agent daemon. :meth:`serve` answers one JSON request per line on a
+    unix socket; :meth:`handle` holds the protocol.
+
+    Args:
+        path: The socket path. Defaults to :func:`socket_path`.
+        key_ttl: Seconds an unlocked key is kept.
+    """
+
+    def __init__(self, path: Path | None = None, *, key_ttl: float = DEFAULT_KEY_TTL):
+        self.path = path or socket_path()
+        self.key_ttl = key_ttl
+        self._keys: dict[str, tuple[Ed25519PrivateKey, float]] = {}
+        self._tokens: dict[str, dict[str, Any]] = {}
+        self._stopped = asyncio.Event()
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Answer one request. Unknown or expired entries answer ``{}``."""
+        op = request.get("op")
+        now = time.monotonic()
+        if op == "sign":
+            key, expires = self._keys.get(request["public_key"], (None, 0.0))
+            if key is None or expires <= now:
+                self._keys.pop(request["public_key"], None)
+                return {}
+
+            return {"signature": key.sign(bytes.fromhex(request["payload"])).hex()}
+
+        if op == "add_key":
+            key = Ed25519PrivateKey.from_private_bytes(bytes.fromhex(request["key"]))
+            public_key = key.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw).hex()
+            if public_key != request["public_key"]:
+                return {"error": "key does not match public key"}
+
+            self._keys[public_key] = (key, now + self.key_ttl)
+            return {"ok": True}
+
+        if op == "get_token":
+            token = self._tokens.get(request["id"])
+            return token if token and token["expiry_ns"] > time.time_ns() else {}
+
+        if op == "put_token":
+            fields = ("token", "expiry_ns", "issued_ns")
+            self._tokens[request["id"]] = {field: request[field] for field in fields}
+            return {"ok": True}
+
+        if op == "ping":
+            return {"ok": True, "keys": len(self._keys), "tokens": len(self._tokens)}
+
+        if op == "stop":
+            self._stopped.set()
+            return {"ok": True}
+
+        return {"error": f"unknown op {op!r}"}
+
+    async def serve(self) -> None:
+        """Listen on :attr:`path` until a ``stop`` request arrives."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.suppress(FileNotFoundError):
+            self.path.unlink()
+
+        # Create the socket owner-only from the start, not chmod'ed afterwards.
+        umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(self._on_client, path=str(self.path))
+        finally:
+            os.umask(umask)
+
+        try:
+            async with server:
+                await self._stopped.wait()
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                self.path.unlink()
+
+    async def _on_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while line := await reader.readline():
+                try:
+                    response = self.handle(json.loads(line))
+                except (ValueError, KeyError, TypeError) as err:
+                    response = {"error": str(err)}
+
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+def request(payload: dict[str, Any], path: Path | None = None) -> dict[str, Any] | None:
+    """
+    Send one request to the agent.
+
+    Returns:
+        The response, or ``None`` when no agent is reachable.
+    """
+    path = path or socket_path()
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(_CLIENT_TIMEOUT)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(payload).encode() + b"\n")
+            with sock.makefile("rb") as stream:
+                line = stream.readline(_MAX_MESSAGE)
+    except OSError:
+        return None
+
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def sign(public_key: str, payload: bytes, path: Path | None = None) -> bytes | None:
+    """
+    Have the agent sign ``payload`` as ``public_key``.
+
+    Returns:
+        The raw Ed25519 signature, or ``None`` if the agent does not hold the key.
+    """
+    response = request({"op": "sign", "public_key": public_key, "payload": payload.hex()}, path)
+    return bytes.fromhex(response["signature"]) if response and "signature" in response else None
+
+
+def add_key(key: Ed25519PrivateKey, path: Path | None = None) -> None:
+    """Hand an unlocked key to the agent, for :func:`sign`."""
+    public_key = key.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw).hex()
+    seed = key.private_bytes(Encoding.Raw, PrivateFormat.Raw, NoEncryption()).hex()
+    request({"op": "add_key", "public_key": public_key, "key": seed}, path)
+
+
+def get_token(pubkey: str, base_url: str, path: Path | None = None) -> tuple[str, int, int] | None:
+    """The ``(token, expiry_ns, issued_ns)`` held for ``pubkey`` at ``base_url``, if any."""
+    response = request({"op": "get_token", "id": f"{pubkey}@{base_url}"}, path)
+    if not response or "token" not in response:
+        return None
+
+    return response["token"], int(response["expiry_ns"]), int(response["issued_ns"])
+
+
+def put_token(
+    pubkey: str,
+    base_url: str,
+    token: str,
+    expiry_ns: int,
+    issued_ns: int,
+    path: Path | None = None,
+) -> None:
+    request(
+        {
+            "op": "put_token",
+            "id": f"{pubkey}@{base_url}",
+            "token": token,
+            "expiry_ns": expiry_ns,
+            "issued_ns": issued_ns,
+        },
+        path,
+    )
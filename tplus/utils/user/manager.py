@@ -12,7 +12,7 @@ from cryptography.hazmat.primitives.serialization import (  # type: ignore
 )
 
 from tplus.utils.user.ed_keyfile import decrypt_keyfile, encrypt_keyfile
-from tplus.utils.user.model import LocalUser, User
+from tplus.utils.user.model import AgentUser, LocalUser, User
 from tplus.utils.user.validate import privkey_to_bytes
 
 PUBKEY_SUFFIX = ".pub"
@@ -41,11 +41,16 @@ class UserManager:
     private-key file and a plaintext ``<name>.pub`` sidecar containing the
     hex public key, so listing and identifying users does not require
     decrypting them.
+
+    Args:
+        use_agent: Load users as :class:`AgentUser`, which sign through a
+            running session agent (see :mod:`tplus.utils.user.agent`), if any.
     """
 
-    def __init__(self):
+    def __init__(self, *, use_agent: bool = False):
         self._data_folder = Path.home() / ".tplus" / "users"
-        self._default_user = None
+        self._default_user: str | None = None
+        self._use_agent = use_agent
 
     @property
     def usernames(self) -> Iterator[str]:
@@ -124,7 +129,8 @@ class UserManager:
             return decrypt_keyfile(pw, f"{path}")
 
         if pubkey_path.is_file():
-            return LocalUser(public_key=pubkey_path.read_text().strip(), unlock=_unlock)
+            cls = AgentUser if self._use_agent else LocalUser
+            return cls(public_key=pubkey_path.read_text().strip(), unlock=_unlock)
 
         # Legacy keyfile with no pubkey sidecar — unlock once to derive it, then migrate.
         user = User(private_key=_unlock())
@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import Callable
 from functools import cached_property
 
@@ -8,7 +9,9 @@ from cryptography.hazmat.primitives.asymmetric.ed25519 import (  # type: ignore
 from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat  # type: ignore
 
 from tplus.model.types import UserPublicKey
+from tplus.utils.canonical import SIGNING_WHITESPACE
 from tplus.utils.hex import str_to_vec
+from tplus.utils.user import agent
 from tplus.utils.user.validate import privkey_to_bytes
 
 SEED_SIZE = 32
@@ -85,6 +88,11 @@ class User:
         """Active sub-account index. Defaults to the main sub-account."""
         return self._sub_account or MAIN_SUB_ACCOUNT
 
+    @property
+    def is_unlocked(self) -> bool:
+        """Whether the private key is held in memory, so reading :attr:`sk` is free."""
+        return True
+
     def pubkey(self) -> str:
         """Return the hex-encoded raw Ed25519 public key."""
         return self.vk.public_bytes(Encoding.Raw, PublicFormat.Raw).hex()
@@ -106,11 +114,32 @@ class User:
         Returns:
             The 64-byte raw Ed25519 signature.
         """
-        payload = payload.replace(" ", "")
-        payload = payload.replace("\r", "")
-        payload = payload.replace("\n", "")
-        payload_bytes = payload.encode("utf-8")
-        return self.sk.sign(payload_bytes)
+        return self.sign_bytes(payload.encode("utf-8").translate(None, SIGNING_WHITESPACE))
+
+    def sign_bytes(self, payload: bytes) -> bytes:
+        """Sign ``payload`` exactly as given.
+
+        Use with already-canonical bytes, such as ``Order.signable_bytes()``,
+        to skip the whitespace stripping done by :meth:`sign`.
+
+        Args:
+            payload: Bytes to sign.
+
+        Returns:
+            The 64-byte raw Ed25519 signature.
+        """
+        return self.sk.sign(payload)
+
+    async def asign(self, payload: str) -> bytes:
+        """Like :meth:`sign`, without blocking the event loop on a signing agent."""
+        return await self.asign_bytes(payload.encode("utf-8").translate(None, SIGNING_WHITESPACE))
+
+    async def asign_bytes(self, payload: bytes) -> bytes:
+        """Like :meth:`sign_bytes`, without blocking the event loop on a signing agent.
+
+        Signing with an in-memory key is fast and done in place.
+        """
+        return self.sign_bytes(payload)
 
 
 class LocalUser(User):
@@ -152,3 +181,49 @@ class LocalUser(User):
             self._sk = sk
 
         return self._sk
+
+    @property
+    def is_unlocked(self) -> bool:
+        return self._sk is not None
+
+
+class AgentUser(LocalUser):
+    """A :class:`LocalUser` that signs through the session agent
+    (see :mod:`tplus.utils.user.agent`), like an ``ssh-agent`` client.
+
+    While the agent holds the key, signing never unlocks the keyfile. When it
+    does not (no agent running, or the key expired there), the keyfile is
+    unlocked locally as usual, the key is handed to the agent for later
+    processes, and this instance signs locally from then on.
+
+    Each signature through the agent is a blocking unix-socket round trip
+    (normally well under a millisecond, up to a 1 s timeout if the agent
+    hangs). From async code, use :meth:`asign` / :meth:`asign_bytes`, which
+    run it in a worker thread; for many signatures in a hot path, an unlocked
+    key is cheaper.
+
+    Args:
+        public_key: Hex-encoded Ed25519 public key, raw bytes, or an
+            existing :class:`Ed25519PublicKey`.
+        unlock: Callable returning the raw private key when invoked.
+        sub_account: Optional sub-account index.
+    """
+
+    def sign_bytes(self, payload: bytes) -> bytes:
+        if self._sk is None and (signature := agent.sign(self.public_key, payload)) is not None:
+            return signature
+
+        return super().sign_bytes(payload)
+
+    async def asign_bytes(self, payload: bytes) -> bytes:
+        if self._sk is not None:
+            return super().sign_bytes(payload)
+
+        return await asyncio.to_thread(self.sign_bytes, payload)
+
+    @property
+    def sk(self) -> Ed25519PrivateKey:  # type: ignore[override]
+        if self._sk is None:
+            agent.add_key(super().sk)
+
+        return super().sk
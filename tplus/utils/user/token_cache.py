@@ -2,13 +2,20 @@
 
 Mirrors the keyfile envelope but with a cheaper KDF — a leaked cache file gives
 at most one token-TTL of access, never the underlying signing key.
+
+The cache is shared by every process using the same directory: refreshes are
+serialized with a :class:`FileLock` next to the cache file, so one process
+performs the handshake and the others pick up its token.
 """
 
 import json
 import os
+import sys
 from base64 import b64decode, b64encode
+from functools import lru_cache
 from hashlib import pbkdf2_hmac, sha3_256, sha256
 from pathlib import Path
+from typing import IO
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
@@ -19,24 +26,36 @@ VERSION = 1
 _KDF_ITERS = 10_000
 
 
+# Derived keys are kept for the life of the process, keyed by salt (and
+# password), so loading the same cache file again skips the KDF.
+@lru_cache(maxsize=64)
 def _derive(password: str, salt: bytes) -> bytes:
     return pbkdf2_hmac("sha256", password.encode("utf-8"), salt, _KDF_ITERS, dklen=32)
 
 
+@lru_cache(maxsize=8)
+def _encryption_key(password: str) -> tuple[bytes, bytes]:
+    # One salt per process and password: every save reuses the derived key
+    # (each message still gets a fresh IV).
+    salt = os.urandom(16)
+    return salt, _derive(password, salt)
+
+
 def _mac(key: bytes, iv: bytes, ct: bytes) -> bytes:
     h = sha3_256()
     h.update(key[16:32] + iv + ct)
     return h.digest()
 
 
-def encrypt(token: str, expiry_ns: int, base_url: str, password: str) -> dict:
-    salt = os.urandom(16)
+def encrypt(
+    token: str, expiry_ns: int, base_url: str, password: str, issued_ns: int | None = None
+) -> dict:
+    salt, key = _encryption_key(password)
     iv = os.urandom(16)
-    key = _derive(password, salt)
     cipher = Cipher(algorithms.AES(key[:16]), modes.CTR(iv), backend=default_backend())
     enc = cipher.encryptor()
     ct = enc.update(token.encode("utf-8")) + enc.finalize()
-    return {
+    blob = {
         "version": VERSION,
         "base_url": base_url,
         "expiry_ns": expiry_ns,
@@ -54,6 +73,10 @@ def encrypt(token: str, expiry_ns: int, base_url: str, password: str) -> dict:
             "mac": b64encode(_mac(key, iv, ct)).decode(),
         },
     }
+    if issued_ns is not None:
+        blob["issued_ns"] = issued_ns
+
+    return blob
 
 
 def decrypt(blob: dict, password: str) -> str:
@@ -78,9 +101,14 @@ def cache_path(cache_dir: Path, pubkey: str, base_url: str) -> Path:
     return cache_dir / f"{pubkey}-{host}.json"
 
 
+def lock_path(path: Path) -> Path:
+    return path.with_suffix(path.suffix + ".lock")
+
+
 def write_atomic(path: Path, blob: dict) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
+    # Per-process temp file, so concurrent writers never clobber each other's.
+    tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
     tmp.write_text(json.dumps(blob))
     os.chmod(tmp, 0o600)
     tmp.replace(path)
@@ -88,3 +116,61 @@ def write_atomic(path: Path, blob: dict) -> None:
 
 def resolve_cache_password() -> str | None:
     return os.environ.get(PASSWORD_ENV_VAR)
+
+
+class FileLock:
+    """
+    A non-blocking, cross-process exclusive lock on ``path`` (``flock`` on
+    POSIX, ``msvcrt.locking`` on Windows). The OS releases it if the holder dies.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file: IO[bytes] | None = None
+
+    def try_acquire(self) -> bool:
+        """Take the lock if it is free; never blocks."""
+        if self._file is not None:
+            return True
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file = self.path.open("a+b")
+        try:
+            _lock(file)
+        except OSError:
+            file.close()
+            return False
+
+        self._file = file
+        return True
+
+    def release(self) -> None:
+        if self._file is None:
+            return
+
+        try:
+            _unlock(self._file)
+        finally:
+            self._file.close()
+            self._file = None
+
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock(file: IO[bytes]) -> None:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+
+    def _unlock(file: IO[bytes]) -> None:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock(file: IO[bytes]) -> None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def _unlock(file: IO[bytes]) -> None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)